@@ -36,7 +36,11 @@ def get_report(date):
 def get_positive_articles(date):
     """Get positive articles for a specific report."""
     try:
-        articles = report_service.get_positive_articles(date)
+        articles = report_service.get_positive_articles(
+            date,
+            limit=request.args.get("limit", type=int),
+            offset=request.args.get("offset", default=0, type=int),
+        )
         return jsonify({"articles": articles})
     except Exception as e:
         logger.error(f"Error in get_positive_articles for {date}: {str(e)}")
@@ -46,7 +50,11 @@ def get_positive_articles(date):
 def get_negative_articles(date):
     """Get negative articles for a specific report."""
     try:
-        articles = report_service.get_negative_articles(date)
+        articles = report_service.get_negative_articles(
+            date,
+            limit=request.args.get("limit", type=int),
+            offset=request.args.get("offset", default=0, type=int),
+        )
         return jsonify({"articles": articles})
     except Exception as e:
         logger.error(f"Error in get_negative_articles for {date}: {str(e)}")
@@ -41,7 +41,10 @@ def analyze_batch():
 def get_history():
     """Get sentiment analysis history."""
     try:
-        results = sentiment_service.get_history()
+        results = sentiment_service.get_history(
+            limit=request.args.get("limit", type=int),
+            offset=request.args.get("offset", default=0, type=int),
+        )
         return jsonify(results)
     except Exception as e:
         logger.error(f"Error in get_history: {str(e)}")
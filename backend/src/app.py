@@ -7,12 +7,14 @@ from .api.market_routes import market_bp
 from .api.sentiment_routes import sentiment_bp
 from .api.report_routes import report_bp
 from .utils.logger import get_logger
+from .utils.serialization import FastJSONProvider
 
 logger = get_logger(__name__)
 
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     CORS(app)
     
     # Register blueprints
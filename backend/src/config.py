@@ -14,6 +14,12 @@ os.makedirs(DATA_DIR, exist_ok=True)
 REPORTS_DIR = os.path.join(DATA_DIR, "reports")
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
+# Indexed SQLite repository of scored articles
+ARTICLE_DB_PATH = os.path.join(DATA_DIR, "articles.sqlite3")
+
+# Results file used before the repository, imported into it once
+LEGACY_RESULTS_FILE = os.path.join(DATA_DIR, "sentiment_results.json")
+
 # API configuration
 API_CONFIG = {
     "title": "Sentiment Analysis API",
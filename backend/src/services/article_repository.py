@@ -0,0 +1,232 @@
+"""
+Indexed SQLite repository of scored articles.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import os
+import sqlite3
+import threading
+from datetime import date, datetime
+from ..utils.logger import get_logger
+from ..utils import serialization
+from ..config import ARTICLE_DB_PATH, LEGACY_RESULTS_FILE
+
+logger = get_logger(__name__)
+
+# Same schema as the pipeline's repository, so both can share a database file
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS articles ("
+    "link TEXT PRIMARY KEY, date TEXT NOT NULL, source TEXT, "
+    "label TEXT, score REAL, record TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_date_label_score "
+    "ON articles (date, label, score)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_label_score ON articles (label, score)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_source_date ON articles (source, date)",
+]
+
+ORDERINGS = {
+    "score": "score DESC",
+    "date": "date DESC, rowid DESC",
+}
+
+
+class ArticleRepository:
+    """Repository answering article queries with indexed SQL."""
+
+    def __init__(self, path: str = ARTICLE_DB_PATH, legacy_results: str = LEGACY_RESULTS_FILE):
+        """
+        Open (or create) the repository in WAL mode.
+
+        Args:
+            path: SQLite database file
+            legacy_results: Results file imported once while the repository is empty
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        if self.count() == 0:
+            self._backfill(legacy_results)
+
+    def _backfill(self, legacy_results: str) -> None:
+        """Import the results saved before the repository existed."""
+        if not os.path.exists(legacy_results):
+            return
+        try:
+            with open(legacy_results, "rb") as f:
+                results = serialization.loads(f.read())
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading {legacy_results}: {str(e)}")
+            return
+        written = self.upsert(results)
+        logger.info(f"Imported {written} results from {legacy_results}")
+
+    @staticmethod
+    def _date(stamp: Any) -> str:
+        """Get the YYYY-MM-DD date of a timestamp, today if it has none."""
+        if isinstance(stamp, (datetime, date)):
+            return stamp.isoformat()[:10]
+        if isinstance(stamp, str) and len(stamp) >= 10:
+            return stamp[:10]
+        return datetime.now().strftime("%Y-%m-%d")
+
+    def upsert(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert records in one transaction, replacing those with the same link.
+
+        Args:
+            records: Scored articles; texts without a link are keyed by content
+
+        Returns:
+            Number of records written
+        """
+        rows = []
+        for record in records:
+            sentiment = record.get("sentiment") or {}
+            rows.append((
+                record.get("link") or self._text_key(record.get("text", "")),
+                self._date(record.get("timestamp")),
+                record.get("source"),
+                sentiment.get("label"),
+                sentiment.get("score"),
+                serialization.dumps(record),
+            ))
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO articles (link, date, source, label, score, record) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(link) DO UPDATE SET date = excluded.date, "
+                        "source = excluded.source, label = excluded.label, "
+                        "score = excluded.score, record = excluded.record",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Error writing article repository: {str(e)}")
+                return 0
+        return len(rows)
+
+    @staticmethod
+    def _text_key(text: str) -> str:
+        """Key a scored text that has no link by its content."""
+        return "text:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _where(
+        start: Optional[str],
+        end: Optional[str],
+        source: Optional[str] = None,
+        label: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause of a query and its parameters."""
+        clauses, params = [], []
+        if start and start == end:
+            clauses.append("date = ?")
+            params.append(start)
+        else:
+            if start:
+                clauses.append("date >= ?")
+                params.append(start)
+            if end:
+                clauses.append("date <= ?")
+                params.append(end)
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if label is not None:
+            clauses.append("label = ?")
+            params.append(label)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: Optional[str] = None,
+        label: Optional[str] = None,
+        order_by: str = "score",
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of the articles matching the filters.
+
+        Args:
+            start: First date (YYYY-MM-DD), unbounded if None
+            end: Last date, inclusive, unbounded if None
+            source: Only articles from this source
+            label: Only articles with this sentiment label
+            order_by: "score" (highest first) or "date" (newest first)
+            limit: Page size, everything if None
+            offset: Matching articles skipped before the page
+
+        Returns:
+            List of article records
+        """
+        if order_by not in ORDERINGS:
+            raise ValueError(f"Unknown ordering '{order_by}'")
+        where, params = self._where(start, end, source, label)
+        sql = f"SELECT record FROM articles{where} ORDER BY {ORDERINGS[order_by]}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [serialization.loads(row[0]) for row in self._fetch(sql, params)]
+
+    def count(self, start: Optional[str] = None, end: Optional[str] = None) -> int:
+        """
+        Count the articles of a date range.
+
+        Args:
+            start: First date (YYYY-MM-DD), unbounded if None
+            end: Last date, inclusive, unbounded if None
+
+        Returns:
+            Number of articles
+        """
+        where, params = self._where(start, end)
+        return self._fetch(f"SELECT COUNT(*) FROM articles{where}", params)[0][0]
+
+    def sources(self, start: Optional[str] = None, end: Optional[str] = None) -> List[str]:
+        """
+        Get the sources with articles in a date range.
+
+        Args:
+            start: First date (YYYY-MM-DD), unbounded if None
+            end: Last date, inclusive, unbounded if None
+
+        Returns:
+            Sorted source names
+        """
+        where, params = self._where(start, end)
+        rows = self._fetch(f"SELECT DISTINCT source FROM articles{where} ORDER BY source", params)
+        return [row[0] for row in rows if row[0] is not None]
+
+    def label_counts(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> List[Tuple[Optional[str], Optional[str], int]]:
+        """
+        Count the articles of a date range per source and sentiment label.
+
+        Args:
+            start: First date (YYYY-MM-DD), unbounded if None
+            end: Last date, inclusive, unbounded if None
+
+        Returns:
+            List of (source, label, count) rows
+        """
+        where, params = self._where(start, end)
+        return self._fetch(
+            f"SELECT source, label, COUNT(*) FROM articles{where} GROUP BY source, label",
+            params,
+        )
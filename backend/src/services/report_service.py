@@ -1,12 +1,11 @@
 """
 Report generation and retrieval service.
 """
-from typing import Dict, Any, List, Optional
-import json
+from typing import Dict, Any, List, Optional, Tuple
 import os
-from datetime import datetime
 from ..utils.logger import get_logger
 from ..config import DATA_DIR
+from .article_repository import ArticleRepository
 
 logger = get_logger(__name__)
 
@@ -16,7 +15,7 @@ class ReportService:
     def __init__(self):
         """Initialize the report service."""
         self.reports_dir = os.path.join(DATA_DIR, "reports")
-        self.results_file = os.path.join(DATA_DIR, "sentiment_results.json")
+        self.repository = ArticleRepository()
     
     def get_available_reports(self) -> List[str]:
         """
@@ -56,143 +55,108 @@ class ReportService:
             if not os.path.exists(report_dir):
                 return None
             
-            # Load report data from main results file
-            if os.path.exists(self.results_file):
-                with open(self.results_file, "r", encoding="utf-8") as f:
-                    results = json.load(f)
-            else:
-                results = []
-            
-            # Get report metadata
+            # Counts are aggregated in SQL, only the top articles are loaded
+            label_counts = self.repository.label_counts(date, date)
             return {
                 "date": date,
-                "total_articles": len(results),
-                "sources": sorted(set(article["source"] for article in results)),
-                "sentiment_distribution": self._get_sentiment_distribution(results),
-                "source_stats": self._get_source_stats(results),
-                "top_positive": self._get_top_articles(results, "Positive"),
-                "top_negative": self._get_top_articles(results, "Negative"),
+                "total_articles": self.repository.count(date, date),
+                "sources": self.repository.sources(date, date),
+                "sentiment_distribution": self._get_sentiment_distribution(label_counts),
+                "source_stats": self._get_source_stats(label_counts),
+                "top_positive": self.repository.query(date, date, label="Positive", limit=5),
+                "top_negative": self.repository.query(date, date, label="Negative", limit=5),
             }
         except Exception as e:
             logger.error(f"Error getting report for {date}: {str(e)}")
             raise
     
-    def get_positive_articles(self, date: str) -> List[Dict[str, Any]]:
+    def get_positive_articles(
+        self,
+        date: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
-        Get positive articles for a specific report.
+        Get positive articles for a specific report, highest score first.
         
         Args:
             date: Report date
+            limit: Page size, everything if None
+            offset: Articles skipped before the page
             
         Returns:
             List of positive articles
         """
         try:
-            if not os.path.exists(self.results_file):
-                return []
-            
-            with open(self.results_file, "r", encoding="utf-8") as f:
-                results = json.load(f)
-            
-            positive_articles = [
-                r for r in results
-                if r["sentiment"]["label"] == "Positive"
-            ]
-            return sorted(
-                positive_articles,
-                key=lambda x: x["sentiment"]["score"],
-                reverse=True
+            return self.repository.query(
+                date, date, label="Positive", limit=limit, offset=offset
             )
         except Exception as e:
             logger.error(f"Error getting positive articles for {date}: {str(e)}")
             raise
     
-    def get_negative_articles(self, date: str) -> List[Dict[str, Any]]:
+    def get_negative_articles(
+        self,
+        date: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
-        Get negative articles for a specific report.
+        Get negative articles for a specific report, highest score first.
         
         Args:
             date: Report date
+            limit: Page size, everything if None
+            offset: Articles skipped before the page
             
         Returns:
             List of negative articles
         """
         try:
-            if not os.path.exists(self.results_file):
-                return []
-            
-            with open(self.results_file, "r", encoding="utf-8") as f:
-                results = json.load(f)
-            
-            negative_articles = [
-                r for r in results
-                if r["sentiment"]["label"] == "Negative"
-            ]
-            return sorted(
-                negative_articles,
-                key=lambda x: x["sentiment"]["score"],
-                reverse=True
+            return self.repository.query(
+                date, date, label="Negative", limit=limit, offset=offset
             )
         except Exception as e:
             logger.error(f"Error getting negative articles for {date}: {str(e)}")
             raise
     
-    def _get_sentiment_distribution(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _get_sentiment_distribution(
+        self,
+        label_counts: List[Tuple[Optional[str], Optional[str], int]]
+    ) -> Dict[str, int]:
         """
         Calculate sentiment distribution.
         
         Args:
-            results: List of sentiment analysis results
+            label_counts: (source, label, count) rows from the repository
             
         Returns:
             Dict containing sentiment distribution
         """
         distribution = {"Positive": 0, "Neutral": 0, "Negative": 0}
-        for result in results:
-            label = result["sentiment"]["label"]
-            distribution[label] += 1
+        for _, label, count in label_counts:
+            if label is not None:
+                distribution[label] = distribution.get(label, 0) + count
         return distribution
     
-    def _get_source_stats(self, results: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    def _get_source_stats(
+        self,
+        label_counts: List[Tuple[Optional[str], Optional[str], int]]
+    ) -> Dict[str, Dict[str, int]]:
         """
         Calculate statistics by source.
         
         Args:
-            results: List of sentiment analysis results
+            label_counts: (source, label, count) rows from the repository
             
         Returns:
             Dict containing source statistics
         """
         stats = {}
-        for article in results:
-            source = article["source"]
-            sentiment = article["sentiment"]["label"]
-            
+        for source, label, count in label_counts:
+            if source is None or label is None:
+                continue
             if source not in stats:
                 stats[source] = {"positive": 0, "neutral": 0, "negative": 0}
-            
-            stats[source][sentiment.lower()] += 1
+            stats[source][label.lower()] = count
         return stats
-    
-    def _get_top_articles(
-        self,
-        results: List[Dict[str, Any]],
-        sentiment: str,
-        limit: int = 5
-    ) -> List[Dict[str, Any]]:
-        """
-        Get top articles by sentiment.
-        
-        Args:
-            results: List of sentiment analysis results
-            sentiment: Sentiment label
-            limit: Maximum number of articles to return
-            
-        Returns:
-            List of top articles
-        """
-        return sorted(
-            [r for r in results if r["sentiment"]["label"] == sentiment],
-            key=lambda x: x["sentiment"]["score"],
-            reverse=True
-        )[:limit] 
\ No newline at end of file
@@ -2,11 +2,9 @@
 Sentiment analysis service.
 """
 from typing import Dict, Any, List, Optional
-import json
-import os
 from datetime import datetime
 from ..utils.logger import get_logger
-from ..config import DATA_DIR
+from .article_repository import ArticleRepository
 
 logger = get_logger(__name__)
 
@@ -15,7 +13,7 @@ class SentimentService:
     
     def __init__(self):
         """Initialize the sentiment service."""
-        self.results_file = os.path.join(DATA_DIR, "sentiment_results.json")
+        self.repository = ArticleRepository()
     
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -58,34 +56,32 @@ class SentimentService:
             logger.error(f"Error analyzing batch: {str(e)}")
             raise
     
-    def get_history(self) -> List[Dict[str, Any]]:
+    def get_history(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
-        Get sentiment analysis history.
+        Get sentiment analysis history, newest first.
         
+        Args:
+            limit: Page size, everything if None
+            offset: Results skipped before the page
+            
         Returns:
             List of historical sentiment analysis results
         """
         try:
-            if not os.path.exists(self.results_file):
-                return []
-            
-            with open(self.results_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self.repository.query(order_by="date", limit=limit, offset=offset)
         except Exception as e:
             logger.error(f"Error getting history: {str(e)}")
             raise
     
     def save_results(self, results: List[Dict[str, Any]]) -> None:
         """
-        Save sentiment analysis results.
+        Save sentiment analysis results, replacing earlier ones with the same key.
         
         Args:
             results: List of sentiment analysis results to save
         """
         try:
-            os.makedirs(os.path.dirname(self.results_file), exist_ok=True)
-            with open(self.results_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2)
+            self.repository.upsert(results)
         except Exception as e:
             logger.error(f"Error saving results: {str(e)}")
             raise 
\ No newline at end of file
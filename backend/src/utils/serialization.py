@@ -0,0 +1,84 @@
+"""
+JSON serialization using orjson when it is installed, stdlib json otherwise.
+"""
+from typing import Any, Union
+import json
+import math
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize NumPy values and dates, which stdlib json rejects."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinities with None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _default_finite(value: Any) -> Any:
+    """``_default`` for stdlib json, whose NumPy values may hold NaN."""
+    return _finite(_default(value))
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize data to compact JSON.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+    options = {"ensure_ascii": False, "allow_nan": False, "separators": (",", ":")}
+    try:
+        return json.dumps(data, default=_default_finite, **options)
+    except ValueError:
+        # NaN and infinities are written as null, like orjson does
+        return json.dumps(_finite(data), default=_default_finite, **options)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+        
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider encoding responses with ``dumps``."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj)
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return loads(s)
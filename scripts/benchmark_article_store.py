@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the whole-file JSON results against the partitioned article store.
+
+Simulates a history of daily runs. The JSON baseline keeps every run by
+rewriting one file with all results, as a history-preserving
+``save_to_json`` must; the store appends one segment per run and the SQLite
+repository upserts the run. The cost of the last run's save and of reading
+one day back is reported; for SQLite the read is the report page query
+(counts per label and source plus the top five of each polarity).
+
+Usage:
+    python -m scripts.benchmark_article_store --days 30 90 --per-day 2000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from src.article_repository import ArticleRepository
+from src.storage import DataStorage, PartitionedStore
+
+from .benchmark_corpus import synthetic_articles
+
+
+def daily_records(day, count):
+    """Scored articles ingested on ``day``."""
+    records = synthetic_articles(count, seed=day.toordinal())
+    labels = ["Positive", "Neutral", "Negative"]
+    for i, record in enumerate(records):
+        record["link"] = f"{record['link']}/{day.isoformat()}/{i}"
+        record["timestamp"] = f"{day.isoformat()}T08:00:00"
+        record["sentiment"] = {"label": labels[i % 3], "score": (i % 97) / 97}
+    return records
+
+
+def main():
+    """Build histories of increasing length and time saving and reading."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 90])
+    parser.add_argument("--per-day", type=int, default=2000)
+    args = parser.parse_args()
+
+    storage = DataStorage()
+    print(
+        f"{'days':>5} {'layout':>12} {'save last run':>14} "
+        f"{'read one day':>13} {'records read':>13}"
+    )
+    for days in args.days:
+        first = date(2024, 1, 1)
+        history = [
+            daily_records(first + timedelta(d), args.per_day) for d in range(days)
+        ]
+        last_day = (first + timedelta(days - 1)).isoformat()
+        root = tempfile.mkdtemp()
+
+        json_path = os.path.join(root, "results.json")
+        storage.save_to_json([r for run in history[:-1] for r in run], json_path)
+        start = time.perf_counter()
+        storage.save_to_json([r for run in history for r in run], json_path)
+        json_save = time.perf_counter() - start
+        start = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as f:
+            day = [r for r in json.load(f) if r["timestamp"].startswith(last_day)]
+        json_read = time.perf_counter() - start
+        print(
+            f"{days:>5} {'json file':>12} {json_save:>13.3f}s {json_read:>12.3f}s "
+            f"{days * args.per_day:>13}"
+        )
+
+        store = PartitionedStore(os.path.join(root, "articles"))
+        for run in history[:-1]:
+            store.append(run)
+        start = time.perf_counter()
+        store.compact(store.append(history[-1]))
+        store_save = time.perf_counter() - start
+        start = time.perf_counter()
+        day = store.read(last_day, last_day)
+        store_read = time.perf_counter() - start
+        print(
+            f"{days:>5} {'partitioned':>12} {store_save:>13.3f}s "
+            f"{store_read:>12.3f}s {len(day):>13}"
+        )
+
+        repository = ArticleRepository(os.path.join(root, "articles.sqlite3"))
+        for run in history[:-1]:
+            repository.upsert(run)
+        start = time.perf_counter()
+        repository.upsert(history[-1])
+        sqlite_save = time.perf_counter() - start
+        start = time.perf_counter()
+        repository.sentiment_distribution(last_day, last_day)
+        repository.source_stats(last_day, last_day)
+        top = repository.query(last_day, last_day, label="Positive", limit=5)
+        top += repository.query(last_day, last_day, label="Negative", limit=5)
+        sqlite_read = time.perf_counter() - start
+        repository.close()
+        print(
+            f"{days:>5} {'sqlite':>12} {sqlite_save:>13.3f}s "
+            f"{sqlite_read:>12.3f}s {len(top):>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark dict articles against slotted records and the columnar batch.
+
+Measures the memory the containers of scored articles take (the strings are
+shared by every form and left out) and the time of the report aggregations:
+label counts, counts per source and label, and the top five positive and
+negative articles, as the report generator computed them from dicts and as
+``ArticleBatch`` computes them.
+
+Usage:
+    python -m scripts.benchmark_articles --count 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from src.articles import Article, ArticleBatch
+
+from .benchmark_corpus import synthetic_articles
+
+
+def scored_records(count):
+    """Scored articles with every field the pipeline sets."""
+    records = synthetic_articles(count)
+    labels = ["Positive", "Neutral", "Negative"]
+    for i, record in enumerate(records):
+        record["processed_text"] = record["summary"]
+        record["timestamp"] = record["processed_at"] = "2024-01-01T12:00:00"
+        record["text_length"] = len(record["summary"])
+        record["cluster_id"] = f"{i:016x}"
+        record["duplicate_of"] = None
+        record["sentiment"] = {"label": labels[i % 3], "score": (i % 97) / 97}
+    return records
+
+
+def measure(build):
+    """Bytes allocated by ``build()`` that are still alive, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def dict_aggregates(results):
+    """Report aggregations over dicts, as the report generator did them."""
+    counts, stats = {}, {}
+    for article in results:
+        label = article["sentiment"]["label"]
+        counts[label] = counts.get(label, 0) + 1
+        source = stats.setdefault(
+            article["source"], {"positive": 0, "neutral": 0, "negative": 0}
+        )
+        source[label.lower()] += 1
+    for label in ("Positive", "Negative"):
+        sorted(
+            results,
+            key=lambda x, label=label: (
+                x["sentiment"]["score"] if x["sentiment"]["label"] == label else 0
+            ),
+            reverse=True,
+        )[:5]
+    return counts, stats
+
+
+def batch_aggregates(batch):
+    """The same aggregations on a columnar batch."""
+    batch.top("Positive", 5)
+    batch.top("Negative", 5)
+    return batch.label_counts(), batch.source_stats()
+
+
+def main():
+    """Compare memory and aggregation time of each representation."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = scored_records(args.count)
+    dict_size, dicts = measure(
+        lambda: [dict(r, sentiment=dict(r["sentiment"])) for r in records]
+    )
+    article_size, articles = measure(lambda: [Article.from_dict(r) for r in dicts])
+    batch_size, batch = measure(lambda: ArticleBatch(dicts))
+    assert [a.to_dict() for a in articles[:100]] == dicts[:100]
+    assert batch_aggregates(batch) == dict_aggregates(dicts)
+
+    def best(func):
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    print(f"{args.count} scored articles")
+    print(f"{'form':>22} {'memory':>10} {'aggregate':>10}")
+    print(
+        f"{'dicts':>22} {dict_size / 2**20:>8.1f}MB "
+        f"{best(lambda: dict_aggregates(dicts)):>9.3f}s"
+    )
+    print(f"{'Article records':>22} {article_size / 2**20:>8.1f}MB {'':>10}")
+    print(
+        f"{'batch (build + query)':>22} {batch_size / 2**20:>8.1f}MB "
+        f"{best(lambda: batch_aggregates(ArticleBatch(dicts))):>9.3f}s"
+    )
+    print(
+        f"{'batch (query)':>22} {'':>10} "
+        f"{best(lambda: batch_aggregates(batch)):>9.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
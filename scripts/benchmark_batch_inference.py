@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark batched FinBERT inference against the per-text path.
+
+Each batch size is run twice: with fixed-count batches in input order and
+with length-bucketed batches under the configured token budget.
+
+Usage:
+    python -m scripts.benchmark_batch_inference --num-articles 256
+"""
+
+import argparse
+import logging
+import time
+
+from src.config import MAX_BATCH_TOKENS, MODEL_NAME
+from src.sentiment_analyzer import SentimentAnalyzer
+
+from .benchmark_corpus import load_texts
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run the benchmark and print articles/sec per batch size."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=256)
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64]
+    )
+    parser.add_argument("--max-batch-tokens", type=int, default=MAX_BATCH_TOKENS)
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    texts = load_texts(args.num_articles)
+    analyzer = SentimentAnalyzer(model_name=args.model, use_cache=False)
+
+    start = time.perf_counter()
+    reference = [analyzer.analyze_text(text) for text in texts]
+    baseline = len(texts) / (time.perf_counter() - start)
+    print(
+        f"{'mode':>18} {'articles/sec':>14} {'speedup':>9} "
+        f"{'padding eff.':>13} {'matches':>9}"
+    )
+    print(f"{'per-text':>18} {baseline:>14.1f} {1.0:>8.2f}x {'-':>13} {'-':>9}")
+
+    for batch_size in args.batch_sizes:
+        for mode, budget in (("fixed", None), ("bucketed", args.max_batch_tokens)):
+            analyzer.max_batch_tokens = budget
+            start = time.perf_counter()
+            results = analyzer.analyze_batch(texts, batch_size=batch_size)
+            rate = len(texts) / (time.perf_counter() - start)
+            efficiency = analyzer.get_batch_metrics()["padding_efficiency"]
+            matches = sum(r == ref for r, ref in zip(results, reference))
+            print(
+                f"{mode + ' batch=' + str(batch_size):>18} {rate:>14.1f} "
+                f"{rate / baseline:>8.2f}x {efficiency:>13.1%} "
+                f"{matches:>4}/{len(texts)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
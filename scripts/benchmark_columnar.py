@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark analytics over the article history: JSON records vs columnar store.
+
+Builds a history of daily runs in both the JSON Lines article store and the
+columnar store, then computes the mean score per source and label over the
+whole range: from the records, as the JSON files force, and from a
+memory-mapped columnar scan of only the three columns involved. A filtered
+top-scores query shows predicate pushdown.
+
+Usage:
+    python -m scripts.benchmark_columnar --days 30 90 --per-day 2000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from src.columnar_store import ColumnarStore
+from src.storage import PartitionedStore
+
+from .benchmark_article_store import daily_records
+
+
+def main():
+    """Build histories of increasing length and time one aggregate on each."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--days", type=int, nargs="+", default=[30, 90])
+    parser.add_argument("--per-day", type=int, default=2000)
+    parser.add_argument("--format", choices=["parquet", "arrow"], default="parquet")
+    args = parser.parse_args()
+
+    print(
+        f"{'days':>5} {'layout':>10} {'on disk':>10} {'aggregate':>10} {'top 100':>9}"
+    )
+    for days in args.days:
+        first = date(2024, 1, 1)
+        root = tempfile.mkdtemp()
+        store = PartitionedStore(os.path.join(root, "articles"))
+        columnar = ColumnarStore(os.path.join(root, "columnar"), args.format)
+        for d in range(days):
+            run = daily_records(first + timedelta(d), args.per_day)
+            store.append(run)
+            columnar.append(run)
+
+        start = time.perf_counter()
+        records = store.read()
+        df = pd.DataFrame(
+            {
+                "source": [r["source"] for r in records],
+                "label": [r["sentiment"]["label"] for r in records],
+                "score": [r["sentiment"]["score"] for r in records],
+            }
+        )
+        df.groupby(["source", "label"])["score"].mean()
+        json_aggregate = time.perf_counter() - start
+        start = time.perf_counter()
+        top = sorted(
+            (r for r in store.read() if r["sentiment"]["label"] == "Positive"),
+            key=lambda r: r["sentiment"]["score"],
+            reverse=True,
+        )[:100]
+        json_top = time.perf_counter() - start
+        print(
+            f"{days:>5} {'jsonl':>10} {_size(store.root) / 2**20:>8.1f}MB "
+            f"{json_aggregate:>9.3f}s {json_top:>8.3f}s"
+        )
+
+        start = time.perf_counter()
+        columnar.scan(["source", "label", "score"]).group_by(
+            ["source", "label"]
+        ).aggregate([("score", "mean")])
+        columnar_aggregate = time.perf_counter() - start
+        start = time.perf_counter()
+        top = columnar.scan(["link", "score"], label="Positive", min_score=0.9)
+        top.sort_by([("score", "descending")]).slice(0, 100)
+        columnar_top = time.perf_counter() - start
+        print(
+            f"{days:>5} {args.format:>10} {_size(columnar.root) / 2**20:>8.1f}MB "
+            f"{columnar_aggregate:>9.3f}s {columnar_top:>8.3f}s"
+        )
+
+
+def _size(root):
+    return sum(
+        os.path.getsize(os.path.join(directory, name))
+        for directory, _, names in os.walk(root)
+        for name in names
+    )
+
+
+if __name__ == "__main__":
+    main()
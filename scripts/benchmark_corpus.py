@@ -0,0 +1,93 @@
+"""
+Shared article corpus for the benchmark scripts.
+
+Real results from previous pipeline runs are used when available so that the
+length distribution matches production; otherwise a deterministic synthetic
+corpus of financial headlines and summaries is generated.
+"""
+
+import random
+from typing import Any, Dict, List
+
+from src.config import MIN_TEXT_LENGTH
+from src.storage import DataStorage
+
+SUMMARY_MAX_LENGTH = 1000  # Feed summaries rarely run longer
+
+HEADLINES = [
+    "Stocks rally as Fed signals pause in rate hikes",
+    "Oil prices plunge on weak demand outlook",
+    "Tech shares slump after earnings miss",
+    "Dollar steadies ahead of inflation report",
+    "Bank profits beat analyst expectations",
+    "Nasdaq closes at record high on AI optimism",
+    "European markets mixed as ECB holds rates",
+    "Retail sales decline for second straight month",
+]
+
+SENTENCES = [
+    "Investors weighed fresh economic data against central bank guidance.",
+    "Analysts expect revenue growth to slow over the coming quarters.",
+    "The company reported a quarterly loss despite strong sales.",
+    "Shares rose 5% in early trading before paring gains.",
+    "Treasury yields climbed as traders priced in further tightening.",
+    "Management raised its full-year outlook citing robust demand.",
+    "The index fell sharply amid concerns over global growth.",
+    "Market participants remain cautious ahead of the jobs report.",
+]
+
+
+def synthetic_articles(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate raw articles with summaries spanning the processed length range.
+
+    Args:
+        count (int): Number of articles
+        seed (int): Random seed
+
+    Returns:
+        List[Dict[str, Any]]: Articles shaped like ``fetch_all_feeds`` output
+    """
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        summary = ""
+        target = rng.randint(MIN_TEXT_LENGTH, SUMMARY_MAX_LENGTH)
+        while len(summary) < target:
+            summary += " " + rng.choice(SENTENCES)
+        articles.append(
+            {
+                "title": rng.choice(HEADLINES),
+                "summary": f"<p>{summary.strip()}</p>",
+                "link": f"https://example.com/article/{i}",
+                "published": "Mon, 01 Jan 2024 12:00:00 GMT",
+                "source": rng.choice(["investing", "marketwatch", "seeking_alpha"]),
+            }
+        )
+    return articles
+
+
+def load_texts(count: int, seed: int = 0) -> List[str]:
+    """
+    Load ``count`` processed texts, repeating stored results if needed.
+
+    Args:
+        count (int): Number of texts
+        seed (int): Random seed for the synthetic fallback
+
+    Returns:
+        List[str]: Processed article texts
+    """
+    texts = [
+        r["processed_text"]
+        for r in DataStorage().load_results()
+        if "processed_text" in r
+    ]
+
+    if not texts:
+        rng = random.Random(seed)
+        for article in synthetic_articles(count, seed):
+            text = f"{article['title']} {article['summary'][3:-4]}".lower()
+            texts.append(text[: rng.randint(MIN_TEXT_LENGTH, SUMMARY_MAX_LENGTH)])
+
+    return [texts[i % len(texts)] for i in range(count)]
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark cron-style one-shot runs against warm daemon cycles.
+
+Each cold cycle is a fresh interpreter that imports the pipeline, loads the
+model and opens new sessions, as a cron job would. Warm cycles reuse one
+``PipelineDaemon``. Feeds come from local delayed servers (see
+benchmark_feed_fetch); conditional GET, seen-article and near-duplicate
+state are disabled so every cycle does the same work. Everything is written
+to a temporary working directory.
+
+Usage:
+    python -m scripts.benchmark_daemon --cycles 5 --model <path>
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.config import DAEMON, FEED_STATE, MODEL_NAME, NEAR_DUPLICATES
+
+from .benchmark_feed_fetch import render_feed, start_servers
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_daemon(feeds, model, interval=0.0):
+    """Create a daemon whose pipeline only does the benchmarked work."""
+    # pylint: disable=import-outside-toplevel
+    from src.pipeline import SentimentAnalysisPipeline
+    from src.pipeline_daemon import PipelineDaemon, WarmFeedFetcher
+    from src.sentiment_analyzer import SentimentAnalyzer
+
+    FEED_STATE["enabled"] = False
+    NEAR_DUPLICATES["enabled"] = False
+    DAEMON["save_csv"] = DAEMON["generate_report"] = False
+    # src.pipeline configures INFO logging on import
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pipeline = SentimentAnalysisPipeline(incremental=False)
+    pipeline.analyzer = SentimentAnalyzer(model_name=model, use_cache=False)
+    return PipelineDaemon(
+        pipeline, WarmFeedFetcher(feeds), interval=interval, metrics_path=None
+    )
+
+
+def one_shot(feeds, model):
+    """Run a single cycle in this process, as a cron job would."""
+    daemon = build_daemon(feeds, model)
+    daemon.run(max_cycles=1)
+    daemon.close()
+
+
+def main():
+    """Time cold and warm cycles and print the per-cycle cost."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--feeds", type=int, default=8)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--model", default=MODEL_NAME)
+    parser.add_argument("--one-shot", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())
+    if args.one_shot:
+        one_shot(json.loads(args.one_shot), args.model)
+        return
+
+    servers = start_servers(args.feeds, args.latency, render_feed(args.items))
+    feeds = {
+        f"feed{i}": f"http://127.0.0.1:{server.server_address[1]}/rss"
+        for i, server in enumerate(servers)
+    }
+
+    cold = []
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    for _ in range(args.cycles):
+        start = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "scripts.benchmark_daemon",
+                "--model",
+                args.model,
+                "--one-shot",
+                json.dumps(feeds),
+            ],
+            check=True,
+            env=env,
+            stderr=subprocess.DEVNULL,
+        )
+        cold.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    daemon = build_daemon(feeds, args.model)
+    daemon.warmup()
+    startup = time.perf_counter() - start
+    warm = []
+    for _ in range(args.cycles):
+        warm.append(daemon.run_cycle()["duration"])
+    stages = daemon.get_metrics()["last_cycle"]["stages"]
+    daemon.close()
+
+    print(f"{'mode':>14} {'mean s/cycle':>13} {'min':>7} {'max':>7}")
+    for name, timings in (("cron one-shot", cold), ("warm daemon", warm)):
+        print(
+            f"{name:>14} {sum(timings) / len(timings):>13.2f} "
+            f"{min(timings):>7.2f} {max(timings):>7.2f}"
+        )
+    print(f"daemon startup (paid once): {startup:.2f}s")
+    print(f"last warm cycle stages: {stages}")
+    for server in servers:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential against concurrent RSS fetching on local feed servers.
+
+Each feed is served by its own local HTTP server (a distinct host for the
+per-host rate limiter) that waits ``--latency`` seconds before answering,
+standing in for a slow remote publisher. The servers honour ``ETag``, so
+the repeated concurrent poll shows the cost of polling unchanged feeds.
+
+Usage:
+    python -m scripts.benchmark_feed_fetch --feeds 12 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from src.async_ingestion import AsyncNewsFetcher
+from src.feed_state import FeedStateStore, content_hash
+from src.news_ingestion import NewsFetcher
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def render_feed(items: int) -> bytes:
+    """Build an RSS document with the given number of items."""
+    entries = "".join(
+        f"<item><title>Stocks rise on earnings {i}</title>"
+        f"<link>http://example.com/{i}</link>"
+        f"<description>Shares gained {i}% after results.</description></item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>Bench</title>'
+        f"{entries}</channel></rss>"
+    ).encode("utf-8")
+
+
+def start_servers(count: int, latency: float, body: bytes) -> List[ThreadingHTTPServer]:
+    """Start one delayed feed server per feed on an ephemeral port."""
+    etag = f'"{content_hash(body)[:16]}"'
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve the fixture feed after a fixed delay."""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """Answer every path with the feed, or 304 if it is cached."""
+            time.sleep(latency)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def fetch_sequential(feeds: Dict[str, str], state: FeedStateStore) -> int:
+    """Fetch feeds one after another with the original fetcher."""
+    fetcher = NewsFetcher(feed_state=state)
+    articles = 0
+    for source, url in feeds.items():
+        feed = fetcher.fetch_feed(url)
+        if feed:
+            articles += len(fetcher.process_feed(feed, source))
+    return articles
+
+
+async def fetch_concurrent(feeds: Dict[str, str], state: FeedStateStore) -> int:
+    """Fetch feeds concurrently with the async engine."""
+    async with AsyncNewsFetcher(feed_state=state) as fetcher:
+        return len(await fetcher.fetch_all(feeds))
+
+
+def main():
+    """Run both fetchers against the local servers and print timings."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=12)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument(
+        "--skip-sequential",
+        action="store_true",
+        help="Only time the concurrent fetcher",
+    )
+    args = parser.parse_args()
+
+    servers = start_servers(args.feeds, args.latency, render_feed(args.items))
+    feeds = {
+        f"feed{i}": f"http://127.0.0.1:{server.server_address[1]}/rss"
+        for i, server in enumerate(servers)
+    }
+
+    state_dir = tempfile.mkdtemp()
+    results = []
+    if not args.skip_sequential:
+        state = FeedStateStore(os.path.join(state_dir, "sequential.json"))
+        start = time.perf_counter()
+        articles = fetch_sequential(feeds, state)
+        state.commit()
+        results.append(("sequential", articles, time.perf_counter() - start))
+    state = FeedStateStore(os.path.join(state_dir, "concurrent.json"))
+    for name in ("concurrent", "repeat poll"):
+        start = time.perf_counter()
+        articles = asyncio.run(fetch_concurrent(feeds, state))
+        state.commit()
+        results.append((name, articles, time.perf_counter() - start))
+
+    print(f"{'fetcher':>12} {'articles':>9} {'seconds':>9} {'feeds/sec':>10}")
+    for name, articles, seconds in results:
+        print(f"{name:>12} {articles:>9} {seconds:>9.2f} {args.feeds / seconds:>10.1f}")
+
+    for server in servers:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML-to-text extraction backends on article summaries.
+
+Two corpora are timed: the short ``<p>`` snippets typical of RSS summaries
+and the same snippets wrapped in boilerplate (navigation, scripts,
+comments) as some publishers send. Every backend's output is checked
+against the BeautifulSoup reference.
+
+Usage:
+    python -m scripts.benchmark_html_extraction --num-articles 20000
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable, List
+
+from src.html_extraction import BACKENDS, get_extractor, is_available
+
+from .benchmark_corpus import synthetic_articles
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+BOILERPLATE = (
+    '<div class="entry"><nav><a href="/">Home</a> | <a href="/markets">Markets</a>'
+    "</nav><script>window.ads = [];</script><!-- ad slot -->{body}"
+    "<footer>&copy; Publisher &mdash; All rights reserved</footer></div>"
+)
+
+
+def time_per_document(extract: Callable[[str], str], documents: List[str]) -> float:
+    """Run an extractor over all documents and return microseconds each."""
+    start = time.perf_counter()
+    for document in documents:
+        extract(document)
+    return 1e6 * (time.perf_counter() - start) / len(documents)
+
+
+def main():
+    """Time every installed backend on both corpora."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    snippets = [a["summary"] for a in synthetic_articles(args.num_articles, args.seed)]
+    corpora = {
+        "snippet": snippets,
+        "boilerplate": [BOILERPLATE.format(body=snippet) for snippet in snippets],
+    }
+    reference = {
+        name: [BACKENDS["bs4"](document) for document in documents[:500]]
+        for name, documents in corpora.items()
+    }
+
+    print(f"{'backend':>12} {'corpus':>12} {'us/doc':>9} {'speedup':>9} {'agrees':>7}")
+    for corpus, documents in corpora.items():
+        baseline = None
+        for name in ("bs4", "stream", "lxml", "selectolax", "auto"):
+            if name != "auto" and not is_available(name):
+                print(f"{name:>12} {corpus:>12} {'not installed':>27}")
+                continue
+            extract = get_extractor(name)
+            micros = time_per_document(extract, documents)
+            baseline = baseline or micros
+            agrees = all(
+                extract(document) == expected
+                for document, expected in zip(documents, reference[corpus])
+            )
+            print(
+                f"{name:>12} {corpus:>12} {micros:>9.1f} "
+                f"{baseline / micros:>8.1f}x {str(agrees):>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark truncated against chunked scoring of long article bodies.
+
+Chunked mode scores every window of every article in shared token-budget
+batches. The coverage column is the share of each article's tokens that
+reached the model.
+
+Usage:
+    python -m scripts.benchmark_long_articles --num-articles 128
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from src.config import LONG_TEXTS, MAX_LENGTH, MODEL_NAME
+from src.sentiment_analyzer import AGGREGATIONS, SentimentAnalyzer
+
+from .benchmark_corpus import HEADLINES, SENTENCES
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def long_articles(count: int, min_chars: int, max_chars: int, seed: int = 0):
+    """Generate lowercased article bodies between the given lengths."""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        target = rng.randint(min_chars, max_chars)
+        text = rng.choice(HEADLINES)
+        while len(text) < target:
+            text += " " + rng.choice(SENTENCES)
+        texts.append(text.lower())
+    return texts
+
+
+def main():
+    """Time both modes and print throughput, windows and token coverage."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=128)
+    parser.add_argument("--min-chars", type=int, default=1_000)
+    parser.add_argument("--max-chars", type=int, default=12_000)
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    texts = long_articles(args.num_articles, args.min_chars, args.max_chars)
+    configurations = [("truncate", "mean")] + [("chunk", a) for a in AGGREGATIONS]
+
+    print(
+        f"{'mode':>22} {'articles/sec':>13} {'windows/art':>12} "
+        f"{'coverage':>9} {'vs truncate':>12}"
+    )
+    reference = None
+    for mode, aggregation in configurations:
+        analyzer = SentimentAnalyzer(
+            model_name=args.model,
+            use_cache=False,
+            long_text_mode=mode,
+            aggregation=aggregation,
+        )
+        analyzer.analyze_batch(texts[:4])  # Load the model before timing
+        start = time.perf_counter()
+        results = analyzer.analyze_batch(texts)
+        rate = len(texts) / (time.perf_counter() - start)
+        metrics = analyzer.get_batch_metrics()
+
+        full_tokens = sum(len(ids) for ids in analyzer.tokenizer(texts)["input_ids"])
+        # Overlapping tokens are counted once per window, so remove them
+        unique_tokens = metrics["real_tokens"] - LONG_TEXTS["stride"] * (
+            metrics["windows"] - len(texts)
+        )
+        reference = reference or results
+        agreement = sum(
+            r["label"] == ref["label"] for r, ref in zip(results, reference)
+        )
+        name = mode if mode == "truncate" else f"chunk/{aggregation}"
+        print(
+            f"{name:>22} {rate:>13.1f} {metrics['windows'] / len(texts):>12.2f} "
+            f"{min(unique_tokens / full_tokens, 1.0):>9.1%} "
+            f"{agreement / len(texts):>12.1%}"
+        )
+    print(f"MAX_LENGTH={MAX_LENGTH}, max_windows={LONG_TEXTS['max_windows']}")
+
+
+if __name__ == "__main__":
+    main()
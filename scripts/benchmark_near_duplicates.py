@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark near-duplicate lookups against a large fingerprint store.
+
+The store is filled with ``--stored`` distinct synthetic stories, then
+``--queries`` articles are clustered, half of them lightly edited copies of
+stored stories and half new ones. Reports the per-article lookup latency
+and the fraction of edited copies detected.
+
+Usage:
+    python -m scripts.benchmark_near_duplicates --stored 1000000
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+import time
+
+from src.near_duplicates import NearDuplicateIndex
+
+from .benchmark_corpus import SENTENCES
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+WORDS = " ".join(SENTENCES).lower().replace(".", "").split()
+
+
+def story(rng: random.Random, ident: int) -> str:
+    """Build a distinct story of shuffled corpus words tagged with an id."""
+    words = rng.sample(WORDS, 40)
+    return f"story {ident} " + " ".join(words)
+
+
+def main():
+    """Fill a fingerprint store and time lookups against it."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--stored", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stories = [story(rng, i) for i in range(args.stored)]
+    path = os.path.join(tempfile.mkdtemp(), "fingerprints.sqlite3")
+    index = NearDuplicateIndex(path)
+
+    start = time.perf_counter()
+    for begin in range(0, args.stored, 10_000):
+        index.assign_clusters(
+            [{"processed_text": text} for text in stories[begin : begin + 10_000]]
+        )
+    fill_seconds = time.perf_counter() - start
+
+    edited = [
+        {"processed_text": rng.choice(stories) + " reuters reported"}
+        for _ in range(args.queries // 2)
+    ]
+    fresh = [
+        {"processed_text": story(rng, args.stored + i)}
+        for i in range(args.queries - len(edited))
+    ]
+    start = time.perf_counter()
+    _, duplicates = index.assign_clusters(edited + fresh)
+    lookup_seconds = time.perf_counter() - start
+
+    duplicate_ids = {id(article) for article in duplicates}
+    detected = sum(1 for article in edited if id(article) in duplicate_ids)
+    false_matches = len(duplicates) - detected
+    print(f"stored stories:      {len(index):>10}")
+    print(f"fill time:           {fill_seconds:>10.1f} s")
+    print(f"lookup latency:      {1000 * lookup_seconds / args.queries:>10.3f} ms")
+    print(f"edited copies found: {detected / len(edited):>10.1%}")
+    print(f"false matches:       {false_matches:>10}")
+    print(f"store size:          {os.path.getsize(path) / 2**20:>10.1f} MB")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
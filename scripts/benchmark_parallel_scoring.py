@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark multi-process sentiment scoring from one worker up to all cores.
+
+Every configuration uses ``workers x threads_per_worker == cores`` unless
+``--threads-per-worker`` is given. Pool startup and model loading are
+excluded by scoring a warmup shard before timing.
+
+Usage:
+    python -m scripts.benchmark_parallel_scoring --num-articles 4096
+"""
+
+import argparse
+import logging
+import os
+import time
+
+from src.config import MODEL_NAME
+from src.parallel_scoring import ShardedSentimentScorer
+
+from .benchmark_corpus import load_texts
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run the scaling benchmark and print articles/sec per configuration."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=4096)
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads-per-worker", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=256)
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    texts = load_texts(args.num_articles)
+    worker_counts = sorted(
+        {1, args.cores}
+        | {2**i for i in range(args.cores.bit_length()) if 2**i <= args.cores}
+    )
+
+    print(f"{'workers':>8} {'threads':>8} {'articles/sec':>14} {'speedup':>9}")
+    baseline = None
+    for workers in worker_counts:
+        threads = args.threads_per_worker or max(1, args.cores // workers)
+        with ShardedSentimentScorer(
+            workers,
+            threads,
+            shard_size=args.shard_size,
+            model_name=args.model,
+            use_cache=False,
+        ) as scorer:
+            # Start every worker before timing
+            scorer.analyze_batch(texts[: args.shard_size * workers])
+            start = time.perf_counter()
+            scorer.analyze_batch(texts)
+            rate = len(texts) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>8} {threads:>8} {rate:>14.1f} {rate / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch article preprocessing from one worker up to all cores.
+
+The baseline is the pipeline's previous list comprehension, which called
+``process_article`` twice per article. Pool startup is included in the
+timings because ``process_articles`` starts a pool per batch.
+
+Usage:
+    python -m scripts.benchmark_preprocessing --num-articles 20000
+"""
+
+import argparse
+import copy
+import logging
+import os
+import time
+
+from src.text_processor import PREPROCESSING, process_article, process_articles
+
+from .benchmark_corpus import synthetic_articles
+
+logging.basicConfig(
+    level=logging.ERROR, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Time the previous comprehension and every worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=20_000)
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=PREPROCESSING["chunksize"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    articles = synthetic_articles(args.num_articles, args.seed)
+    # Time the pool at every size regardless of the in-process threshold
+    PREPROCESSING["min_parallel_batch"] = 0
+
+    batch = copy.deepcopy(articles)
+    start = time.perf_counter()
+    _ = [process_article(article) for article in batch if process_article(article)]
+    baseline = len(articles) / (time.perf_counter() - start)
+
+    worker_counts = sorted(
+        {1, args.cores}
+        | {2**i for i in range(args.cores.bit_length()) if 2**i <= args.cores}
+    )
+    print(f"{'workers':>16} {'articles/sec':>14} {'speedup':>9}")
+    print(f"{'double-call':>16} {baseline:>14.0f} {1.0:>8.1f}x")
+    for workers in worker_counts:
+        batch = copy.deepcopy(articles)
+        start = time.perf_counter()
+        process_articles(batch, workers=workers, chunksize=args.chunksize)
+        rate = len(articles) / (time.perf_counter() - start)
+        print(f"{workers:>16} {rate:>14.0f} {rate / baseline:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON file size, parse time and memory of the results formats.
+
+Writes the same scored articles as the former indented stdlib JSON, as
+compact JSON and as JSON Lines, then times a full load with stdlib json and
+with the serialization layer (orjson when installed), and a streaming pass
+with ``iter_records``. Peak memory is traced for the load and the stream.
+
+Usage:
+    python -m scripts.benchmark_serialization --count 20000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src import serialization
+
+from .benchmark_articles import scored_records
+
+
+def timed(func, trace=False):
+    """Run ``func`` and get its duration and, if traced, its peak memory."""
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return duration, peak
+
+
+def consume(records):
+    """Aggregate a stream the way a report consumer would."""
+    counts = {}
+    for record in records:
+        label = record["sentiment"]["label"]
+        counts[label] = counts.get(label, 0) + 1
+    return counts
+
+
+def main():
+    """Write each format and compare size, parse time and memory."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    records = scored_records(args.count)
+    root = tempfile.mkdtemp()
+    pretty = os.path.join(root, "pretty.json")
+    compact = os.path.join(root, "compact.json")
+    lines = os.path.join(root, "results.jsonl")
+
+    def stdlib_dump():
+        with open(pretty, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+
+    write_pretty, _ = timed(stdlib_dump)
+    write_compact, _ = timed(lambda: serialization.dump(records, compact))
+    with open(lines, "wb") as f:
+        f.writelines(serialization.dumps_line(r) for r in records)
+
+    def stdlib_load(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    print(f"{args.count} scored articles, orjson: {serialization.orjson is not None}")
+    print(f"{'file':>13} {'size':>9} {'write':>8} {'read':>24} {'time':>8} {'peak':>9}")
+    rows = [
+        (pretty, write_pretty, "json.load", lambda: stdlib_load(pretty)),
+        (compact, write_compact, "json.load", lambda: stdlib_load(compact)),
+        (compact, None, "serialization.load", lambda: serialization.load(compact)),
+        (
+            compact,
+            None,
+            "iter_records",
+            lambda: consume(serialization.iter_records(compact)),
+        ),
+        (
+            lines,
+            None,
+            "iter_records",
+            lambda: consume(serialization.iter_records(lines)),
+        ),
+    ]
+    for path, write, reader, read in rows:
+        duration, _ = timed(read)
+        _, peak = timed(read, trace=True)
+        write = f"{write:.3f}s" if write is not None else ""
+        print(
+            f"{os.path.basename(path):>13} {os.path.getsize(path) / 2**20:>7.1f}MB "
+            f"{write:>8} {reader:>24} {duration:>7.3f}s {peak / 2**20:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark phase-by-phase against streaming pipeline execution.
+
+Feeds are served by local delayed HTTP servers (see benchmark_feed_fetch).
+The phased run fetches every feed concurrently, then preprocesses, scores
+and saves everything; the streaming run uses ``run_streaming``. Python heap
+peaks are measured with tracemalloc, in a second run since tracing slows
+Python down, at two feed counts to show how memory grows with volume. Conditional GET state, seen-article and near-duplicate
+indexes are disabled so both runs do the same work.
+
+Usage:
+    python -m scripts.benchmark_streaming --feeds 8 64 --latency 0.5 --model <path>
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.async_ingestion import AsyncNewsFetcher
+from src.config import FEED_STATE, MODEL_NAME
+from src.pipeline import SentimentAnalysisPipeline
+from src.sentiment_analyzer import SentimentAnalyzer
+from src.text_processor import process_articles
+
+from .benchmark_feed_fetch import render_feed, start_servers
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def fetch_all(feeds):
+    """Fetch every feed concurrently."""
+    async with AsyncNewsFetcher() as fetcher:
+        return await fetcher.fetch_all(feeds)
+
+
+def run_phased(pipeline, feeds, output_dir):
+    """Run the stages one after another; returns (articles, seconds)."""
+    start = time.perf_counter()
+    articles = asyncio.run(fetch_all(feeds))
+    processed = process_articles(articles, workers=1)
+    results, _ = pipeline._analyze(processed)  # pylint: disable=protected-access
+    pipeline.storage.save_to_json(results, os.path.join(output_dir, "phased.json"))
+    return len(results), time.perf_counter() - start
+
+
+def run_streaming(pipeline, feeds, output_dir):
+    """Run the stage graph; returns (articles, seconds, latency stats)."""
+    stats = pipeline.run_streaming(
+        feeds, output_path=os.path.join(output_dir, "streaming.jsonl")
+    )
+    return stats["completed"], stats["seconds"], stats["latency"]
+
+
+def main():
+    """Run both modes at two volumes and print time, latency and heap peak."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--feeds", type=int, nargs=2, default=[8, 64])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    FEED_STATE["enabled"] = False
+    # src.pipeline configures INFO logging on import
+    logging.getLogger().setLevel(logging.WARNING)
+
+    pipeline = SentimentAnalysisPipeline(incremental=False)
+    pipeline.near_duplicates = None
+    pipeline.analyzer = SentimentAnalyzer(model_name=args.model, use_cache=False)
+    pipeline.analyzer.warmup()
+    output_dir = tempfile.mkdtemp()
+
+    print(
+        f"{'mode':>10} {'feeds':>6} {'articles':>9} {'seconds':>8} "
+        f"{'p50 lat.':>9} {'p95 lat.':>9} {'heap peak':>10}"
+    )
+    for count in args.feeds:
+        servers = start_servers(count, args.latency, render_feed(args.items))
+        feeds = {
+            f"feed{i}": f"http://127.0.0.1:{server.server_address[1]}/rss"
+            for i, server in enumerate(servers)
+        }
+        for mode in ("phased", "streaming"):
+            if mode == "phased":
+                articles, seconds = run_phased(pipeline, feeds, output_dir)
+                # Every article waits for the slowest phase boundary
+                p50 = p95 = seconds - args.latency
+            else:
+                articles, seconds, latency = run_streaming(pipeline, feeds, output_dir)
+                p50, p95 = latency["p50"], latency["p95"]
+            tracemalloc.start()
+            (run_phased if mode == "phased" else run_streaming)(
+                pipeline, feeds, output_dir
+            )
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{mode:>10} {count:>6} {articles:>9} {seconds:>8.2f} "
+                f"{p50:>8.2f}s {p95:>8.2f}s {peak / 2**20:>8.1f}MB"
+            )
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark text normalization against the previous multi-pass implementation.
+
+The HTML is stripped up front so that only ``preprocess_text`` is timed.
+The previous implementation is kept here verbatim as the baseline.
+
+Usage:
+    python -m scripts.benchmark_text_normalization --num-articles 100000
+"""
+
+import argparse
+import logging
+import re
+import time
+import unicodedata
+from typing import Callable, List
+
+from src.text_processor import FINANCIAL_TERMS, preprocess_text
+
+from .benchmark_corpus import synthetic_articles
+
+logging.basicConfig(
+    level=logging.ERROR, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+
+def legacy_preprocess_text(text: str) -> str:
+    """Previous implementation: one ``re.sub`` per pattern and term."""
+    text = text.lower()
+    text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\S+@\S+", "", text)
+    text = re.sub(r"[^\w\s.,$%€£¥+-]", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    text = text.strip()
+    for pattern in [
+        r"click here to read more",
+        r"subscribe to our newsletter",
+        r"follow us on",
+        r"like us on facebook",
+        r"follow us on twitter",
+        r"disclaimer:",
+        r"terms of use:",
+        r"privacy policy:",
+        r"copyright ©",
+        r"all rights reserved",
+    ]:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    for term, replacement in FINANCIAL_TERMS.items():
+        pattern = r"\\b" + re.escape(term) + r"\\b"
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    return unicodedata.normalize("NFKD", text)
+
+
+def time_per_article(function: Callable[[str], object], texts: List[str]) -> float:
+    """Run a function over all texts and return microseconds per text."""
+    start = time.perf_counter()
+    for text in texts:
+        function(text)
+    return 1e6 * (time.perf_counter() - start) / len(texts)
+
+
+def main():
+    """Time both implementations and print the per-article cost."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    texts = [
+        f"{article['title']} {TAG_PATTERN.sub(' ', article['summary'])}"
+        for article in synthetic_articles(args.num_articles, args.seed)
+    ]
+
+    legacy = time_per_article(legacy_preprocess_text, texts)
+    current = time_per_article(preprocess_text, texts)
+    print(f"{'implementation':>16} {'us/article':>11} {'articles/sec':>13}")
+    for name, micros in (("multi-pass", legacy), ("single-pass", current)):
+        print(f"{name:>16} {micros:>11.1f} {1e6 / micros:>13.0f}")
+    print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
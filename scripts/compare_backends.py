@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compare inference backends for accuracy agreement, latency and throughput.
+
+Labels from the full precision ``pytorch`` backend are the reference. For
+every backend the script reports label agreement with the reference, the mean
+absolute score difference, single-text latency percentiles and batched
+throughput.
+
+Usage:
+    python -m scripts.compare_backends --num-articles 512 --output backends.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import time
+
+from src.config import MODEL_NAME
+from src.inference_backends import BACKENDS
+from src.sentiment_analyzer import SentimentAnalyzer
+
+from .benchmark_corpus import load_texts
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def measure_backend(backend: str, model: str, texts, latency_samples: int):
+    """Score ``texts`` with one backend and collect timing figures."""
+    start = time.perf_counter()
+    analyzer = SentimentAnalyzer(model_name=model, backend=backend, use_cache=False)
+    analyzer.warmup()
+    load_seconds = time.perf_counter() - start
+
+    latencies = []
+    for text in texts[:latency_samples]:
+        start = time.perf_counter()
+        analyzer.analyze_text(text)
+        latencies.append(1000 * (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    results = analyzer.analyze_batch(texts)
+    throughput = len(texts) / (time.perf_counter() - start)
+
+    latencies.sort()
+    return results, {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        "latency_ms_p50": round(statistics.median(latencies), 2),
+        "latency_ms_p95": round(latencies[int(0.95 * (len(latencies) - 1))], 2),
+        "texts_per_second": round(throughput, 1),
+    }
+
+
+def main():
+    """Run every requested backend and print the comparison report."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=512)
+    parser.add_argument("--latency-samples", type=int, default=64)
+    parser.add_argument(
+        "--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS)
+    )
+    parser.add_argument("--model", default=MODEL_NAME)
+    parser.add_argument("--output", help="Optional JSON file for the report")
+    args = parser.parse_args()
+
+    texts = load_texts(args.num_articles)
+    backends = ["pytorch"] + [b for b in args.backends if b != "pytorch"]
+
+    report = []
+    reference = None
+    for backend in backends:
+        try:
+            results, row = measure_backend(
+                backend, args.model, texts, args.latency_samples
+            )
+        except ImportError as e:
+            logger.warning("Skipping %s backend: %s", backend, str(e))
+            continue
+        if reference is None:
+            reference = results
+        row["label_agreement"] = round(
+            sum(r["label"] == ref["label"] for r, ref in zip(results, reference))
+            / len(texts),
+            4,
+        )
+        row["mean_abs_score_diff"] = round(
+            sum(abs(r["score"] - ref["score"]) for r, ref in zip(results, reference))
+            / len(texts),
+            4,
+        )
+        report.append(row)
+
+    columns = list(report[0]) if report else []
+    print(" ".join(f"{column:>20}" for column in columns))
+    for row in report:
+        print(" ".join(f"{str(row[column]):>20}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Evaluate the lexicon cascade against FinBERT-only scoring.
+
+For each confidence threshold the script reports how many texts were
+escalated to FinBERT, label agreement with FinBERT-only labels and the CPU
+time saved relative to scoring everything with FinBERT.
+
+Usage:
+    python -m scripts.evaluate_cascade --thresholds 0.5 0.6 0.7 0.8
+"""
+
+import argparse
+import logging
+import time
+
+from src.config import MODEL_NAME
+from src.sentiment_analyzer import SentimentAnalyzer
+
+from .benchmark_corpus import load_texts
+
+logging.basicConfig(
+    level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run FinBERT-only and cascade scoring and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-articles", type=int, default=1024)
+    parser.add_argument(
+        "--thresholds", type=float, nargs="+", default=[0.5, 0.6, 0.7, 0.8, 0.9]
+    )
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    texts = load_texts(args.num_articles)
+    analyzer = SentimentAnalyzer(model_name=args.model, use_cache=False)
+
+    start = time.process_time()
+    reference = analyzer.analyze_batch(texts)
+    reference_cpu = time.process_time() - start
+
+    print(
+        f"{'threshold':>10} {'escalated':>10} {'agreement':>10} "
+        f"{'cpu seconds':>12} {'cpu saved':>10}"
+    )
+    print(f"{'finbert':>10} {1.0:>10.1%} {1.0:>10.1%} {reference_cpu:>12.2f} {'-':>10}")
+    for threshold in args.thresholds:
+        analyzer.cascade_threshold = threshold
+        analyzer.cascade_stats = {
+            "texts": 0,
+            "escalated": 0,
+            "lexicon_cpu_seconds": 0.0,
+        }
+        start = time.process_time()
+        results = analyzer.analyze_batch(texts)
+        cpu = time.process_time() - start
+        agreement = sum(
+            r["label"] == ref["label"] for r, ref in zip(results, reference)
+        ) / len(texts)
+        stats = analyzer.get_cascade_stats()
+        print(
+            f"{threshold:>10.2f} {stats['escalation_rate']:>10.1%} {agreement:>10.1%} "
+            f"{cpu:>12.2f} {1 - cpu / reference_cpu:>10.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
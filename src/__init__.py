@@ -2,17 +2,31 @@
 Financial News Sentiment Analysis Package
 """
 
-from .news_ingestion import fetch_all_feeds
-from .pipeline import SentimentAnalysisPipeline
-from .sentiment_analyzer import SentimentAnalyzer
-from .storage import DataStorage
-from .text_processor import process_article
+import importlib
 
 __version__ = "1.0.0"
 __all__ = [
     "SentimentAnalysisPipeline",
     "fetch_all_feeds",
     "process_article",
+    "process_articles",
     "SentimentAnalyzer",
     "DataStorage",
 ]
+
+# Public names are imported on first access so that importing the package
+# does not pull in torch, transformers or pandas
+_EXPORTS = {
+    "SentimentAnalysisPipeline": ".pipeline",
+    "fetch_all_feeds": ".news_ingestion",
+    "process_article": ".text_processor",
+    "process_articles": ".text_processor",
+    "SentimentAnalyzer": ".sentiment_analyzer",
+    "DataStorage": ".storage",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
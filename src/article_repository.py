@@ -0,0 +1,322 @@
+"""
+Indexed SQLite repository of scored articles.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import serialization
+from .config import ARTICLE_DB
+
+logger = logging.getLogger(__name__)
+
+ORDERINGS = {
+    "score": "score DESC",
+    "date": "date DESC, rowid DESC",
+}
+
+
+def article_date(record: Dict[str, Any]) -> str:
+    """
+    Get the date of a record from its ingestion or processing time.
+
+    Args:
+        record (Dict[str, Any]): Article record
+
+    Returns:
+        str: Date as YYYY-MM-DD, today when the record carries no time
+    """
+    stamp = record.get("timestamp") or record.get("processed_at")
+    if isinstance(stamp, str) and len(stamp) >= 10:
+        return stamp[:10]
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+class ArticleRepository:
+    """
+    Scored articles in SQLite, indexed for the queries the web apps run.
+
+    Filter columns are stored next to the full JSON record. Indexes on
+    (date, label, score), (label, score) and (source, date), plus the link
+    primary key, let a report page read only the rows it shows instead of
+    loading and filtering the whole history.
+    """
+
+    def __init__(self, path: str = ARTICLE_DB["path"]):
+        """
+        Open (or create) the repository.
+
+        Args:
+            path (str): SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            "link TEXT PRIMARY KEY, date TEXT NOT NULL, source TEXT, "
+            "label TEXT, score REAL, record TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_date_label_score "
+            "ON articles (date, label, score)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_label_score "
+            "ON articles (label, score)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source_date "
+            "ON articles (source, date)"
+        )
+        self._conn.commit()
+
+    def upsert(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Insert records in one transaction, replacing those with the same link.
+
+        Args:
+            records (List[Dict[str, Any]]): Scored articles
+
+        Returns:
+            int: Number of records written
+        """
+        rows = []
+        for record in records:
+            if not record.get("link"):
+                logger.warning("Skipping article without a link")
+                continue
+            sentiment = record.get("sentiment") or {}
+            rows.append(
+                (
+                    record["link"],
+                    article_date(record),
+                    record.get("source"),
+                    sentiment.get("label"),
+                    sentiment.get("score"),
+                    serialization.dumps(record),
+                )
+            )
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO articles "
+                        "(link, date, source, label, score, record) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT(link) DO UPDATE SET date = excluded.date, "
+                        "source = excluded.source, label = excluded.label, "
+                        "score = excluded.score, record = excluded.record",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                logger.error("Error writing article repository: %s", str(e))
+                return 0
+        return len(rows)
+
+    @staticmethod
+    def _where(
+        start: Optional[str],
+        end: Optional[str],
+        source: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause of a query and its parameters."""
+        clauses, params = [], []
+        if start and start == end:
+            # Equality lets SQLite walk the index already sorted by score
+            clauses.append("date = ?")
+            params.append(start)
+        else:
+            if start:
+                clauses.append("date >= ?")
+                params.append(start)
+            if end:
+                clauses.append("date <= ?")
+                params.append(end)
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if label is not None:
+            clauses.append("label = ?")
+            params.append(label)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _fetch(self, sql: str, params: List[Any]) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: Optional[str] = None,
+        label: Optional[str] = None,
+        order_by: str = "score",
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the articles matching the filters, one page at a time.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+            source (Optional[str]): Only articles from this source
+            label (Optional[str]): Only articles with this sentiment label
+            order_by (str): "score" (highest first) or "date" (newest first)
+            limit (Optional[int]): Page size, everything if None
+            offset (int): Matching articles skipped before the page
+
+        Returns:
+            List[Dict[str, Any]]: Article records
+        """
+        if order_by not in ORDERINGS:
+            raise ValueError(f"Unknown ordering '{order_by}'")
+        where, params = self._where(start, end, source, label)
+        sql = f"SELECT record FROM articles{where} ORDER BY {ORDERINGS[order_by]}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+        return [serialization.loads(row[0]) for row in self._fetch(sql, params)]
+
+    def iter_records(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the articles of a date range, one page in memory at a time.
+
+        Pages continue after the last (date, rowid) read rather than at an
+        offset, so each one is a range scan.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+            page_size (int): Rows fetched per query
+
+        Yields:
+            Dict[str, Any]: Article records by date, then insertion order
+        """
+        where, params = self._where(start, end)
+        where += " AND " if where else " WHERE "
+        last: Tuple[str, int] = ("", 0)
+        while True:
+            rows = self._fetch(
+                f"SELECT date, rowid, record FROM articles{where}"
+                "(date, rowid) > (?, ?) ORDER BY date, rowid LIMIT ?",
+                params + [*last, page_size],
+            )
+            for row in rows:
+                yield serialization.loads(row[2])
+            if len(rows) < page_size:
+                return
+            last = rows[-1][:2]
+
+    def count(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> int:
+        """
+        Count the articles matching the filters.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+            source (Optional[str]): Only articles from this source
+            label (Optional[str]): Only articles with this sentiment label
+
+        Returns:
+            int: Number of articles
+        """
+        where, params = self._where(start, end, source, label)
+        return self._fetch(f"SELECT COUNT(*) FROM articles{where}", params)[0][0]
+
+    def sources(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get the sources with articles in a date range.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            List[str]: Source names, sorted
+        """
+        where, params = self._where(start, end)
+        rows = self._fetch(
+            f"SELECT DISTINCT source FROM articles{where} ORDER BY source", params
+        )
+        return [row[0] for row in rows if row[0] is not None]
+
+    def sentiment_distribution(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Count the articles of a date range per sentiment label.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            Dict[str, int]: Articles per label
+        """
+        where, params = self._where(start, end)
+        distribution = {"Positive": 0, "Neutral": 0, "Negative": 0}
+        for label, count in self._fetch(
+            f"SELECT label, COUNT(*) FROM articles{where} GROUP BY label", params
+        ):
+            if label is not None:
+                distribution[label] = count
+        return distribution
+
+    def source_stats(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Count the articles of a date range per source and sentiment label.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            Dict[str, Dict[str, int]]: Lowercase label counts per source
+        """
+        where, params = self._where(start, end)
+        stats: Dict[str, Dict[str, int]] = {}
+        for source, label, count in self._fetch(
+            f"SELECT source, label, COUNT(*) FROM articles{where} "
+            "GROUP BY source, label",
+            params,
+        ):
+            if source is None or label is None:
+                continue
+            counts = stats.setdefault(
+                source, {"positive": 0, "neutral": 0, "negative": 0}
+            )
+            counts[label.lower()] = count
+        return stats
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,265 @@
+"""
+Compact in-memory representations of scored articles.
+
+Stages exchange articles as plain dicts, which stay the format of storage,
+checkpoints and the web apps. ``Article`` holds the same record in slots for
+large in-memory collections, converting to and from dicts at the edges, and
+``ArticleBatch`` keeps the scores and label and source codes of a list of
+articles in NumPy arrays for aggregations.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+UNKNOWN_LABEL = "Unknown"
+
+
+class SentimentResult:
+    """Sentiment label and confidence score of one article."""
+
+    __slots__ = ("label", "score")
+
+    def __init__(self, label: str, score: float):
+        """
+        Args:
+            label (str): Sentiment label, e.g. "Positive"
+            score (float): Confidence of the label
+        """
+        self.label = label
+        self.score = score
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SentimentResult":
+        """
+        Build a result from its dict form.
+
+        Args:
+            data (Dict[str, Any]): Dict with "label" and "score" keys
+
+        Returns:
+            SentimentResult: The result
+        """
+        return cls(data.get("label", UNKNOWN_LABEL), data.get("score", 0.0))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the dict form stored with articles.
+
+        Returns:
+            Dict[str, Any]: Dict with "label" and "score" keys
+        """
+        return {"label": self.label, "score": self.score}
+
+    def __repr__(self) -> str:
+        return f"SentimentResult({self.label!r}, {self.score!r})"
+
+
+class Article:
+    """
+    Article record with one slot per field set along the pipeline.
+
+    Fields missing from the source dict stay unset and read as None, so that
+    ``to_dict`` gives back exactly the keys it was built from, explicit None
+    values included. Keys without a slot are kept in ``extra``.
+    """
+
+    FIELDS = (
+        "title",
+        "summary",
+        "link",
+        "guid",
+        "published",
+        "source",
+        "timestamp",
+        "processed_text",
+        "processed_at",
+        "text_length",
+        "cluster_id",
+        "duplicate_of",
+        "sentiment",
+    )
+    __slots__ = FIELDS + ("extra",)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for unset slots and unknown names
+        if name in Article.FIELDS:
+            return None
+        raise AttributeError(name)
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "Article":
+        """
+        Build an article from its dict form.
+
+        Args:
+            record (Dict[str, Any]): Article record
+
+        Returns:
+            Article: The article, sharing the record's values
+        """
+        article = cls.__new__(cls)
+        extra = None
+        for key, value in record.items():
+            if key == "sentiment" and isinstance(value, dict):
+                article.sentiment = SentimentResult.from_dict(value)
+            elif key in _FIELD_NAMES:
+                setattr(article, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        article.extra = extra
+        return article
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the dict form of the article, e.g. to serialize it.
+
+        Returns:
+            Dict[str, Any]: Article record
+        """
+        record = {}
+        for name, member in _MEMBERS:
+            try:
+                record[name] = member.__get__(self, Article)
+            except AttributeError:
+                continue
+        sentiment = record.get("sentiment")
+        if isinstance(sentiment, SentimentResult):
+            record["sentiment"] = sentiment.to_dict()
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+
+_FIELD_NAMES = frozenset(Article.FIELDS)
+# Slot descriptors raise AttributeError for unset fields, unlike getattr
+_MEMBERS = [(name, Article.__dict__[name]) for name in Article.FIELDS]
+
+
+class ArticleBatch:
+    """
+    Columnar view of scored articles for aggregations.
+
+    Scores are a float32 array; labels and sources are integer codes into
+    ``labels`` and ``sources``, numbered in order of first appearance.
+    Counting, ranking and averaging then run in NumPy instead of walking
+    nested dicts. The articles themselves are kept, not copied.
+    """
+
+    __slots__ = (
+        "articles",
+        "scores",
+        "label_codes",
+        "labels",
+        "source_codes",
+        "sources",
+    )
+
+    def __init__(self, articles: Sequence[Union[Dict[str, Any], Article]]):
+        """
+        Args:
+            articles (Sequence[Union[Dict[str, Any], Article]]): Scored
+                articles, as dicts or ``Article`` records
+        """
+        self.articles = articles
+        label_index: Dict[str, int] = {}
+        source_index: Dict[Optional[str], int] = {}
+        label_codes, source_codes, scores = [], [], []
+        for article in articles:
+            if isinstance(article, Article):
+                sentiment, source = article.sentiment, article.source
+                label = sentiment.label if sentiment is not None else UNKNOWN_LABEL
+                score = sentiment.score if sentiment is not None else np.nan
+            else:
+                sentiment, source = article.get("sentiment"), article.get("source")
+                label = sentiment.get("label") if sentiment else UNKNOWN_LABEL
+                score = sentiment.get("score", np.nan) if sentiment else np.nan
+            label_codes.append(label_index.setdefault(label, len(label_index)))
+            source_codes.append(source_index.setdefault(source, len(source_index)))
+            scores.append(score)
+        self.labels = list(label_index)
+        self.sources = list(source_index)
+        self.label_codes = np.array(label_codes, dtype=np.int16)
+        self.source_codes = np.array(source_codes, dtype=np.int32)
+        self.scores = np.array(scores, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def label_counts(self) -> Dict[str, int]:
+        """
+        Count the articles per sentiment label.
+
+        Returns:
+            Dict[str, int]: Articles per label, in order of first appearance
+        """
+        counts = np.bincount(self.label_codes, minlength=len(self.labels))
+        return dict(zip(self.labels, counts.tolist()))
+
+    def source_label_matrix(self) -> np.ndarray:
+        """
+        Count the articles per source and sentiment label.
+
+        Returns:
+            np.ndarray: ``(len(sources), len(labels))`` counts
+        """
+        shape = (len(self.sources), len(self.labels))
+        flat = self.source_codes * shape[1] + self.label_codes
+        return np.bincount(flat, minlength=shape[0] * shape[1]).reshape(shape)
+
+    def source_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count the articles per source and lowercase sentiment label.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Counts per source, always including
+                "positive", "neutral" and "negative"
+        """
+        matrix = self.source_label_matrix()
+        names = [label.lower() for label in self.labels]
+        stats = {}
+        for source, row in zip(self.sources, matrix.tolist()):
+            counts = {"positive": 0, "neutral": 0, "negative": 0}
+            counts.update(zip(names, row))
+            stats[source] = counts
+        return stats
+
+    def mean_score(self, label: Optional[str] = None) -> float:
+        """
+        Average the scores of all articles or of one label.
+
+        Args:
+            label (Optional[str]): Only average articles with this label
+
+        Returns:
+            float: Mean score, NaN without matching articles
+        """
+        scores = self.scores
+        if label is not None:
+            if label not in self.labels:
+                return float("nan")
+            scores = scores[self.label_codes == self.labels.index(label)]
+        return float(np.nanmean(scores)) if len(scores) else float("nan")
+
+    def top(self, label: str, k: int) -> List[Union[Dict[str, Any], Article]]:
+        """
+        Rank articles by their score for one label, other articles scoring 0.
+
+        Ties keep their input order, as with a stable ``sorted``, so fewer
+        than ``k`` matching articles are padded with the first others.
+
+        Args:
+            label (str): Sentiment label to rank by
+            k (int): Number of articles to return
+
+        Returns:
+            List[Union[Dict[str, Any], Article]]: Highest ranked articles
+        """
+        keys = np.zeros(len(self.articles), dtype=np.float32)
+        if label in self.labels:
+            mask = self.label_codes == self.labels.index(label)
+            keys[mask] = self.scores[mask]
+        order = np.argsort(-keys, kind="stable")[:k]
+        return [self.articles[i] for i in order.tolist()]
@@ -0,0 +1,248 @@
+"""
+Concurrent RSS ingestion over a pooled asyncio HTTP client.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+import feedparser
+from multidict import CIMultiDictProxy
+
+from .config import ASYNC_INGESTION, FEED_STATE, RATE_LIMIT, USER_AGENT
+from .feed_state import CHANGED, NOT_MODIFIED, UNCHANGED, FeedStateStore, content_hash
+from .news_ingestion import NewsFetcher, parse_feed
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Asyncio token bucket allowing short bursts at a steady average rate."""
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_second (float): Tokens added per second
+            capacity (float): Maximum number of stored tokens
+        """
+        self.rate = rate_per_second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """Per-host token buckets so that slow hosts never delay other hosts."""
+
+    def __init__(self, requests_per_minute: int, burst: int):
+        """
+        Args:
+            requests_per_minute (int): Sustained request rate per host
+            burst (int): Requests a host may receive back to back
+        """
+        self.rate = requests_per_minute / 60.0
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    async def wait(self, url: str):
+        """
+        Wait for the rate limit of the URL's host.
+
+        Args:
+            url (str): Request URL
+        """
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        await self._buckets[host].acquire()
+
+
+class AsyncNewsFetcher:
+    """Fetch many feeds concurrently with retries and per-host politeness."""
+
+    def __init__(
+        self,
+        max_connections: int = ASYNC_INGESTION["max_connections"],
+        requests_per_minute: int = ASYNC_INGESTION["requests_per_minute_per_host"],
+        burst: int = ASYNC_INGESTION["burst"],
+        feed_state: Optional[FeedStateStore] = None,
+    ):
+        """
+        Args:
+            max_connections (int): Pooled connections across all hosts
+            requests_per_minute (int): Sustained request rate per host
+            burst (int): Requests a host may receive back to back
+            feed_state (Optional[FeedStateStore]): Conditional GET validators;
+                defaults to the configured store when enabled
+        """
+        self.max_connections = max_connections
+        self.rate_limiter = HostRateLimiter(requests_per_minute, burst)
+        if feed_state is None and FEED_STATE["enabled"]:
+            feed_state = FeedStateStore()
+        self.feed_state = feed_state
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            headers={"User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=RATE_LIMIT["timeout"]),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    async def _download(self, feed_url: str) -> Tuple[int, CIMultiDictProxy, bytes]:
+        """Download a feed, retrying transient failures with backoff."""
+        headers = (
+            self.feed_state.conditional_headers(feed_url) if self.feed_state else {}
+        )
+        attempts = RATE_LIMIT["retry_attempts"]
+        for attempt in range(attempts + 1):
+            await self.rate_limiter.wait(feed_url)
+            try:
+                async with self.session.get(feed_url, headers=headers) as response:
+                    if response.status not in RETRY_STATUSES or attempt == attempts:
+                        response.raise_for_status()
+                        body = await response.read()
+                        return response.status, response.headers, body
+                    logger.warning(
+                        "Retrying %s after HTTP %d", feed_url, response.status
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt == attempts:
+                    raise
+                logger.warning("Retrying %s after error: %s", feed_url, str(e))
+            await asyncio.sleep(RATE_LIMIT["retry_delay"] * 2**attempt)
+        raise RuntimeError("unreachable")
+
+    async def fetch_feed(self, feed_url: str) -> Optional[feedparser.FeedParserDict]:
+        """
+        Fetch and parse a single RSS feed.
+
+        Feeds that did not change since the last fetch (304 response or
+        identical body) are not parsed.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+
+        Returns:
+            Optional[feedparser.FeedParserDict]: Parsed feed or None if failed
+            or unchanged
+        """
+        try:
+            status, headers, content = await self._download(feed_url)
+
+            if self.feed_state:
+                if status == 304:
+                    self.feed_state.record(feed_url, NOT_MODIFIED)
+                    return None
+                body_hash = content_hash(content)
+                if self.feed_state.is_unchanged(feed_url, body_hash):
+                    self.feed_state.record(feed_url, UNCHANGED)
+                    return None
+
+            # Parsing is CPU bound, keep it off the event loop
+            feed = await asyncio.to_thread(parse_feed, content)
+            if feed.bozo:
+                logger.warning(
+                    "Feed parsing issues for %s: %s", feed_url, feed.bozo_exception
+                )
+
+            if self.feed_state:
+                self.feed_state.stage(
+                    feed_url,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    body_hash,
+                )
+                self.feed_state.record(feed_url, CHANGED)
+            return feed
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Failed to fetch feed %s: %s", feed_url, str(e))
+            return None
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Unexpected error fetching feed %s: %s", feed_url, str(e))
+            return None
+
+    async def fetch_source(self, source: str, feed_url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch one feed and extract its articles.
+
+        Args:
+            source (str): Source name
+            feed_url (str): URL of the RSS feed
+
+        Returns:
+            List[Dict[str, Any]]: Articles of the feed (empty on failure)
+        """
+        feed = await self.fetch_feed(feed_url)
+        if feed is None:
+            return []
+        articles = NewsFetcher.process_feed(feed, source)
+        logger.info("Successfully fetched %d articles from %s", len(articles), source)
+        return articles
+
+    async def fetch_all(self, feeds: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Fetch all feeds concurrently.
+
+        Args:
+            feeds (Dict[str, str]): Source name to feed URL
+
+        Returns:
+            List[Dict[str, Any]]: Combined articles, in the order of ``feeds``
+        """
+        per_feed = await asyncio.gather(
+            *(self.fetch_source(source, url) for source, url in feeds.items())
+        )
+        return [article for articles in per_feed for article in articles]
+
+
+async def fetch_all_feeds_async(
+    feeds: Dict[str, str], feed_state: Optional[FeedStateStore] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch articles from all feeds concurrently.
+
+    Args:
+        feeds (Dict[str, str]): Source name to feed URL
+        feed_state (Optional[FeedStateStore]): Conditional GET validators,
+            committed by their owner once the articles are saved; by default
+            the configured store, committed here
+
+    Returns:
+        List[Dict[str, Any]]: Combined list of articles from all feeds
+    """
+    async with AsyncNewsFetcher(feed_state=feed_state) as fetcher:
+        articles = await fetcher.fetch_all(feeds)
+        if fetcher.feed_state:
+            if feed_state is None:
+                fetcher.feed_state.commit()
+            fetcher.feed_state.log_summary()
+    logger.info("Total articles fetched: %d", len(articles))
+    return articles
@@ -0,0 +1,134 @@
+"""
+On-disk checkpoints letting a failed pipeline run resume where it stopped.
+"""
+
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Dict, List
+
+from . import serialization
+from .config import CHECKPOINTS
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+
+
+def _write_json_atomic(path: str, data: Any):
+    """Write JSON to a temporary file, sync it and rename it over ``path``."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(serialization.dumps_bytes(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class CheckpointStore:
+    """
+    Outputs of the completed stages of the current run.
+
+    Each stage output is a JSON file replaced atomically, and the manifest
+    listing completed stages is only updated once that file is in place, so
+    a crash leaves either the previous or the new checkpoint, never a torn
+    one. Long stages can also append batches to a JSON Lines file; a line
+    cut short by a crash is ignored on load.
+    """
+
+    def __init__(self, directory: str = CHECKPOINTS["directory"]):
+        """
+        Args:
+            directory (str): Directory holding the checkpoint files
+        """
+        self.directory = directory
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _manifest(self) -> Dict[str, Any]:
+        try:
+            return serialization.load(self._path(MANIFEST))
+        except FileNotFoundError:
+            return {"started_at": None, "stages": []}
+
+    def completed_stages(self) -> List[str]:
+        """
+        Get the stages whose output is checkpointed, in completion order.
+
+        Returns:
+            List[str]: Stage names
+        """
+        return self._manifest()["stages"]
+
+    def save_stage(self, stage: str, data: Any = None):
+        """
+        Checkpoint the output of a completed stage.
+
+        Args:
+            stage (str): Stage name
+            data (Any): JSON-serializable stage output; None records the
+                stage as done without storing anything
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        if data is not None:
+            _write_json_atomic(self._path(f"{stage}.json"), data)
+        manifest = self._manifest()
+        manifest["started_at"] = manifest["started_at"] or datetime.now().isoformat()
+        if stage not in manifest["stages"]:
+            manifest["stages"].append(stage)
+        _write_json_atomic(self._path(MANIFEST), manifest)
+        logger.debug("Checkpointed stage %s", stage)
+
+    def load_stage(self, stage: str) -> Any:
+        """
+        Load the checkpointed output of a stage.
+
+        Args:
+            stage (str): Stage name
+
+        Returns:
+            Any: Stage output
+        """
+        return serialization.load(self._path(f"{stage}.json"))
+
+    def append_batch(self, stage: str, batch: Dict[str, Any]):
+        """
+        Durably append one batch of a stage still in progress.
+
+        Args:
+            stage (str): Stage name
+            batch (Dict[str, Any]): JSON-serializable batch record
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(f"{stage}.batches.jsonl"), "ab") as f:
+            f.write(serialization.dumps_line(batch))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def load_batches(self, stage: str) -> List[Dict[str, Any]]:
+        """
+        Load the batches appended for a stage, dropping a torn last line.
+
+        Args:
+            stage (str): Stage name
+
+        Returns:
+            List[Dict[str, Any]]: Batch records in append order
+        """
+        batches = []
+        try:
+            with open(self._path(f"{stage}.batches.jsonl"), "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        logger.warning("Ignoring incomplete %s batch", stage)
+                        break
+                    batches.append(serialization.loads(line))
+        except FileNotFoundError:
+            pass
+        return batches
+
+    def clear(self):
+        """Remove all checkpoints."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,281 @@
+"""
+Columnar article store in Parquet or Arrow IPC, for analytics over history.
+
+Requires pyarrow (``pip install pyarrow``).
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .config import COLUMNAR_STORE
+from .storage import PartitionedStore
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.ipc as ipc
+    import pyarrow.parquet as pq
+    from pyarrow import fs
+except ImportError:  # pragma: no cover - exercised without pyarrow
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+_STRING_COLUMNS = ["link", "title", "published", "cluster_id"]
+# Few distinct values repeated across articles, stored dictionary-encoded
+_CATEGORICAL_COLUMNS = ["source", "label"]
+
+
+def is_available() -> bool:
+    """
+    Check whether pyarrow can be imported.
+
+    Returns:
+        bool: True if the columnar store can be used
+    """
+    return pa is not None
+
+
+def _schema():
+    """Schema of the segments; the date comes from the partition."""
+    return pa.schema(
+        [(name, pa.string()) for name in _STRING_COLUMNS]
+        + [
+            (name, pa.dictionary(pa.int32(), pa.string()))
+            for name in _CATEGORICAL_COLUMNS
+        ]
+        + [("score", pa.float32()), ("timestamp", pa.timestamp("us"))]
+    )
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def to_table(records: List[Dict[str, Any]]):
+    """
+    Flatten scored articles into a columnar table in one pass.
+
+    The sentiment dict becomes ``label`` and ``score`` columns; article
+    texts are left out, the full records stay in the article store.
+
+    Args:
+        records (List[Dict[str, Any]]): Scored articles
+
+    Returns:
+        pyarrow.Table: One row per article
+    """
+    columns: Dict[str, List[Any]] = {
+        name: [] for name in _STRING_COLUMNS + _CATEGORICAL_COLUMNS
+    }
+    scores, timestamps = [], []
+    for record in records:
+        sentiment = record.get("sentiment") or {}
+        for name in _STRING_COLUMNS:
+            columns[name].append(record.get(name))
+        columns["source"].append(record.get("source"))
+        columns["label"].append(sentiment.get("label"))
+        scores.append(sentiment.get("score"))
+        timestamps.append(
+            _parse_timestamp(record.get("timestamp") or record.get("processed_at"))
+        )
+    columns["score"] = scores
+    columns["timestamp"] = timestamps
+    return pa.Table.from_pydict(columns, schema=_schema())
+
+
+def _write_file(table, path: str, file_format: str):
+    if file_format == "parquet":
+        pq.write_table(table, path, compression="zstd")
+    else:
+        with pa.OSFile(path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+class ColumnarStore(PartitionedStore):
+    """
+    Date-partitioned columnar copy of the scored articles.
+
+    Segments are Parquet or Arrow IPC files laid out like the article store
+    (``date=YYYY-MM-DD/part-*``), so appends, crash-safe compaction and
+    date pruning are shared with it. ``scan`` reads through memory maps and
+    hands column projection and filters to pyarrow, which skips Parquet row
+    groups whose statistics rule them out; nothing is turned into Python
+    dicts unless ``read`` is called.
+    """
+
+    def __init__(
+        self,
+        root: str = COLUMNAR_STORE["root"],
+        file_format: str = COLUMNAR_STORE["format"],
+        compact_min_segments: int = COLUMNAR_STORE["compact_min_segments"],
+        compact_target_bytes: int = COLUMNAR_STORE["compact_target_bytes"],
+    ):
+        """
+        Args:
+            root (str): Directory holding the partitions
+            file_format (str): "parquet" or "arrow" (IPC file format)
+            compact_min_segments (int): Small segments a partition must have
+                before they are merged
+            compact_target_bytes (int): Segments at least this large are not
+                merged any further
+        """
+        if pa is None:
+            raise ImportError(
+                "The columnar store requires pyarrow: pip install pyarrow"
+            )
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown columnar format '{file_format}'")
+        super().__init__(root, compact_min_segments, compact_target_bytes)
+        self.file_format = file_format
+        self.suffix = FORMATS[file_format]
+        self._filesystem = fs.LocalFileSystem(use_mmap=True)
+
+    def _write_table(self, table, path: str):
+        """Write a table to a temporary file, then rename it over ``path``."""
+        tmp_path = f"{path}.tmp"
+        _write_file(table, tmp_path, self.file_format)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _read_table(self, path: str):
+        if self.file_format == "parquet":
+            return pq.read_table(path, memory_map=True)
+        with pa.memory_map(path) as source:
+            return ipc.open_file(source).read_all()
+
+    def _write_segment(self, path: str, records: List[Dict[str, Any]]):
+        self._write_table(to_table(records), path)
+
+    def _read_segment(self, path: str) -> List[Dict[str, Any]]:
+        date = os.path.basename(os.path.dirname(path)).split("=", 1)[1]
+        rows = self._read_table(path).to_pylist()
+        for row in rows:
+            row["date"] = date
+            row["sentiment"] = {"label": row.pop("label"), "score": row.pop("score")}
+        return rows
+
+    def _merge_segments(self, paths: List[str], output: str):
+        tables = [self._read_table(path) for path in paths]
+        # Each segment has its own dictionaries, unify them before writing
+        self._write_table(pa.concat_tables(tables).unify_dictionaries(), output)
+
+    def scan(
+        self,
+        columns: Optional[List[str]] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        source: Optional[str] = None,
+        label: Optional[str] = None,
+        min_score: Optional[float] = None,
+    ):
+        """
+        Read selected columns of the articles matching the filters.
+
+        Args:
+            columns (Optional[List[str]]): Columns to read, all by default;
+                ``date`` is available as a column too
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+            source (Optional[str]): Only articles from this source
+            label (Optional[str]): Only articles with this sentiment label
+            min_score (Optional[float]): Only articles scored at least this
+
+        Returns:
+            pyarrow.Table: Matching rows, by date then write order
+        """
+        paths = [
+            path
+            for date in self.partitions()
+            if not ((start and date < start) or (end and date > end))
+            for path in self.segments(date)
+        ]
+        schema = _schema().append(pa.field("date", pa.string()))
+        if not paths:
+            empty = schema.empty_table()
+            return empty.select(columns) if columns is not None else empty
+
+        dataset = ds.dataset(
+            paths,
+            schema=schema,
+            format="parquet" if self.file_format == "parquet" else "ipc",
+            filesystem=self._filesystem,
+            partitioning=ds.partitioning(
+                pa.schema([("date", pa.string())]), flavor="hive"
+            ),
+            partition_base_dir=os.path.abspath(self.root),
+        )
+        conditions = []
+        if source is not None:
+            conditions.append(pc.field("source") == source)
+        if label is not None:
+            conditions.append(pc.field("label") == label)
+        if min_score is not None:
+            conditions.append(pc.field("score") >= min_score)
+        condition = None
+        for expression in conditions:
+            condition = expression if condition is None else condition & expression
+        # Segments are encoded separately, give each column one dictionary
+        return dataset.to_table(columns=columns, filter=condition).unify_dictionaries()
+
+    def daily_sentiment(self, start: Optional[str] = None, end: Optional[str] = None):
+        """
+        Count articles and average their score per date and label.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            pyarrow.Table: Columns date, label, count and mean_score
+        """
+        table = self.scan(["date", "label", "score"], start, end)
+        grouped = table.group_by(["date", "label"]).aggregate(
+            [("score", "count"), ("score", "mean")]
+        )
+        # One row per group left, decode the labels so that they can be sorted
+        grouped = pa.table(
+            {
+                "date": grouped.column("date"),
+                "label": grouped.column("label").cast(pa.string()),
+                "count": grouped.column("score_count"),
+                "mean_score": grouped.column("score_mean"),
+            }
+        )
+        return grouped.sort_by([("date", "ascending"), ("label", "ascending")])
+
+    def export(
+        self,
+        path: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Export a date range to one Parquet (``.parquet``) or Arrow IPC file.
+
+        Args:
+            path (str): Output file; any other extension is written as IPC
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+            columns (Optional[List[str]]): Columns to export, all by default
+
+        Returns:
+            int: Number of rows exported
+        """
+        table = self.scan(columns, start, end)
+        _write_file(table, path, "parquet" if path.endswith(".parquet") else "arrow")
+        logger.info("Exported %d rows to %s", table.num_rows, path)
+        return table.num_rows
@@ -19,14 +19,144 @@ RATE_LIMIT = {
     "timeout": 10,  # seconds
 }
 
+# Concurrent ingestion settings (per-host token buckets replace the global limiter)
+ASYNC_INGESTION = {
+    "enabled": True,
+    "max_connections": 20,  # Pooled connections across all hosts
+    "requests_per_minute_per_host": 30,
+    "burst": 2,  # Requests a host may receive back to back
+}
+
 # Model settings
 MODEL_NAME = "yiyanghkust/finbert-tone"
+MODEL_REVISION = "main"  # Hub branch, tag or commit to load
+INFERENCE_BACKEND = "pytorch"  # One of "pytorch", "pytorch-int8", "onnx"
+CASCADE_THRESHOLD = None  # Lexicon confidence needed to skip FinBERT (None disables)
+
+# Multi-process scoring settings (workers x threads_per_worker <= cores)
+PARALLEL_SCORING = {
+    "workers": 1,  # 1 scores in-process
+    "threads_per_worker": None,  # None splits the cores evenly between workers
+    "shard_size": 256,  # Texts sent to a worker per task
+}
 MAX_LENGTH = 512  # Maximum sequence length for the model
+# Texts over MAX_LENGTH tokens are truncated, or scored as overlapping windows
+LONG_TEXTS = {
+    "mode": "truncate",  # "truncate" or "chunk"
+    "stride": 64,  # Tokens shared by consecutive windows
+    "max_windows": 8,  # Windows scored per text, from the start
+    "aggregation": "mean",  # "mean", "max_negative" or "length_weighted"
+}
+BATCH_SIZE = 32  # Maximum number of texts scored per forward pass
+MAX_BATCH_TOKENS = 8192  # Padded token budget per forward pass (None disables)
 
 # File paths
 DATA_DIR = "data"
 RESULTS_FILE = f"{DATA_DIR}/sentiment_results.json"
 
+# Store the scored articles are saved to and read back from: "repository"
+# (ARTICLE_DB), "articles" (ARTICLE_STORE) or "json" (RESULTS_FILE, rewritten
+# on every save). The other stores only get a copy when enabled.
+STORAGE = {
+    "primary": "repository",
+}
+
+# Append-only store of scored articles, one directory per date
+ARTICLE_STORE = {
+    "enabled": False,  # Copy when not the primary store
+    "root": f"{DATA_DIR}/articles",
+    "compact_min_segments": 8,  # Small segments that trigger a merge
+    "compact_target_bytes": 64 * 2**20,  # Segments this large are not merged
+}
+
+# Columnar copy of the scored articles for analytics, needs pyarrow
+COLUMNAR_STORE = {
+    "enabled": False,  # Opt-in copy, skipped with a warning without pyarrow
+    "root": f"{DATA_DIR}/columnar",
+    "format": "parquet",  # "parquet" or "arrow" (IPC file format)
+    "compact_min_segments": 8,
+    "compact_target_bytes": 64 * 2**20,
+}
+
+# Indexed SQLite repository of the scored articles queried by the web apps
+ARTICLE_DB = {
+    "enabled": False,  # Copy when not the primary store, for the web apps
+    "path": f"{DATA_DIR}/articles.sqlite3",
+}
+
+# Sentiment result cache settings
+SENTIMENT_CACHE = {
+    "enabled": True,
+    "path": f"{DATA_DIR}/sentiment_cache.sqlite3",
+    "memory_entries": 10_000,  # In-process LRU size
+    "disk_entries": 1_000_000,  # On-disk size before least recently used eviction
+}
+
+# Conditional GET validators (ETag, Last-Modified, body hash) kept between runs
+FEED_STATE = {
+    "enabled": True,
+    "path": f"{DATA_DIR}/feed_state.json",
+}
+
+# Adaptive per-feed polling (seconds)
+FEED_SCHEDULER = {
+    "initial_interval": 300,
+    "min_interval": 60,
+    "max_interval": 3600,
+    "smoothing": 0.3,  # EWMA weight of the newest inter-arrival observation
+    "backoff": 1.5,  # Interval multiplier per consecutive poll without new items
+    "stats_path": f"{DATA_DIR}/feed_scheduler_stats.json",
+}
+
+# Seen-article index so each run only processes new articles
+SEEN_INDEX = {
+    "enabled": True,
+    "path": f"{DATA_DIR}/seen_articles.sqlite3",
+    "ttl_days": 30,  # Keys older than this are compacted away
+}
+
+# Near-duplicate detection of the same story across sources (MinHash LSH)
+NEAR_DUPLICATES = {
+    "enabled": True,
+    "path": f"{DATA_DIR}/fingerprints.sqlite3",
+    "threshold": 0.7,  # Estimated Jaccard similarity of word trigrams for a duplicate
+}
+
+# Streaming execution: stages connected by bounded queues
+STREAMING = {
+    "queue_size": 256,  # Items buffered in front of each stage
+    "ingest_workers": 8,  # Feeds fetched at the same time
+    "preprocess_workers": 1,
+    "score_workers": 1,
+    "score_batch_size": 32,  # Articles per analyzer call
+    "persist_batch_size": 64,  # Articles per append to the results file
+    "batch_timeout": 0.05,  # Seconds a stage waits for a micro-batch to fill
+    "output_path": None,  # JSON Lines file instead of the article store
+}
+
+# Long-running daemon that keeps models, sessions and caches warm
+DAEMON = {
+    "interval": 900,  # Seconds between the starts of two cycles
+    "save_csv": True,
+    "generate_report": True,
+    "metrics_path": f"{DATA_DIR}/daemon_metrics.json",
+}
+
+# Stage checkpoints letting a failed batch run resume with --resume
+CHECKPOINTS = {
+    "enabled": True,
+    "directory": f"{DATA_DIR}/checkpoints",
+    "score_batch_size": 512,  # Articles scored between two checkpoints
+}
+
+# Per-stage time, CPU and memory spans written as one profile per run
+INSTRUMENTATION = {
+    "enabled": False,
+    "memory": "rss",  # "rss", "tracemalloc" (Python heap, slower) or None
+    "profile_dir": f"{DATA_DIR}/profiles",
+    "history": 20,  # Run profiles kept in memory
+}
+
 # Sentiment labels mapping
 SENTIMENT_LABELS = {
     "positive": "Positive",
@@ -36,7 +166,13 @@ SENTIMENT_LABELS = {
 
 # Text preprocessing settings
 MIN_TEXT_LENGTH = 50  # Minimum text length to process
-MAX_TEXT_LENGTH = 1000  # Maximum text length to process
+MAX_TEXT_LENGTH = 20_000  # Safety cap in characters, the model limit is in tokens
+HTML_BACKEND = "auto"  # "selectolax", "lxml", "stream", "bs4" or "auto"
+PREPROCESSING = {
+    "workers": None,  # Preprocessing processes, None uses every core
+    "chunksize": 256,  # Articles sent to a worker per task
+    "min_parallel_batch": 2000,  # Smaller batches are processed in-process
+}
 
 # User agent for requests
 USER_AGENT = (
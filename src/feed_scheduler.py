@@ -0,0 +1,353 @@
+"""
+Adaptive per-feed polling scheduler driven by observed publish rates.
+"""
+
+import argparse
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from dateutil import parser as date_parser
+
+from . import serialization
+from .config import FEED_SCHEDULER, RSS_FEEDS
+from .news_ingestion import NewsFetcher
+
+logger = logging.getLogger(__name__)
+
+RECENT_KEYS = 2000  # Item keys remembered per feed to recognise new items
+
+
+def parse_published(value: str) -> Optional[float]:
+    """
+    Parse a feed ``published`` value into a Unix timestamp.
+
+    Args:
+        value (str): RFC 822 or ISO 8601 date
+
+    Returns:
+        Optional[float]: Timestamp or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return date_parser.parse(value).timestamp()
+    except (ValueError, OverflowError):
+        return None
+
+
+class FeedSchedule:
+    """
+    Learned polling state of one feed.
+
+    The expected time between new items is an EWMA of the gaps between
+    ``published`` timestamps. The next poll is one expected gap away,
+    stretched by ``backoff`` for every consecutive poll that found nothing
+    new, and always kept within ``[min_interval, max_interval]``.
+    """
+
+    def __init__(self, source: str, url: str, settings: Dict[str, Any] = None):
+        """
+        Args:
+            source (str): Source name
+            url (str): Feed URL
+            settings (Dict[str, Any]): Scheduler settings, defaults to
+                ``FEED_SCHEDULER``
+        """
+        self.source = source
+        self.url = url
+        self.settings = settings or FEED_SCHEDULER
+        self.interarrival: Optional[float] = None
+        self.last_published: Optional[float] = None
+        self.consecutive_wasted = 0
+        self.interval = float(self.settings["initial_interval"])
+        self.next_poll = 0.0
+        self.polls = 0
+        self.wasted_polls = 0
+        self.new_items = 0
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.latency_max = 0.0
+        self._recent: "OrderedDict[str, None]" = OrderedDict()
+
+    @staticmethod
+    def _item_key(article: Dict[str, Any]) -> str:
+        """Identify a feed item across polls."""
+        return article.get("guid") or article.get("link") or article.get("title", "")
+
+    def _observe_published(self, published: List[float]):
+        """Fold new publish times into the inter-arrival estimate."""
+        smoothing = self.settings["smoothing"]
+        for timestamp in sorted(published):
+            if self.last_published is not None and timestamp > self.last_published:
+                gap = timestamp - self.last_published
+                self.interarrival = (
+                    gap
+                    if self.interarrival is None
+                    else smoothing * gap + (1 - smoothing) * self.interarrival
+                )
+            if self.last_published is None or timestamp > self.last_published:
+                self.last_published = timestamp
+
+    def _next_interval(self) -> float:
+        """Compute the delay until the next poll."""
+        base = self.interarrival or self.settings["initial_interval"]
+        interval = base * self.settings["backoff"] ** self.consecutive_wasted
+        return min(
+            max(interval, self.settings["min_interval"]), self.settings["max_interval"]
+        )
+
+    def observe(
+        self, articles: List[Dict[str, Any]], now: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Record a poll and schedule the next one.
+
+        Items already present in the first poll were published before the
+        scheduler started, so they train the inter-arrival estimate but are
+        left out of the latency statistics.
+
+        Args:
+            articles (List[Dict[str, Any]]): Articles returned by the poll
+            now (float): Poll time as a Unix timestamp
+
+        Returns:
+            List[Dict[str, Any]]: Articles not seen in earlier polls
+        """
+        new = []
+        for article in articles:
+            key = self._item_key(article)
+            if key in self._recent:
+                continue
+            self._recent[key] = None
+            new.append(article)
+        while len(self._recent) > RECENT_KEYS:
+            self._recent.popitem(last=False)
+
+        published = [
+            timestamp
+            for timestamp in (parse_published(a.get("published", "")) for a in new)
+            if timestamp is not None
+        ]
+        if new and self.polls:
+            for timestamp in published:
+                latency = max(now - timestamp, 0.0)
+                self.latency_sum += latency
+                self.latency_count += 1
+                self.latency_max = max(self.latency_max, latency)
+        self._observe_published(published)
+
+        self.polls += 1
+        self.new_items += len(new)
+        if new:
+            self.consecutive_wasted = 0
+        else:
+            self.consecutive_wasted += 1
+            self.wasted_polls += 1
+        self.interval = self._next_interval()
+        self.next_poll = now + self.interval
+        return new
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the learned rate and polling statistics.
+
+        Returns:
+            Dict[str, Any]: Statistics of this feed
+        """
+        return {
+            "url": self.url,
+            "interval": round(self.interval, 1),
+            "interarrival": (
+                round(self.interarrival, 1) if self.interarrival is not None else None
+            ),
+            "last_published": self.last_published,
+            "polls": self.polls,
+            "wasted_polls": self.wasted_polls,
+            "wasted_ratio": (
+                round(self.wasted_polls / self.polls, 3) if self.polls else 0.0
+            ),
+            "new_items": self.new_items,
+            "mean_latency": (
+                round(self.latency_sum / self.latency_count, 1)
+                if self.latency_count
+                else None
+            ),
+            "max_latency": round(self.latency_max, 1),
+        }
+
+    def restore(self, stats: Dict[str, Any]):
+        """
+        Resume from statistics exported by an earlier run.
+
+        Args:
+            stats (Dict[str, Any]): Output of ``get_stats``
+        """
+        self.interarrival = stats.get("interarrival")
+        self.last_published = stats.get("last_published")
+        self.interval = self._next_interval()
+
+
+class FeedScheduler:
+    """Long-running poller giving each feed its own learned cadence."""
+
+    def __init__(
+        self,
+        feeds: Dict[str, str] = None,
+        fetcher: Optional[NewsFetcher] = None,
+        on_articles: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        stats_path: Optional[str] = FEED_SCHEDULER["stats_path"],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            feeds (Dict[str, str]): Source name to feed URL, defaults to
+                ``RSS_FEEDS``
+            fetcher (Optional[NewsFetcher]): Fetcher used for polling
+            on_articles (Optional[Callable]): Called with the new articles of
+                each poll
+            stats_path (Optional[str]): JSON file the statistics are exported
+                to and resumed from (None disables)
+            clock (Callable[[], float]): Source of the current time
+        """
+        self.fetcher = fetcher or NewsFetcher()
+        self.on_articles = on_articles
+        self.stats_path = stats_path
+        self.clock = clock
+        self.schedules = {
+            source: FeedSchedule(source, url)
+            for source, url in (feeds or RSS_FEEDS).items()
+        }
+        self._restore()
+
+    def _restore(self):
+        """Seed the schedules with statistics from an earlier run."""
+        if not self.stats_path or not os.path.exists(self.stats_path):
+            return
+        try:
+            stats = serialization.load(self.stats_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable scheduler stats: %s", str(e))
+            return
+        for source, schedule in self.schedules.items():
+            if stats.get(source, {}).get("url") == schedule.url:
+                schedule.restore(stats[source])
+
+    def poll(self, source: str) -> List[Dict[str, Any]]:
+        """
+        Poll one feed now and hand its new articles on.
+
+        The feed's validators are committed once its articles are handled,
+        so a poll whose handler fails downloads the feed in full again.
+
+        Args:
+            source (str): Source name
+
+        Returns:
+            List[Dict[str, Any]]: New articles
+        """
+        schedule = self.schedules[source]
+        feed = self.fetcher.fetch_feed(schedule.url)
+        articles = NewsFetcher.process_feed(feed, source) if feed else []
+        new = schedule.observe(articles, self.clock())
+        logger.info(
+            "Polled %s: %d new, next poll in %.0fs",
+            source,
+            len(new),
+            schedule.interval,
+        )
+        handled = True
+        if new and self.on_articles:
+            try:
+                self.on_articles(new)
+            except Exception as e:  # pylint: disable=broad-except
+                handled = False
+                logger.error("Error handling articles from %s: %s", source, str(e))
+        if handled and self.fetcher.feed_state:
+            self.fetcher.feed_state.commit([schedule.url])
+        self.export_stats()
+        return new
+
+    def run(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        max_polls: Optional[int] = None,
+    ):
+        """
+        Poll feeds as they fall due until stopped.
+
+        Args:
+            stop_event (Optional[threading.Event]): Set to stop the loop
+            max_polls (Optional[int]): Stop after this many polls
+        """
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        while not stop_event.is_set() and (max_polls is None or polls < max_polls):
+            schedule = min(self.schedules.values(), key=lambda s: s.next_poll)
+            delay = schedule.next_poll - self.clock()
+            if delay > 0 and stop_event.wait(delay):
+                break
+            self.poll(schedule.source)
+            polls += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-feed latency-to-ingest and wasted-poll statistics.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by source
+        """
+        return {
+            source: schedule.get_stats() for source, schedule in self.schedules.items()
+        }
+
+    def export_stats(self):
+        """Write the statistics to ``stats_path`` atomically."""
+        if not self.stats_path:
+            return
+        try:
+            directory = os.path.dirname(self.stats_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.stats_path}.tmp"
+            serialization.dump(self.get_stats(), tmp_path, pretty=True)
+            os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            logger.error("Error exporting scheduler stats: %s", str(e))
+
+
+def main():
+    """Poll the configured feeds on their learned schedules."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help="Seconds to run before exiting (default: until interrupted)",
+    )
+    args = parser.parse_args()
+
+    scheduler = FeedScheduler()
+    stop_event = threading.Event()
+    if args.duration:
+        timer = threading.Timer(args.duration, stop_event.set)
+        timer.daemon = True
+        timer.start()
+    try:
+        scheduler.run(stop_event)
+    except KeyboardInterrupt:
+        pass
+    for source, stats in scheduler.get_stats().items():
+        logger.info("%s: %s", source, stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Per-feed HTTP validators used to skip feeds that have not changed.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from . import serialization
+from .config import FEED_STATE
+
+logger = logging.getLogger(__name__)
+
+CHANGED = "changed"
+NOT_MODIFIED = "not_modified"  # Server answered 304
+UNCHANGED = "unchanged"  # Body identical to the last fetch
+
+
+def content_hash(body: bytes) -> str:
+    """
+    Hash a feed body.
+
+    Args:
+        body (bytes): Raw response body
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+class FeedStateStore:
+    """
+    JSON store of the ETag, Last-Modified and body hash of each feed.
+
+    Validators are sent back as ``If-None-Match`` / ``If-Modified-Since``
+    so servers can answer 304; servers that ignore them are caught by the
+    body hash instead. Validators of a fetched feed are only staged; they
+    are written by ``commit`` once its articles are saved, so a run that
+    fails fetches them again. Only feeds committed by this instance are
+    written, so several fetchers can share the file.
+    """
+
+    def __init__(self, path: str = FEED_STATE["path"]):
+        """
+        Load the stored validators.
+
+        Args:
+            path (str): JSON file holding the validators
+        """
+        self.path = path
+        self.stats: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._state = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the state file, returning an empty state if it is unusable."""
+        try:
+            return serialization.load(self.path)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable feed state %s: %s", self.path, str(e))
+            return {}
+
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """
+        Build the conditional request headers for a feed.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+
+        Returns:
+            Dict[str, str]: Headers to add to the request (empty on first fetch)
+        """
+        state = self._state.get(feed_url, {})
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+        return headers
+
+    def is_unchanged(self, feed_url: str, body_hash: str) -> bool:
+        """
+        Check whether a body matches the last fetched one.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+            body_hash (str): Hash of the new body
+
+        Returns:
+            bool: True if the feed content did not change
+        """
+        return self._state.get(feed_url, {}).get("hash") == body_hash
+
+    def stage(
+        self,
+        feed_url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: str,
+    ):
+        """
+        Remember the validators of a freshly fetched feed until ``commit``.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+            etag (Optional[str]): ``ETag`` response header
+            last_modified (Optional[str]): ``Last-Modified`` response header
+            body_hash (str): Hash of the response body
+        """
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "hash": body_hash,
+            "updated": datetime.now().isoformat(),
+        }
+        with self._lock:
+            self._pending[feed_url] = entry
+
+    def commit(self, feed_urls: Optional[Iterable[str]] = None):
+        """
+        Persist staged validators, once the articles of their feeds are saved.
+
+        Args:
+            feed_urls (Optional[Iterable[str]]): Feeds to commit, all staged
+                feeds by default
+        """
+        with self._lock:
+            if feed_urls is None:
+                feed_urls = list(self._pending)
+            committed = False
+            for feed_url in feed_urls:
+                entry = self._pending.pop(feed_url, None)
+                if entry is not None:
+                    self._state[feed_url] = entry
+                    self._dirty[feed_url] = entry
+                    committed = True
+            if committed:
+                self._save()
+
+    def discard(self):
+        """Drop staged validators, so their feeds are fetched in full again."""
+        with self._lock:
+            self._pending.clear()
+
+    def _save(self):
+        """Merge this instance's updates into the file and replace it atomically."""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            merged = {**self._read(), **self._dirty}
+            tmp_path = f"{self.path}.tmp"
+            serialization.dump(merged, tmp_path, pretty=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Error saving feed state: %s", str(e))
+
+    def record(self, feed_url: str, status: str):
+        """
+        Count a poll outcome for a feed and log it.
+
+        Args:
+            feed_url (str): URL of the RSS feed
+            status (str): One of ``CHANGED``, ``NOT_MODIFIED``, ``UNCHANGED``
+        """
+        with self._lock:
+            self.stats.setdefault(feed_url, Counter())[status] += 1
+        logger.info("Feed %s: %s", feed_url, status.replace("_", " "))
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get poll outcome counts per feed.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Feed URL to counts per status
+        """
+        with self._lock:
+            return {url: dict(counts) for url, counts in self.stats.items()}
+
+    def log_summary(self):
+        """Log how many polls found changed and unchanged feeds."""
+        totals = Counter()
+        for counts in self.get_stats().values():
+            totals.update(counts)
+        logger.info(
+            "Feed polls: %d changed, %d not modified, %d unchanged",
+            totals[CHANGED],
+            totals[NOT_MODIFIED],
+            totals[UNCHANGED],
+        )
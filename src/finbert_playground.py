@@ -1,15 +1,16 @@
 """
 FinBERT playground web application for interactive sentiment analysis.
+
+Run with ``python -m src.finbert_playground``.
 """
 
 # pylint: disable=import-error
 from flask import Flask, render_template, request
-from transformers import pipeline
 
-app = Flask(__name__)
+from .config import INFERENCE_BACKEND, MAX_LENGTH, MODEL_NAME, MODEL_REVISION
+from .model_registry import get_backend
 
-# Load FinBERT pipeline once at startup
-finbert = pipeline("sentiment-analysis", model="yiyanghkust/finbert-tone")
+app = Flask(__name__)
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -21,10 +22,16 @@ def index():
     if request.method == "POST":
         text = request.form.get("text", "")
         if text.strip():
-            # Get all class probabilities
-            outputs = finbert(text, return_all_scores=True)[0]
-            result = max(outputs, key=lambda x: x["score"])
-            probs = {o["label"]: o["score"] for o in outputs}
+            # FinBERT is shared with the pipeline and loaded on first request
+            finbert = get_backend(MODEL_NAME, INFERENCE_BACKEND, MODEL_REVISION)
+            encoding = finbert.tokenizer(text, truncation=True, max_length=MAX_LENGTH)
+            probabilities = finbert.predict_proba([dict(encoding)])[0]
+            probs = {
+                finbert.id2label[i]: float(score)
+                for i, score in enumerate(probabilities)
+            }
+            label = max(probs, key=probs.get)
+            result = {"label": label, "score": probs[label]}
     return render_template(
         "finbert_playground.html",
         result=result,
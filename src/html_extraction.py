@@ -0,0 +1,191 @@
+"""
+HTML-to-text extraction backends for article summaries.
+
+Every backend drops the same boilerplate elements, skips comments and
+returns the remaining text nodes joined by single spaces, which is what
+``BeautifulSoup.get_text(separator=" ", strip=True)`` followed by whitespace
+normalization produces.
+"""
+
+import logging
+from html.parser import HTMLParser
+from typing import Callable, Dict, List
+
+from .config import HTML_BACKEND
+
+logger = logging.getLogger(__name__)
+
+REMOVED_TAGS = ["script", "style", "nav", "footer", "header", "aside"]
+
+# Up to this many tags the streaming tokenizer beats building a C tree
+AUTO_STREAM_MAX_TAGS = 8
+
+
+def _join_text(parts: List[str]) -> str:
+    """Join text nodes with single spaces, collapsing all whitespace."""
+    return " ".join(" ".join(parts).split())
+
+
+def extract_bs4(raw_html: str) -> str:
+    """
+    Extract text with BeautifulSoup's html.parser tree builder.
+
+    Args:
+        raw_html (str): Raw HTML content
+
+    Returns:
+        str: Cleaned text
+    """
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
+    soup = BeautifulSoup(raw_html, "html.parser")
+    for element in soup(REMOVED_TAGS):
+        element.decompose()
+    # Comments are not NavigableStrings, so get_text leaves them out
+    return _join_text([soup.get_text(separator=" ", strip=True)])
+
+
+def extract_lxml(raw_html: str) -> str:
+    """
+    Extract text with lxml's C HTML parser.
+
+    Args:
+        raw_html (str): Raw HTML content
+
+    Returns:
+        str: Cleaned text
+    """
+    # pylint: disable=import-outside-toplevel
+    import lxml.html
+    from lxml import etree
+
+    if not raw_html.strip():
+        return ""
+    root = lxml.html.fragment_fromstring(raw_html, create_parent="div")
+    etree.strip_elements(root, etree.Comment, *REMOVED_TAGS, with_tail=False)
+    return _join_text(list(root.itertext()))
+
+
+def extract_selectolax(raw_html: str) -> str:
+    """
+    Extract text with selectolax's lexbor HTML5 parser.
+
+    Args:
+        raw_html (str): Raw HTML content
+
+    Returns:
+        str: Cleaned text
+    """
+    # pylint: disable=import-outside-toplevel
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(raw_html)
+    tree.strip_tags(REMOVED_TAGS)
+    if tree.body is None:
+        return ""
+    return _join_text([tree.body.text(separator=" ", strip=True)])
+
+
+class _TextCollector(HTMLParser):
+    """Streaming tokenizer keeping text outside of removed elements."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in REMOVED_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in REMOVED_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def extract_stream(raw_html: str) -> str:
+    """
+    Extract text with the standard library's streaming HTML tokenizer.
+
+    No tree is built, which makes this the cheapest pure-Python path for
+    the short snippets most feeds put in their summaries.
+
+    Args:
+        raw_html (str): Raw HTML content
+
+    Returns:
+        str: Cleaned text
+    """
+    collector = _TextCollector()
+    collector.feed(raw_html)
+    collector.close()
+    return _join_text(collector.parts)
+
+
+BACKENDS: Dict[str, Callable[[str], str]] = {
+    "selectolax": extract_selectolax,
+    "lxml": extract_lxml,
+    "stream": extract_stream,
+    "bs4": extract_bs4,
+}
+
+_MODULES = {"selectolax": "selectolax.lexbor", "lxml": "lxml.html", "bs4": "bs4"}
+
+
+def is_available(name: str) -> bool:
+    """
+    Check whether a backend's optional dependency is installed.
+
+    Args:
+        name (str): Backend name
+
+    Returns:
+        bool: True if the backend can be used
+    """
+    if name not in _MODULES:
+        return name in BACKENDS
+    try:
+        __import__(_MODULES[name])
+        return True
+    except ImportError:
+        return False
+
+
+def get_extractor(name: str = HTML_BACKEND) -> Callable[[str], str]:
+    """
+    Get an extraction backend by name.
+
+    ``"auto"`` sends snippets with few tags to the streaming tokenizer and
+    larger documents to the first installed of lxml and selectolax.
+
+    Args:
+        name (str): One of ``BACKENDS`` or ``"auto"``
+
+    Returns:
+        Callable[[str], str]: Function turning HTML into text
+    """
+    if name == "auto":
+        tree_backend = next(
+            (BACKENDS[n] for n in ("lxml", "selectolax") if is_available(n)),
+            extract_stream,
+        )
+
+        def extract_auto(raw_html: str) -> str:
+            if raw_html.count("<") <= AUTO_STREAM_MAX_TAGS:
+                return extract_stream(raw_html)
+            return tree_backend(raw_html)
+
+        return extract_auto
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown HTML backend '{name}', expected one of {sorted(BACKENDS)} "
+            "or 'auto'"
+        )
+    if not is_available(name):
+        logger.warning("HTML backend %s is not installed, using bs4", name)
+        return BACKENDS["bs4"]
+    return BACKENDS[name]
@@ -0,0 +1,204 @@
+"""
+Inference backends for running the FinBERT classifier.
+
+Every backend exposes the same small interface: a tokenizer, the model's
+``id2label`` mapping and ``predict_proba``, which turns a list of unpadded
+tokenizer outputs into a ``(batch, num_labels)`` array of probabilities.
+"""
+
+import inspect
+import logging
+import os
+import re
+from typing import Dict, List
+
+import numpy as np
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from .config import DATA_DIR, MODEL_REVISION
+
+logger = logging.getLogger(__name__)
+
+ONNX_DIR = os.path.join(DATA_DIR, "onnx")
+
+
+class TorchBackend:
+    """Full precision PyTorch backend (GPU when available)."""
+
+    name = "pytorch"
+
+    def __init__(self, model_name: str, revision: str = MODEL_REVISION):
+        """
+        Load the tokenizer and model weights.
+
+        Args:
+            model_name (str): Hugging Face model name or local path
+            revision (str): Hub branch, tag or commit
+        """
+        self.model_name = model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+        self.model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, revision=revision
+        )
+        self.model.eval()
+        self.id2label = self.model.config.id2label
+        # Resolved commit when loaded from the Hub, None for local paths
+        self.revision = getattr(self.model.config, "_commit_hash", None) or revision
+        self.device = self._select_device()
+        self.model.to(self.device)
+        logger.info("Loaded %s backend on %s", self.name, self.device)
+
+    def _select_device(self) -> str:
+        """Pick the device the model runs on."""
+        return "cuda" if torch.cuda.is_available() else "cpu"
+
+    def predict_proba(self, features: List[Dict[str, List[int]]]) -> np.ndarray:
+        """
+        Run one padded forward pass and return class probabilities.
+
+        Args:
+            features (List[Dict[str, List[int]]]): Unpadded tokenizer outputs
+
+        Returns:
+            np.ndarray: Probabilities of shape (batch, num_labels)
+        """
+        encoded = self.tokenizer.pad(features, return_tensors="pt").to(self.device)
+        with torch.inference_mode():
+            logits = self.model(**encoded).logits
+        return torch.softmax(logits.float(), dim=-1).cpu().numpy()
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch backend with dynamic int8 quantization of the linear layers."""
+
+    name = "pytorch-int8"
+
+    def __init__(self, model_name: str, revision: str = MODEL_REVISION):
+        super().__init__(model_name, revision)
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def _select_device(self) -> str:
+        # Dynamically quantized kernels only exist for CPU
+        return "cpu"
+
+
+class OnnxBackend:
+    """ONNX Runtime backend running an exported copy of the model on CPU."""
+
+    name = "onnx"
+
+    def __init__(self, model_name: str, revision: str = MODEL_REVISION):
+        """
+        Load the exported model, exporting it first if needed.
+
+        Args:
+            model_name (str): Hugging Face model name or local path
+            revision (str): Hub branch, tag or commit
+        """
+        try:
+            import onnxruntime  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                "The onnx backend requires onnxruntime: pip install onnxruntime"
+            ) from e
+
+        self.model_name = model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, revision=revision
+        )
+        self.id2label = model.config.id2label
+        self.revision = getattr(model.config, "_commit_hash", None) or revision
+
+        path = self._export_path(model_name, self.revision)
+        if not os.path.exists(path):
+            self._export(model, path)
+        del model
+
+        self.session = onnxruntime.InferenceSession(
+            path, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {node.name for node in self.session.get_inputs()}
+        logger.info("Loaded %s backend from %s", self.name, path)
+
+    @staticmethod
+    def _export_path(model_name: str, revision: str) -> str:
+        """Location of the exported model for a model and revision."""
+        slug = re.sub(r"[^\w.-]+", "_", f"{model_name}@{revision}").strip("_")
+        return os.path.join(ONNX_DIR, slug, "model.onnx")
+
+    def _export(self, model, path: str):
+        """Export the PyTorch model to ONNX with dynamic batch and length."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sample = self.tokenizer(["sample text"], return_tensors="pt")
+        # Graph inputs are bound positionally, so follow the forward() order
+        input_names = [
+            name
+            for name in inspect.signature(model.forward).parameters
+            if name in sample
+        ]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["logits"] = {0: "batch"}
+        model.eval()
+        tmp_path = f"{path}.tmp"
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            tmp_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+            dynamo=False,
+        )
+        os.replace(tmp_path, path)
+        logger.info("Exported %s to %s", self.model_name, path)
+
+    def predict_proba(self, features: List[Dict[str, List[int]]]) -> np.ndarray:
+        """
+        Run one padded forward pass and return class probabilities.
+
+        Args:
+            features (List[Dict[str, List[int]]]): Unpadded tokenizer outputs
+
+        Returns:
+            np.ndarray: Probabilities of shape (batch, num_labels)
+        """
+        encoded = self.tokenizer.pad(features, return_tensors="np")
+        inputs = {
+            name: values.astype(np.int64)
+            for name, values in encoded.items()
+            if name in self.input_names
+        }
+        logits = self.session.run(["logits"], inputs)[0].astype(np.float32)
+        logits -= logits.max(axis=-1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=-1, keepdims=True)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (TorchBackend, QuantizedTorchBackend, OnnxBackend)
+}
+
+
+def load_backend(name: str, model_name: str, revision: str = MODEL_REVISION):
+    """
+    Instantiate an inference backend by name.
+
+    Args:
+        name (str): One of ``BACKENDS``
+        model_name (str): Hugging Face model name or local path
+        revision (str): Hub branch, tag or commit
+
+    Returns:
+        The loaded backend
+    """
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown inference backend '{name}', expected one of {sorted(BACKENDS)}"
+        )
+    return BACKENDS[name](model_name, revision)
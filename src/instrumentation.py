@@ -0,0 +1,337 @@
+"""
+Spans recording the time, CPU and memory cost of pipeline stages.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from . import serialization
+from .config import INSTRUMENTATION
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_statm_fd: Optional[int] = None
+
+
+def current_rss() -> Optional[int]:
+    """
+    Get the resident set size of this process.
+
+    /proc/self/statm is kept open and re-read in place, which is several
+    times cheaper than reopening it for every span.
+
+    Returns:
+        Optional[int]: RSS in bytes, None where /proc is unavailable
+    """
+    global _statm_fd  # pylint: disable=global-statement
+    try:
+        if _statm_fd is None:
+            _statm_fd = os.open("/proc/self/statm", os.O_RDONLY)
+        return int(os.pread(_statm_fd, 64, 0).split()[1]) * _PAGE_SIZE
+    except (OSError, AttributeError, IndexError, ValueError):
+        return None
+
+
+class _NullSpan:
+    """Span handed out while profiling is disabled; ignores everything."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """One timed block; set ``items`` inside it to record its volume."""
+
+    __slots__ = ("profiler", "name", "items", "_wall", "_cpu", "_memory")
+
+    def __init__(self, profiler: "Profiler", name: str, items: Optional[int] = None):
+        self.profiler = profiler
+        self.name = name
+        self.items = items
+
+    def __enter__(self):
+        self._memory = self.profiler.memory_usage()
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        memory = self.profiler.memory_usage()
+        delta = memory - self._memory if memory is not None else None
+        self.profiler.record(self.name, wall, cpu, self.items, delta)
+        return False
+
+
+class Profiler:
+    """
+    Aggregate spans per name into a profile of each pipeline run.
+
+    Spans may nest, so the time of an outer span includes its inner ones.
+    CPU time is that of the whole process, including torch threads, and
+    overlaps between spans running concurrently in different threads. Work
+    done in worker processes is not seen.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = INSTRUMENTATION["enabled"],
+        memory: Optional[str] = INSTRUMENTATION["memory"],
+        profile_dir: Optional[str] = INSTRUMENTATION["profile_dir"],
+        history: int = INSTRUMENTATION["history"],
+    ):
+        """
+        Args:
+            enabled (bool): Record spans; when False ``span`` returns a no-op
+            memory (Optional[str]): "rss", "tracemalloc" (Python heap only,
+                slows Python code down) or None to skip memory deltas
+            profile_dir (Optional[str]): Directory each run profile is written
+                to as JSON (None keeps profiles in memory only)
+            history (int): Number of run profiles kept in memory
+        """
+        if memory not in ("rss", "tracemalloc", None):
+            raise ValueError(f"Unknown memory mode: {memory}")
+        self.enabled = enabled
+        self.memory = memory
+        self.profile_dir = profile_dir
+        self.history = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._run: Optional[Dict[str, Any]] = None
+        self._started_tracemalloc = False
+
+    def span(self, name: str, items: Optional[int] = None):
+        """
+        Time a block of code.
+
+        Args:
+            name (str): Stage name the measurements are aggregated under
+            items (Optional[int]): Number of items the block processes
+
+        Returns:
+            Span: Context manager measuring the block
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, items)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorate a function so that each call is timed as a span.
+
+        Args:
+            name (Optional[str]): Stage name, defaults to the function name
+
+        Returns:
+            Callable: Decorator
+        """
+
+        def decorator(func: Callable) -> Callable:
+            label = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, label):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def memory_usage(self) -> Optional[int]:
+        """
+        Get the memory figure spans report deltas of.
+
+        Returns:
+            Optional[int]: Bytes in use, None when memory is not measured
+        """
+        if self.memory == "rss":
+            return current_rss()
+        if self.memory == "tracemalloc" and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return None
+
+    def record(
+        self,
+        name: str,
+        wall_seconds: float,
+        cpu_seconds: float,
+        items: Optional[int] = None,
+        memory_delta: Optional[int] = None,
+    ):
+        """
+        Add the measurements of one span to its stage totals.
+
+        Args:
+            name (str): Stage name
+            wall_seconds (float): Elapsed wall time
+            cpu_seconds (float): Process CPU time used
+            items (Optional[int]): Items processed
+            memory_delta (Optional[int]): Change in memory use, in bytes
+        """
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = self._stages[name] = {
+                    "calls": 0,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "items": 0,
+                    "memory_delta_bytes": 0,
+                }
+            stage["calls"] += 1
+            stage["wall_seconds"] += wall_seconds
+            stage["cpu_seconds"] += cpu_seconds
+            if items:
+                stage["items"] += items
+            if memory_delta is not None:
+                stage["memory_delta_bytes"] += memory_delta
+
+    def begin_run(self, label: str = "run"):
+        """
+        Start collecting a new run profile.
+
+        Args:
+            label (str): Kind of run, e.g. "batch" or "streaming"
+        """
+        if not self.enabled:
+            return
+        if self.memory == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        with self._lock:
+            self._stages = {}
+        now = datetime.now()
+        self._run = {
+            "run_id": f"{now.strftime('%Y%m%d-%H%M%S-%f')}-{label}",
+            "label": label,
+            "started_at": now.isoformat(),
+            "wall": time.perf_counter(),
+            "cpu": time.process_time(),
+            "memory": self.memory_usage(),
+        }
+
+    def finish_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Close the current run, keep its profile in memory and write it out.
+
+        Returns:
+            Optional[Dict[str, Any]]: The run profile, None when disabled
+        """
+        if not self.enabled or self._run is None:
+            return None
+        run, self._run = self._run, None
+        memory = self.memory_usage()
+        with self._lock:
+            stages, self._stages = self._stages, {}
+        for stage in stages.values():
+            wall = stage["wall_seconds"]
+            stage["items_per_second"] = (
+                round(stage["items"] / wall, 1) if stage["items"] and wall else None
+            )
+            stage["wall_seconds"] = round(wall, 4)
+            stage["cpu_seconds"] = round(stage["cpu_seconds"], 4)
+            if self.memory is None:
+                stage["memory_delta_bytes"] = None
+        profile = {
+            "run_id": run["run_id"],
+            "label": run["label"],
+            "started_at": run["started_at"],
+            "wall_seconds": round(time.perf_counter() - run["wall"], 4),
+            "cpu_seconds": round(time.process_time() - run["cpu"], 4),
+            "memory_mode": self.memory,
+            "memory_delta_bytes": (
+                memory - run["memory"]
+                if memory is not None and run["memory"] is not None
+                else None
+            ),
+            "stages": stages,
+        }
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.history.append(profile)
+        self._export(profile)
+        return profile
+
+    def _export(self, profile: Dict[str, Any]):
+        """Write a run profile to ``profile_dir``."""
+        if not self.profile_dir:
+            return
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = os.path.join(self.profile_dir, f"{profile['run_id']}.json")
+            serialization.dump(profile, path, pretty=True)
+            logger.info("Run profile written to %s", path)
+        except OSError as e:
+            logger.error("Error writing run profile: %s", str(e))
+
+    def recent_profiles(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the latest run profiles, newest first.
+
+        Profiles from this process are served from memory; otherwise, as in
+        a web app running apart from the pipeline, they are read from
+        ``profile_dir``.
+
+        Args:
+            limit (int): Maximum number of profiles
+
+        Returns:
+            List[Dict[str, Any]]: Run profiles
+        """
+        if self.history:
+            return list(reversed(self.history))[:limit]
+        return load_profiles(self.profile_dir, limit)
+
+
+def load_profiles(directory: Optional[str], limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Load the latest run profiles written to a directory, newest first.
+
+    Args:
+        directory (Optional[str]): Directory holding the profile files
+        limit (int): Maximum number of profiles
+
+    Returns:
+        List[Dict[str, Any]]: Run profiles
+    """
+    if not directory or not os.path.isdir(directory):
+        return []
+    names = sorted(
+        (name for name in os.listdir(directory) if name.endswith(".json")),
+        reverse=True,
+    )
+    profiles = []
+    for name in names[:limit]:
+        try:
+            profiles.append(serialization.load(os.path.join(directory, name)))
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping unreadable profile %s: %s", name, str(e))
+    return profiles
+
+
+# Shared by the pipeline and the components it drives
+profiler = Profiler()
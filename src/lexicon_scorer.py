@@ -0,0 +1,142 @@
+"""
+Fast financial lexicon sentiment scorer used as the first cascade stage.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .text_processor import FINANCIAL_TERMS
+
+POSITIVE_TERMS = set(
+    """
+    advance advanced advances beat beats boost boosted boosts bullish climb
+    climbed climbs expand expanded expansion gain gained gains growth high
+    higher highs improve improved improves jump jumped jumps optimism
+    optimistic outperform outperformed profit profitable profits rally rallied
+    rallies rebound rebounded record recover recovered recovery rise rises
+    rising rose soar soared soars strong stronger surge surged surges upbeat
+    upgrade upgraded win wins
+    """.split()
+)
+
+NEGATIVE_TERMS = set(
+    """
+    bankruptcy bearish concern concerns crash crashed cut cuts decline declined
+    declines default deficit downgrade downgraded drop dropped drops fall
+    fallen falling falls fear fears fell fraud layoffs lawsuit loss losses low
+    lower lows miss missed misses plunge plunged plunges recession selloff sink
+    sank slide slid slowdown slump slumped slumps tumble tumbled tumbles
+    warning warns weak weaker weakness worry worries
+    """.split()
+)
+
+# Wording typical of market-wrap headlines that carry no direction
+NEUTRAL_TERMS = set(
+    """
+    awaits flat hold holds mixed steadies steady unchanged await ahead
+    """.split()
+)
+
+NEGATION_TERMS = {"no", "not", "never", "without", "nor", "hardly"}
+
+# Market entities from the text normalization table, e.g. "Federal Reserve"
+CONTEXT_TERMS = set(FINANCIAL_TERMS) | {
+    word
+    for replacement in FINANCIAL_TERMS.values()
+    for word in re.findall(r"[a-z]+", replacement.lower())
+}
+
+NEGATION_WINDOW = 2  # Polarity words this many tokens after a negation flip
+
+TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+_NONE, _POSITIVE, _NEGATIVE, _NEUTRAL, _CONTEXT, _NEGATION = range(6)
+_CATEGORIES = {
+    **{term: _CONTEXT for term in CONTEXT_TERMS},
+    **{term: _NEUTRAL for term in NEUTRAL_TERMS},
+    **{term: _POSITIVE for term in POSITIVE_TERMS},
+    **{term: _NEGATIVE for term in NEGATIVE_TERMS},
+    **{term: _NEGATION for term in NEGATION_TERMS},
+}
+
+
+class LexiconScorer:
+    """
+    Vectorized lexicon scorer returning a label and a confidence per text.
+
+    Texts are tokenized once and every token is mapped to a category code;
+    the per-text counts are then computed for the whole batch with NumPy.
+    Positive and negative terms preceded by a negation are flipped. The
+    confidence of a polar label is the margin between positive and negative
+    hits relative to all polar hits; a text without polar hits is Neutral,
+    with confidence growing with neutral wording and market context.
+    """
+
+    def score_arrays(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score texts and return label and confidence arrays.
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Labels (object array of
+            "Positive"/"Negative"/"Neutral") and confidences in [0, 1)
+        """
+        count = len(texts)
+        token_lists = [TOKEN_PATTERN.findall(text.lower()) for text in texts]
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), int, count)
+        codes = np.fromiter(
+            (
+                _CATEGORIES.get(token, _NONE)
+                for tokens in token_lists
+                for token in tokens
+            ),
+            np.int8,
+            int(lengths.sum()),
+        )
+        docs = np.repeat(np.arange(count), lengths)
+
+        negation = codes == _NEGATION
+        negated = np.zeros(len(codes), dtype=bool)
+        for offset in range(1, NEGATION_WINDOW + 1):
+            negated[offset:] |= negation[:-offset] & (docs[offset:] == docs[:-offset])
+
+        positive = ((codes == _POSITIVE) & ~negated) | ((codes == _NEGATIVE) & negated)
+        negative = ((codes == _NEGATIVE) & ~negated) | ((codes == _POSITIVE) & negated)
+
+        def per_text(mask: np.ndarray) -> np.ndarray:
+            return np.bincount(docs, weights=mask, minlength=count)
+
+        pos = per_text(positive)
+        neg = per_text(negative)
+        evidence = per_text(codes == _NEUTRAL) + 0.5 * per_text(codes == _CONTEXT)
+
+        polar = pos + neg
+        labels = np.full(count, "Neutral", dtype=object)
+        labels[pos > neg] = "Positive"
+        labels[neg > pos] = "Negative"
+        confidence = np.where(
+            polar > 0,
+            np.abs(pos - neg) / (polar + 1),
+            evidence / (evidence + 1),
+        )
+        return labels, confidence
+
+    def score_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Score texts in the analyzer's result format.
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            List[Dict[str, Any]]: Label and confidence per text
+        """
+        labels, confidence = self.score_arrays(texts)
+        return [
+            {"label": label, "score": round(float(score), 3)}
+            for label, score in zip(labels, confidence)
+        ]
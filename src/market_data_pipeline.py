@@ -1,11 +1,12 @@
 import os
 import time
-import json
 import pandas as pd
 import yfinance as yf
 import logging
 from datetime import datetime
 
+from . import serialization
+
 CACHE_DIR = "data/market_cache"
 CACHE_EXPIRY = 60 * 60  # 1 hour
 LOG_DIR = "logs"
@@ -40,18 +41,19 @@ def fetch_market_data(ticker):
     """
     ensure_cache_dir()
     cache_file = cache_path(ticker)
-    # If cache exists and is invalid (error), clear it
+    # If cache exists and is invalid (error), clear it; otherwise parse it once
+    cached = None
     if os.path.exists(cache_file):
-        with open(cache_file, "r") as f:
-            try:
-                cached = json.load(f)
-                if cached.get("error") and (cached.get("info") is None or cached.get("history") is None):
-                    os.remove(cache_file)
-            except Exception:
+        try:
+            cached = serialization.load(cache_file)
+            if cached.get("error") and (cached.get("info") is None or cached.get("history") is None):
                 os.remove(cache_file)
-    if is_cache_valid(cache_file):
-        with open(cache_file, "r") as f:
-            return json.load(f)
+                cached = None
+        except Exception:
+            os.remove(cache_file)
+            cached = None
+    if cached is not None and is_cache_valid(cache_file):
+        return cached
     try:
         stock = yf.Ticker(ticker)
         info = stock.info
@@ -61,16 +63,14 @@ def fetch_market_data(ticker):
             hist['Date'] = hist['Date'].astype(str)
         hist_records = hist.to_dict(orient="records")
         data = {"info": info, "history": hist_records, "error": None}
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        serialization.dump(data, cache_file)
         log_api_request(ticker, "success")
         return data
     except Exception as e:
         # Handle API errors, including rate limits
         error_msg = str(e)
         data = {"info": None, "history": None, "error": error_msg}
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        serialization.dump(data, cache_file)
         log_api_request(ticker, f"error: {error_msg}")
         return data
 
@@ -0,0 +1,211 @@
+"""
+Process-wide registry of lazily loaded models.
+
+Every transformer used in the process goes through the registry, so each
+(model, backend) pair is loaded once on first use and shared by all callers.
+Heavy imports (torch, transformers) happen inside the loaders, which keeps
+modules that never score text fast to import.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ModelKey = Tuple[str, str]
+
+
+def resident_memory_bytes() -> int:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        int: RSS in bytes (0 when it cannot be determined)
+    """
+    try:
+        import psutil  # pylint: disable=import-outside-toplevel
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class ModelRegistry:
+    """Thread-safe registry loading each (model, backend) pair once."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._loaders: Dict[ModelKey, Callable[[], Any]] = {}
+        self._models: Dict[ModelKey, Any] = {}
+        self._stats: Dict[ModelKey, Dict[str, Any]] = {}
+        self._locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register(self, model_name: str, backend: str, loader: Callable[[], Any]):
+        """
+        Declare how to load a model without loading it.
+
+        Args:
+            model_name (str): Model name or path
+            backend (str): Backend or task the model is loaded for
+            loader (Callable[[], Any]): Zero-argument function building the model
+        """
+        with self._lock:
+            key = (model_name, backend)
+            self._loaders.setdefault(key, loader)
+            self._locks.setdefault(key, threading.Lock())
+
+    def get(
+        self,
+        model_name: str,
+        backend: str,
+        loader: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Get a model, loading it on first use.
+
+        Args:
+            model_name (str): Model name or path
+            backend (str): Backend or task the model is loaded for
+            loader (Optional[Callable[[], Any]]): Loader to register if the
+                pair is not registered yet
+
+        Returns:
+            Any: The shared model object
+        """
+        key = (model_name, backend)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        if loader is not None:
+            self.register(model_name, backend, loader)
+        if key not in self._loaders:
+            raise KeyError(f"No loader registered for {model_name} ({backend})")
+
+        with self._locks[key]:
+            if key not in self._models:
+                self._models[key] = self._load(key)
+        return self._models[key]
+
+    def _load(self, key: ModelKey) -> Any:
+        """Run a loader and record its load time and memory footprint."""
+        model_name, backend = key
+        rss_before = resident_memory_bytes()
+        start = time.perf_counter()
+        try:
+            model = self._loaders[key]()
+        except Exception as e:
+            logger.error("Error loading %s (%s): %s", model_name, backend, str(e))
+            raise
+        load_seconds = time.perf_counter() - start
+        rss_delta = max(resident_memory_bytes() - rss_before, 0)
+
+        self._stats[key] = {
+            "model": model_name,
+            "backend": backend,
+            "load_seconds": round(load_seconds, 3),
+            "rss_delta_mb": round(rss_delta / 2**20, 1),
+            "loaded_at": time.time(),
+        }
+        logger.info(
+            "Loaded %s (%s) in %.2fs, +%.0f MB resident",
+            model_name,
+            backend,
+            load_seconds,
+            rss_delta / 2**20,
+        )
+        return model
+
+    def warmup(self, keys: Optional[Iterable[ModelKey]] = None):
+        """
+        Load models ahead of their first use.
+
+        Args:
+            keys (Optional[Iterable[ModelKey]]): (model, backend) pairs to
+                load; defaults to every registered pair
+        """
+        for model_name, backend in list(keys or self._loaders):
+            self.get(model_name, backend)
+
+    def is_loaded(self, model_name: str, backend: str) -> bool:
+        """
+        Check whether a model has been loaded.
+
+        Args:
+            model_name (str): Model name or path
+            backend (str): Backend or task the model is loaded for
+
+        Returns:
+            bool: True once the model is in memory
+        """
+        return (model_name, backend) in self._models
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Get load time and resident memory growth per model.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per registered model
+        """
+        return [
+            self._stats.get(
+                key, {"model": key[0], "backend": key[1], "loaded_at": None}
+            )
+            for key in self._loaders
+        ]
+
+
+registry = ModelRegistry()
+
+
+def get_backend(model_name: str, backend: str, revision: str) -> Any:
+    """
+    Get a shared sentiment inference backend.
+
+    Each revision of a model is loaded and shared separately.
+
+    Args:
+        model_name (str): Hugging Face model name or local path
+        backend (str): Inference backend name
+        revision (str): Hub branch, tag or commit
+
+    Returns:
+        Any: The loaded backend
+    """
+
+    def load():
+        # pylint: disable=import-outside-toplevel
+        from .inference_backends import load_backend
+
+        return load_backend(backend, model_name, revision)
+
+    return registry.get(f"{model_name}@{revision}", backend, load)
+
+
+def get_pipeline(task: str, model_name: str) -> Any:
+    """
+    Get a shared Hugging Face pipeline.
+
+    Args:
+        task (str): Pipeline task, e.g. ``"summarization"``
+        model_name (str): Hugging Face model name
+
+    Returns:
+        Any: The loaded pipeline
+    """
+
+    def load():
+        from transformers import pipeline  # pylint: disable=import-outside-toplevel
+
+        return pipeline(task, model=model_name)
+
+    return registry.get(model_name, f"pipeline:{task}", load)
@@ -0,0 +1,288 @@
+"""
+Near-duplicate detection of the same story published by several sources.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import NEAR_DUPLICATES
+
+logger = logging.getLogger(__name__)
+
+NUM_PERM = 32  # MinHash permutations per signature
+BANDS = 8  # LSH bands of NUM_PERM // BANDS rows each
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3  # Words per shingle
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Fixed multiply-add-shift hash family so signatures stay comparable across runs
+_rng = np.random.default_rng(1)
+_A = _rng.integers(0, 2**64, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2**64, size=NUM_PERM, dtype=np.uint64)
+
+BAND_COLUMNS = [f"band{i}" for i in range(BANDS)]
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """
+    Compute the MinHash signature of a text's word trigrams.
+
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of the texts' trigram sets.
+
+    Args:
+        text (str): Input text
+
+    Returns:
+        np.ndarray: ``NUM_PERM`` uint32 minimum hashes
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    shingles = {
+        " ".join(tokens[i : i + SHINGLE_SIZE])
+        for i in range(max(len(tokens) - SHINGLE_SIZE + 1, 1))
+    }
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    # Products wrap modulo 2**64; the high 32 bits are the permuted hash
+    permuted = (np.outer(hashes, _A) + _B) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Estimate the Jaccard similarity of two signatures.
+
+    Args:
+        a (np.ndarray): First signature
+        b (np.ndarray): Second signature
+
+    Returns:
+        float: Fraction of equal minimum hashes
+    """
+    return float(np.mean(a == b))
+
+
+def _band_keys(signature: np.ndarray) -> List[int]:
+    """Hash each band of a signature into a signed 64-bit SQLite key."""
+    return [
+        int.from_bytes(
+            hashlib.blake2b(band.tobytes(), digest_size=8).digest(), "big", signed=True
+        )
+        for band in signature.reshape(BANDS, ROWS)
+    ]
+
+
+class NearDuplicateIndex:
+    """
+    Persistent MinHash LSH index clustering near-duplicate articles.
+
+    Each story is stored once, with its canonical article's signature, one
+    indexed key per LSH band and, once scored, its sentiment. Lookups only
+    compare against the stories sharing at least one band, which keeps them
+    fast however many stories are stored; candidates are then confirmed on
+    the full signature.
+    """
+
+    def __init__(
+        self,
+        path: str = NEAR_DUPLICATES["path"],
+        threshold: float = NEAR_DUPLICATES["threshold"],
+    ):
+        """
+        Open (or create) the fingerprint store.
+
+        Args:
+            path (str): SQLite database file
+            threshold (float): Estimated Jaccard similarity of a duplicate
+        """
+        self.path = path
+        self.threshold = threshold
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS clusters ("
+            "cluster_id TEXT PRIMARY KEY, signature BLOB NOT NULL, link TEXT, "
+            "label TEXT, score REAL, created REAL NOT NULL, "
+            f"{', '.join(f'{column} INTEGER NOT NULL' for column in BAND_COLUMNS)})"
+        )
+        for column in BAND_COLUMNS:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_clusters_{column} "
+                f"ON clusters ({column})"
+            )
+        self._conn.commit()
+
+    def _find_cluster(
+        self, signature: np.ndarray, band_keys: List[int], link: Optional[str] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Return the (cluster_id, link) of the most similar stored story.
+
+        A matching story stored for ``link`` itself is returned first, so an
+        article seen again is recognised as its own story's canonical.
+        """
+        where = " OR ".join(f"{column} = ?" for column in BAND_COLUMNS)
+        rows = self._conn.execute(
+            f"SELECT cluster_id, signature, link FROM clusters WHERE {where}",
+            band_keys,
+        ).fetchall()
+        best, best_similarity = None, self.threshold
+        for cluster_id, stored, stored_link in rows:
+            score = similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+            if score < self.threshold:
+                continue
+            if link and stored_link == link:
+                return cluster_id, stored_link
+            if score >= best_similarity:
+                best, best_similarity = (cluster_id, stored_link), score
+        return best
+
+    def assign_clusters(
+        self, articles: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Attach a cluster id to each article and split off duplicates.
+
+        Articles matching a stored story, or an earlier article of the same
+        batch, get that story's cluster id and ``duplicate_of`` set to the
+        canonical article's link; the others start a new cluster. An article
+        that is itself the stored canonical of its story stays canonical.
+
+        Args:
+            articles (List[Dict[str, Any]]): Processed articles
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: Canonical
+            articles and duplicates, each in input order
+        """
+        canonical, duplicates = [], []
+        now = time.time()
+        insert = (
+            "INSERT OR IGNORE INTO clusters "
+            f"(cluster_id, signature, link, created, {', '.join(BAND_COLUMNS)}) "
+            f"VALUES (?, ?, ?, ?, {', '.join('?' * BANDS)})"
+        )
+        with self._lock:
+            try:
+                for article in articles:
+                    signature = minhash_signature(article["processed_text"])
+                    band_keys = _band_keys(signature)
+                    match = self._find_cluster(
+                        signature, band_keys, article.get("link")
+                    )
+                    if match and article.get("link") and match[1] == article["link"]:
+                        # Seen before (full run, resume, crash before scoring):
+                        # still the canonical article of its own story
+                        article["cluster_id"], article["duplicate_of"] = match[0], None
+                        canonical.append(article)
+                        continue
+                    if match:
+                        article["cluster_id"], article["duplicate_of"] = match
+                        duplicates.append(article)
+                        continue
+                    article["cluster_id"] = hashlib.blake2b(
+                        signature.tobytes(), digest_size=8
+                    ).hexdigest()
+                    article["duplicate_of"] = None
+                    self._conn.execute(
+                        insert,
+                        (
+                            article["cluster_id"],
+                            signature.tobytes(),
+                            article.get("link"),
+                            now,
+                            *band_keys,
+                        ),
+                    )
+                    canonical.append(article)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error("Error updating fingerprint index: %s", str(e))
+                self._conn.rollback()
+                return articles, []
+
+        logger.info(
+            "Near duplicates: %d of %d articles repeat a known story",
+            len(duplicates),
+            len(articles),
+        )
+        return canonical, duplicates
+
+    def record_sentiment(self, articles: List[Dict[str, Any]]):
+        """
+        Store the sentiment of scored canonical articles for later duplicates.
+
+        Args:
+            articles (List[Dict[str, Any]]): Scored canonical articles
+        """
+        rows = [
+            (
+                article["sentiment"]["label"],
+                article["sentiment"]["score"],
+                article["cluster_id"],
+            )
+            for article in articles
+            if article.get("cluster_id")
+            and not article.get("duplicate_of")
+            and article.get("sentiment", {}).get("label") not in (None, "Unknown")
+        ]
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "UPDATE clusters SET label = ?, score = ? WHERE cluster_id = ?",
+                    rows,
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error("Error storing cluster sentiment: %s", str(e))
+
+    def copy_sentiment(self, duplicates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Give duplicates the sentiment of their canonical article.
+
+        Args:
+            duplicates (List[Dict[str, Any]]): Articles from ``assign_clusters``
+
+        Returns:
+            List[Dict[str, Any]]: Duplicates whose story has no sentiment yet
+            and still need scoring
+        """
+        unresolved = []
+        with self._lock:
+            for article in duplicates:
+                row = self._conn.execute(
+                    "SELECT label, score FROM clusters WHERE cluster_id = ?",
+                    (article["cluster_id"],),
+                ).fetchone()
+                if row and row[0] is not None:
+                    article["sentiment"] = {"label": row[0], "score": row[1]}
+                else:
+                    unresolved.append(article)
+        return unresolved
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM clusters").fetchone()[0]
+
+    def close(self):
+        """Close the on-disk index."""
+        with self._lock:
+            self._conn.close()
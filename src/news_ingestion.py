@@ -4,6 +4,7 @@ News ingestion module for fetching financial news from RSS feeds.
 
 # pylint: disable=too-few-public-methods
 
+import asyncio
 import logging
 import random
 import time
@@ -16,7 +17,9 @@ from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 from urllib3.util.retry import Retry
 
-from .config import RATE_LIMIT, RSS_FEEDS, USER_AGENT
+from .config import ASYNC_INGESTION, FEED_STATE, RATE_LIMIT, RSS_FEEDS, USER_AGENT
+from .feed_state import CHANGED, NOT_MODIFIED, UNCHANGED, FeedStateStore, content_hash
+from .instrumentation import profiler
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +28,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@profiler.traced("parse")
+def parse_feed(content: bytes) -> feedparser.FeedParserDict:
+    """
+    Parse a downloaded RSS/Atom document.
+
+    Args:
+        content (bytes): Raw feed body
+
+    Returns:
+        feedparser.FeedParserDict: Parsed feed
+    """
+    return feedparser.parse(content)
+
+
 class RateLimiter:
     """Rate limiter for API requests."""
 
@@ -46,9 +63,12 @@ class RateLimiter:
 class NewsFetcher:
     """Class to handle news fetching with retries and rate limiting."""
 
-    def __init__(self):
+    def __init__(self, feed_state: Optional[FeedStateStore] = None):
         self.session = self._create_session()
         self.rate_limiter = RateLimiter(RATE_LIMIT["requests_per_minute"])
+        if feed_state is None and FEED_STATE["enabled"]:
+            feed_state = FeedStateStore()
+        self.feed_state = feed_state
 
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry strategy."""
@@ -68,26 +88,52 @@ class NewsFetcher:
         """
         Fetch a single RSS feed with rate limiting and retries.
 
+        Feeds that did not change since the last fetch (304 response or
+        identical body) are not parsed.
+
         Args:
             feed_url (str): URL of the RSS feed
 
         Returns:
             Optional[feedparser.FeedParserDict]: Parsed feed or None if failed
+            or unchanged
         """
         try:
             self.rate_limiter.wait()
-            response = self.session.get(feed_url, timeout=RATE_LIMIT["timeout"])
+            headers = (
+                self.feed_state.conditional_headers(feed_url) if self.feed_state else {}
+            )
+            response = self.session.get(
+                feed_url, headers=headers, timeout=RATE_LIMIT["timeout"]
+            )
             response.raise_for_status()
 
-            # Add random delay to avoid detection
+            if self.feed_state:
+                if response.status_code == 304:
+                    self.feed_state.record(feed_url, NOT_MODIFIED)
+                    return None
+                body_hash = content_hash(response.content)
+                if self.feed_state.is_unchanged(feed_url, body_hash):
+                    self.feed_state.record(feed_url, UNCHANGED)
+                    return None
+
+            # Add random delay to avoid detection, only when a new body was downloaded
             time.sleep(random.uniform(1, 3))
 
-            feed = feedparser.parse(response.content)
+            feed = parse_feed(response.content)
             if feed.bozo:
                 logger.warning(
                     "Feed parsing issues for %s: %s", feed_url, feed.bozo_exception
                 )
 
+            if self.feed_state:
+                self.feed_state.stage(
+                    feed_url,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    body_hash,
+                )
+                self.feed_state.record(feed_url, CHANGED)
             return feed
 
         except requests.RequestException as e:
@@ -97,8 +143,9 @@ class NewsFetcher:
             logger.error("Unexpected error fetching feed %s: %s", feed_url, str(e))
             return None
 
+    @staticmethod
     def process_feed(
-        self, feed: feedparser.FeedParserDict, source: str
+        feed: feedparser.FeedParserDict, source: str
     ) -> List[Dict[str, Any]]:
         """
         Process a feed and extract articles.
@@ -117,6 +164,7 @@ class NewsFetcher:
                     "title": entry.get("title", ""),
                     "summary": entry.get("summary", ""),
                     "link": entry.get("link", ""),
+                    "guid": entry.get("id", ""),
                     "published": entry.get("published", ""),
                     "source": source,
                     "timestamp": datetime.now().isoformat(),
@@ -146,19 +194,44 @@ def fetch_rss_articles(feed_url: str, source: str) -> List[Dict[str, Any]]:
         return []
 
     articles = fetcher.process_feed(feed, source)
+    if fetcher.feed_state:
+        fetcher.feed_state.commit()
     logger.info("Successfully fetched %d articles from %s", len(articles), source)
     return articles
 
 
-def fetch_all_feeds() -> List[Dict[str, Any]]:
+def fetch_all_feeds(
+    concurrent: bool = ASYNC_INGESTION["enabled"],
+    fetcher: Optional[NewsFetcher] = None,
+    feed_state: Optional[FeedStateStore] = None,
+) -> List[Dict[str, Any]]:
     """
     Fetch articles from all configured RSS feeds.
 
+    The validators of the fetched feeds are committed here unless a fetcher
+    or store is passed; its owner then commits them once the articles are
+    saved.
+
+    Args:
+        concurrent (bool): Fetch feeds concurrently with the async engine
+            instead of one after another
+        fetcher (Optional[NewsFetcher]): Fetcher reused by sequential
+            fetching, a new one by default
+        feed_state (Optional[FeedStateStore]): Conditional GET validators of
+            a new fetcher, the configured store by default
+
     Returns:
         List[Dict[str, Any]]: Combined list of articles from all feeds
     """
+    if concurrent:
+        # pylint: disable=import-outside-toplevel
+        from .async_ingestion import fetch_all_feeds_async
+
+        return asyncio.run(fetch_all_feeds_async(RSS_FEEDS, feed_state))
+
     all_articles = []
-    fetcher = NewsFetcher()
+    owned = fetcher is None and feed_state is None
+    fetcher = fetcher or NewsFetcher(feed_state)
 
     for source, url in tqdm(RSS_FEEDS.items(), desc="Fetching feeds"):
         try:
@@ -170,5 +243,9 @@ def fetch_all_feeds() -> List[Dict[str, Any]]:
             logger.error("Error processing feed %s: %s", source, str(e))
             continue
 
+    if fetcher.feed_state:
+        if owned:
+            fetcher.feed_state.commit()
+        fetcher.feed_state.log_summary()
     logger.info("Total articles fetched: %d", len(all_articles))
     return all_articles
@@ -0,0 +1,239 @@
+"""
+Multi-process sentiment scoring for large backfills.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import PARALLEL_SCORING
+from .sentiment_analyzer import SentimentAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Analyzer owned by each worker process, loaded once by the pool initializer
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def set_num_threads(threads: int):
+    """
+    Set the number of torch intra-op threads for the current process.
+
+    Args:
+        threads (int): Number of threads
+    """
+    import torch  # pylint: disable=import-outside-toplevel
+
+    torch.set_num_threads(threads)
+
+
+def _init_worker(threads: int, analyzer_kwargs: Dict[str, Any]):
+    """Pin the worker's intra-op threads and load its model."""
+    global _worker_analyzer  # pylint: disable=global-statement
+
+    set_num_threads(threads)
+    _worker_analyzer = SentimentAnalyzer(**analyzer_kwargs)
+    _worker_analyzer.warmup()
+    logger.info("Worker %d ready with %d threads", os.getpid(), threads)
+
+
+def _score_shard(
+    texts: List[str],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]:
+    """
+    Score one shard of texts in a worker process.
+
+    Args:
+        texts (List[str]): Texts of the shard
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[str, Any], Dict[str, Any]]: Results
+        in input order, and the cascade and batch metrics of this shard
+    """
+    before = dict(_worker_analyzer.cascade_stats)
+    _worker_analyzer.batch_metrics = {}
+    results = _worker_analyzer.analyze_batch(texts)
+    cascade = {
+        key: value - before[key]
+        for key, value in _worker_analyzer.cascade_stats.items()
+    }
+    return results, cascade, _worker_analyzer.batch_metrics
+
+
+class ShardedSentimentScorer:
+    """
+    Process pool in which every worker holds its own SentimentAnalyzer.
+
+    Texts are split into shards and handed to the workers through the pool's
+    task queue; results stream back in input order. The pool is started on
+    first use and reused until ``close`` is called, so each worker loads the
+    model only once. Cascade and batch metrics counted by the workers come
+    back with every shard and are summed here.
+    """
+
+    def __init__(
+        self,
+        workers: int = PARALLEL_SCORING["workers"],
+        threads_per_worker: Optional[int] = PARALLEL_SCORING["threads_per_worker"],
+        shard_size: int = PARALLEL_SCORING["shard_size"],
+        **analyzer_kwargs,
+    ):
+        """
+        Configure the worker pool.
+
+        Args:
+            workers (int): Number of worker processes
+            threads_per_worker (Optional[int]): Torch intra-op threads per
+                worker; None splits the available cores evenly
+            shard_size (int): Texts sent to a worker per task
+            **analyzer_kwargs: Passed to each worker's SentimentAnalyzer
+        """
+        self.workers = max(1, workers)
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.workers
+        )
+        self.shard_size = shard_size
+        self.analyzer_kwargs = analyzer_kwargs
+        self.batch_metrics: Dict[str, Any] = {}
+        self.cascade_stats = {"texts": 0, "escalated": 0, "lexicon_cpu_seconds": 0.0}
+        self._pool = None
+
+    def _get_pool(self):
+        """Start the worker pool on first use."""
+        if self._pool is None:
+            logger.info(
+                "Starting %d scoring workers with %d threads each",
+                self.workers,
+                self.threads_per_worker,
+            )
+            # Forking a process that already initialized torch can deadlock
+            context = multiprocessing.get_context("spawn")
+            self._pool = context.Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.threads_per_worker, self.analyzer_kwargs),
+            )
+        return self._pool
+
+    def warmup(self):
+        """Start the worker pool, which loads the model in every worker."""
+        self._get_pool()
+
+    def iter_batch(self, texts: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Score texts across the pool, yielding results in input order.
+
+        Args:
+            texts (List[str]): List of input texts
+
+        Yields:
+            Dict[str, Any]: Sentiment result per text
+        """
+        start_time = time.perf_counter()
+        shards = [
+            texts[start : start + self.shard_size]
+            for start in range(0, len(texts), self.shard_size)
+        ]
+        totals: Dict[str, int] = {}
+        for shard_results, cascade, metrics in self._get_pool().imap(
+            _score_shard, shards
+        ):
+            for key, value in cascade.items():
+                self.cascade_stats[key] += value
+            for key in ("texts", "batches", "real_tokens", "padded_tokens", "windows"):
+                if key in metrics:
+                    totals[key] = totals.get(key, 0) + metrics[key]
+            yield from shard_results
+        self._record_batch_metrics(totals, start_time)
+
+    def _record_batch_metrics(self, totals: Dict[str, int], start_time: float):
+        """Store the summed shard metrics of the last call, timed end to end."""
+        if not totals:
+            self.batch_metrics = {}
+            return
+        duration = max(time.perf_counter() - start_time, 1e-9)
+        self.batch_metrics = {
+            **totals,
+            "padding_efficiency": round(
+                totals["real_tokens"] / max(totals["padded_tokens"], 1), 4
+            ),
+            "seconds": round(duration, 4),
+            "texts_per_second": round(totals["texts"] / duration, 2),
+            "tokens_per_second": round(totals["real_tokens"] / duration, 2),
+        }
+
+    def get_batch_metrics(self) -> Dict[str, Any]:
+        """
+        Get padding and throughput metrics of the most recent batch call.
+
+        Returns:
+            Dict[str, Any]: Metrics summed over the shards that reached the
+            model (empty when none did)
+        """
+        return dict(self.batch_metrics)
+
+    def get_cascade_stats(self) -> Dict[str, Any]:
+        """
+        Get cumulative lexicon cascade statistics of all workers.
+
+        Returns:
+            Dict[str, Any]: Texts scored by the lexicon, texts escalated to
+            the model, escalation rate and lexicon CPU time
+        """
+        stats = dict(self.cascade_stats)
+        stats["escalation_rate"] = (
+            round(stats["escalated"] / stats["texts"], 4) if stats["texts"] else 0.0
+        )
+        return stats
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Score texts across the pool.
+
+        Args:
+            texts (List[str]): List of input texts
+
+        Returns:
+            List[Dict[str, Any]]: Sentiment results in input order
+        """
+        return list(self.iter_batch(texts))
+
+    def analyze_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze sentiment of multiple articles across the pool.
+
+        Args:
+            articles (List[Dict[str, Any]]): List of articles
+
+        Returns:
+            List[Dict[str, Any]]: List of articles with sentiment analysis
+        """
+        processed_articles = []
+        for article in articles:
+            if "processed_text" not in article:
+                logger.warning("Article missing processed text, skipping")
+                continue
+            processed_articles.append(article)
+
+        sentiments = self.iter_batch(
+            [article["processed_text"] for article in processed_articles]
+        )
+        for article, sentiment in zip(processed_articles, sentiments):
+            article["sentiment"] = sentiment
+
+        return processed_articles
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
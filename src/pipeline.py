@@ -2,15 +2,38 @@
 Main pipeline module for orchestrating the sentiment analysis process.
 """
 
+import argparse
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .articles import ArticleBatch
+from .async_ingestion import AsyncNewsFetcher
+from .checkpoints import CheckpointStore
+from .config import (
+    CHECKPOINTS,
+    DAEMON,
+    FEED_STATE,
+    INSTRUMENTATION,
+    NEAR_DUPLICATES,
+    PARALLEL_SCORING,
+    RSS_FEEDS,
+    SEEN_INDEX,
+    STREAMING,
+)
+from .feed_state import FeedStateStore
+from .instrumentation import profiler
+from .near_duplicates import NearDuplicateIndex
 from .news_ingestion import fetch_all_feeds
+from .parallel_scoring import ShardedSentimentScorer, set_num_threads
 from .report_generator import ReportGenerator
+from .seen_index import SeenIndex
 from .sentiment_analyzer import SentimentAnalyzer
+from .stage_graph import Stage, StageGraph
 from .storage import DataStorage
-from .text_processor import process_article
+from .text_processor import process_article, process_articles
 
 # Configure logging
 logging.basicConfig(
@@ -22,68 +45,500 @@ logger = logging.getLogger(__name__)
 class SentimentAnalysisPipeline:
     """Pipeline for orchestrating the sentiment analysis process."""
 
-    # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        workers: int = PARALLEL_SCORING["workers"],
+        threads_per_worker: Optional[int] = PARALLEL_SCORING["threads_per_worker"],
+        incremental: bool = SEEN_INDEX["enabled"],
+    ):
+        """
+        Initialize the pipeline components.
 
-    def __init__(self):
-        """Initialize the pipeline components."""
-        self.analyzer = SentimentAnalyzer()
+        Args:
+            workers (int): Scoring processes; more than one shards inference
+                across a process pool
+            threads_per_worker (Optional[int]): Torch threads per scoring process
+            incremental (bool): Only process articles not seen in earlier runs
+        """
+        if workers > 1:
+            self.analyzer = ShardedSentimentScorer(workers, threads_per_worker)
+        else:
+            if threads_per_worker:
+                set_num_threads(threads_per_worker)
+            self.analyzer = SentimentAnalyzer()
         self.storage = DataStorage()
         self.report_generator = ReportGenerator()
+        self.seen_index = SeenIndex() if incremental else None
+        self.near_duplicates = (
+            NearDuplicateIndex() if NEAR_DUPLICATES["enabled"] else None
+        )
+        self.checkpoints = CheckpointStore() if CHECKPOINTS["enabled"] else None
+        self.feed_state = FeedStateStore() if FEED_STATE["enabled"] else None
+        self.stage_seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def _timed(self, stage: str):
+        """
+        Run the enclosed block as a profiler span of the given stage.
+
+        Its wall time is also added to ``stage_seconds``, which is kept
+        whether or not profiling is enabled.
+        """
+        start_time = time.perf_counter()
+        try:
+            with profiler.span(stage) as span:
+                yield span
+        finally:
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + (
+                time.perf_counter() - start_time
+            )
 
     def run(
-        self, save_csv: bool = True, generate_report: bool = True
+        self,
+        save_csv: bool = True,
+        generate_report: bool = True,
+        fetch: Optional[Callable[[], List[Dict[str, Any]]]] = None,
+        resume: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Run the complete sentiment analysis pipeline.
+
+        The output of each stage, and of every scoring batch, is
+        checkpointed. A run that fails keeps its checkpoints so that a
+        resumed run skips the work already done; any other run starts by
+        discarding them. Feed validators are committed once the articles
+        are saved, so the feeds of a failed run are fetched in full again.
+        The wall time of each stage is left in ``stage_seconds``; with
+        profiling enabled a run profile is also recorded.
+
+        Args:
+            save_csv (bool): Also save the results as CSV
+            generate_report (bool): Generate the LaTeX/PDF report
+            fetch (Optional[Callable]): Returns the articles to process,
+                defaults to ``fetch_all_feeds`` with the pipeline's feed state
+            resume (bool): Continue from the checkpoints of a failed run
+
+        Returns:
+            List[Dict[str, Any]]: Scored articles
         """
         start_time = time.time()
+        self.stage_seconds = {}
+        profiler.begin_run("batch")
+        done = self._open_checkpoints(resume)
+        if self.feed_state is not None:
+            self.feed_state.discard()
+        failed = False
         logger.info("Starting sentiment analysis pipeline")
         try:
-            logger.info("Fetching news articles...")
-            articles = fetch_all_feeds()
-            if not articles:
-                logger.warning("No articles fetched, ending pipeline")
-                return []
-            logger.info("Processing articles...")
-            processed_articles = [
-                process_article(article)
-                for article in articles
-                if process_article(article)
-            ]
-            if not processed_articles:
-                logger.warning("No articles processed successfully, ending pipeline")
-                return []
+            if "fetch" in done:
+                articles = self.checkpoints.load_stage("fetch")
+            else:
+                logger.info("Fetching news articles...")
+                with self._timed("fetch") as span:
+                    if fetch is None:
+                        articles = fetch_all_feeds(feed_state=self.feed_state)
+                    else:
+                        articles = fetch()
+                    span.items = len(articles)
+                if not articles:
+                    logger.warning("No articles fetched, ending pipeline")
+                    return []
+                if self.seen_index is not None:
+                    with self._timed("dedupe") as span:
+                        span.items = len(articles)
+                        articles = self.seen_index.filter_unseen(articles)
+                    if not articles:
+                        logger.info("No new articles since the last run")
+                        self._commit_feed_state()
+                        return []
+                self._checkpoint("fetch", articles)
+            if "preprocess" in done:
+                processed_articles = self.checkpoints.load_stage("preprocess")
+            else:
+                logger.info("Processing articles...")
+                with self._timed("preprocess") as span:
+                    span.items = len(articles)
+                    processed_articles = process_articles(articles)
+                if not processed_articles:
+                    logger.warning(
+                        "No articles processed successfully, ending pipeline"
+                    )
+                    # They would fail again, so later runs skip them
+                    if self.seen_index is not None:
+                        self.seen_index.mark_seen(articles)
+                    self._commit_feed_state()
+                    return []
+                self._checkpoint("preprocess", processed_articles)
             logger.info("Analyzing sentiment...")
-            results = self.analyzer.analyze_articles(processed_articles)
-            logger.info("Saving results...")
-            self.storage.save_to_json(results)
-            if save_csv:
-                self.storage.save_to_csv(results)
+            with self._timed("score") as span:
+                span.items = len(processed_articles)
+                results, report_articles = self._score_checkpointed(processed_articles)
+            if "persist" not in done:
+                logger.info("Saving results...")
+                with self._timed("save") as span:
+                    span.items = len(results)
+                    self.storage.save_results(results)
+                    if save_csv:
+                        self.storage.save_to_csv(results)
+                    if self.seen_index is not None:
+                        # Only after saving, so a failed run retries its articles
+                        self.seen_index.mark_seen(articles)
+                    self._commit_feed_state()
+                self._checkpoint("persist")
             if generate_report:
                 logger.info("Generating report...")
-                report_path = self.report_generator.generate_report(results)
+                with self._timed("report") as span:
+                    span.items = len(report_articles)
+                    report_path = self.report_generator.generate_report(report_articles)
                 logger.info("Report generated: %s", report_path)
             duration = time.time() - start_time
             logger.info("Pipeline completed in %.2f seconds", duration)
             logger.info("Processed %d articles", len(results))
-            sentiment_counts = {}
-            for result in results:
-                label = result["sentiment"]["label"]
-                sentiment_counts[label] = sentiment_counts.get(label, 0) + 1
             logger.info("Sentiment distribution:")
-            for label, count in sentiment_counts.items():
+            for label, count in ArticleBatch(results).label_counts().items():
                 logger.info("%s: %d articles", label, count)
             logger.info("Total articles fetched: %d", len(articles))
             return results
         except Exception as e:  # pylint: disable=broad-except
+            failed = True
             logger.error("Pipeline failed: %s", str(e))
+            if self.checkpoints is not None and self.checkpoints.completed_stages():
+                logger.info(
+                    "Completed stages are checkpointed in %s, rerun with --resume",
+                    self.checkpoints.directory,
+                )
+            return []
+        finally:
+            if self.checkpoints is not None and not failed:
+                self.checkpoints.clear()
+            profiler.finish_run()
+
+    def _open_checkpoints(self, resume: bool) -> List[str]:
+        """
+        Get the stages a resumed run can skip, or discard stale checkpoints.
+
+        Args:
+            resume (bool): Continue from existing checkpoints
+
+        Returns:
+            List[str]: Completed stages of the run being resumed
+        """
+        if self.checkpoints is None:
             return []
+        if not resume:
+            self.checkpoints.clear()
+            return []
+        done = self.checkpoints.completed_stages()
+        if done:
+            logger.info("Resuming run, skipping completed stages: %s", done)
+        else:
+            logger.info("No checkpoint to resume from, starting a new run")
+        return done
+
+    def _commit_feed_state(self, feed_urls: Optional[List[str]] = None):
+        """Persist the validators of feeds whose articles are saved."""
+        if self.feed_state is not None:
+            self.feed_state.commit(feed_urls)
+
+    def _checkpoint(self, stage: str, data: Any = None):
+        """Checkpoint a completed stage if checkpoints are enabled."""
+        if self.checkpoints is not None:
+            self.checkpoints.save_stage(stage, data)
+
+    def _score_checkpointed(
+        self, articles: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Score articles in batches, checkpointing each one.
+
+        Batches checkpointed by an earlier attempt of the run are loaded
+        instead of being scored again.
+
+        Args:
+            articles (List[Dict[str, Any]]): Processed articles
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: All scored
+            articles, and the canonical ones that represent each story once
+        """
+        if self.checkpoints is None:
+            return self._analyze(articles)
+
+        results: List[Dict[str, Any]] = []
+        report_articles: List[Dict[str, Any]] = []
+        scored = 0
+        for batch in self.checkpoints.load_batches("score"):
+            results.extend(batch["results"])
+            report_articles.extend(batch["results"][: batch["canonical"]])
+            scored += batch["inputs"]
+        if scored:
+            logger.info("Loaded %d checkpointed scored articles", scored)
+
+        batch_size = CHECKPOINTS["score_batch_size"]
+        for start in range(scored, len(articles), batch_size):
+            batch = articles[start : start + batch_size]
+            batch_results, batch_report = self._analyze(batch)
+            # _analyze puts the canonical articles first
+            self.checkpoints.append_batch(
+                "score",
+                {
+                    "inputs": len(batch),
+                    "canonical": len(batch_report),
+                    "results": batch_results,
+                },
+            )
+            results.extend(batch_results)
+            report_articles.extend(batch_report)
+        return results, report_articles
+
+    def _analyze(
+        self, articles: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Score articles, scoring each near-duplicate story only once.
+
+        Args:
+            articles (List[Dict[str, Any]]): Processed articles
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: All scored
+            articles, and the canonical ones that represent each story once
+        """
+        if self.near_duplicates is None:
+            results = self.analyzer.analyze_articles(articles)
+            return results, results
+
+        canonical, duplicates = self.near_duplicates.assign_clusters(articles)
+        results = self.analyzer.analyze_articles(canonical)
+        self.near_duplicates.record_sentiment(results)
+        unresolved = self.near_duplicates.copy_sentiment(duplicates)
+        if unresolved:
+            self.analyzer.analyze_articles(unresolved)
+        return results + duplicates, results
+
+    def run_streaming(
+        self,
+        feeds: Dict[str, str] = None,
+        output_path: Optional[str] = STREAMING["output_path"],
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline as concurrent stages connected by bounded queues.
+
+        Articles flow through ingest, dedupe, preprocess, score and persist
+        as soon as their feed is fetched, so inference overlaps with network
+        I/O and memory stays bounded by the queue sizes. Results are appended
+        to the article store, or to ``output_path`` as JSON Lines, and no
+        report is generated. The validators of a feed are committed at the
+        end unless some of its articles failed to score or persist.
+
+        Args:
+            feeds (Dict[str, str]): Source name to feed URL, defaults to
+                ``RSS_FEEDS``
+            output_path (Optional[str]): JSON Lines file the results are
+                appended to instead of the article store
+
+        Returns:
+            Dict[str, Any]: Stage graph statistics, including the end-to-end
+            latency per article
+        """
+        feeds = feeds or RSS_FEEDS
+        failed_sources = set()
+        if self.feed_state is not None:
+            self.feed_state.discard()
+
+        async def fetch(sources: List[Tuple[str, str]]) -> List[List[Dict[str, Any]]]:
+            async with AsyncNewsFetcher(feed_state=self.feed_state) as fetcher:
+                return await asyncio.gather(
+                    *(fetcher.fetch_source(source, url) for source, url in sources)
+                )
+
+        def ingest(sources: List[Tuple[str, str]]) -> List[List[Dict[str, Any]]]:
+            # Each ingest worker thread runs its own event loop
+            with profiler.span("fetch", len(sources)):
+                return asyncio.run(fetch(sources))
+
+        def dedupe(articles: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+            if self.seen_index is None:
+                return articles
+            with profiler.span("dedupe", len(articles)):
+                unseen = {id(a) for a in self.seen_index.filter_unseen(articles)}
+            return [article if id(article) in unseen else None for article in articles]
+
+        def preprocess(
+            articles: List[Dict[str, Any]],
+        ) -> List[Optional[Dict[str, Any]]]:
+            with profiler.span("preprocess", len(articles)):
+                return [process_article(article) for article in articles]
+
+        def hold_validators(articles: List[Dict[str, Any]]):
+            # Their feeds are fetched in full again by the next run
+            failed_sources.update([article["source"] for article in articles])
+
+        def score(articles: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+            try:
+                with profiler.span("score", len(articles)):
+                    self._analyze(articles)
+            except Exception:
+                hold_validators(articles)
+                raise
+            hold_validators(
+                [article for article in articles if "sentiment" not in article]
+            )
+            return [article if "sentiment" in article else None for article in articles]
+
+        def persist(articles: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+            try:
+                with profiler.span("save", len(articles)):
+                    if output_path is None:
+                        saved = self.storage.save_results(articles)
+                    else:
+                        saved = self.storage.append_to_jsonl(articles, output_path)
+                    if not saved:
+                        hold_validators(articles)
+                        return [None] * len(articles)
+                    if self.seen_index is not None:
+                        self.seen_index.mark_seen(articles)
+            except Exception:
+                hold_validators(articles)
+                raise
+            return articles
+
+        timeout = STREAMING["batch_timeout"]
+        graph = StageGraph(
+            [
+                Stage("ingest", ingest, STREAMING["ingest_workers"], expand=True),
+                Stage("dedupe", dedupe, 1, STREAMING["score_batch_size"], timeout),
+                Stage(
+                    "preprocess",
+                    preprocess,
+                    STREAMING["preprocess_workers"],
+                    STREAMING["score_batch_size"],
+                    timeout,
+                ),
+                Stage(
+                    "score",
+                    score,
+                    STREAMING["score_workers"],
+                    STREAMING["score_batch_size"],
+                    timeout,
+                ),
+                Stage("persist", persist, 1, STREAMING["persist_batch_size"], timeout),
+            ],
+            queue_size=STREAMING["queue_size"],
+        )
+        logger.info("Starting streaming sentiment analysis pipeline")
+        profiler.begin_run("streaming")
+        try:
+            stats = graph.run(feeds.items())
+        finally:
+            profiler.finish_run()
+        if self.feed_state is not None:
+            self._commit_feed_state(
+                [url for source, url in feeds.items() if source not in failed_sources]
+            )
+            self.feed_state.log_summary()
+        latency = stats["latency"]
+        logger.info(
+            "Streamed %d articles in %.2f seconds (latency p50 %ss, p95 %ss)",
+            stats["completed"],
+            stats["seconds"],
+            latency["p50"],
+            latency["p95"],
+        )
+        for name, stage_stats in stats["stages"].items():
+            logger.info("Stage %s: %s", name, stage_stats)
+        return stats
+
+    def close(self):
+        """Release resources held by the pipeline components."""
+        self.storage.close()
+        if isinstance(self.analyzer, ShardedSentimentScorer):
+            self.analyzer.close()
+        if self.seen_index is not None:
+            self.seen_index.close()
+        if self.near_duplicates is not None:
+            self.near_duplicates.close()
 
 
 def main():
     """Main entry point for the pipeline."""
-    pipeline = SentimentAnalysisPipeline()
-    pipeline.run()
+    parser = argparse.ArgumentParser(description="Financial news sentiment pipeline")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PARALLEL_SCORING["workers"],
+        help="Number of scoring processes (1 scores in-process)",
+    )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=PARALLEL_SCORING["threads_per_worker"],
+        help="Torch intra-op threads per scoring process",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Process every fetched article, including ones seen in earlier runs",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Run the stages concurrently, appending results as they are scored",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running cycles with the model and caches loaded",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DAEMON["interval"],
+        help="Seconds between the starts of two daemon cycles",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue a failed run from its last checkpointed stage or batch",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage time, CPU and memory to "
+        f"{INSTRUMENTATION['profile_dir']}",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiler.enabled = True
+    if args.daemon and args.streaming:
+        parser.error(
+            "--daemon runs batch cycles and cannot be combined with --streaming"
+        )
+    if args.resume and (args.daemon or args.streaming):
+        parser.error("--resume only applies to a single batch run")
+
+    pipeline = SentimentAnalysisPipeline(
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        incremental=SEEN_INDEX["enabled"] and not args.full,
+    )
+    try:
+        if args.daemon:
+            # pylint: disable=import-outside-toplevel
+            from .pipeline_daemon import PipelineDaemon
+
+            daemon = PipelineDaemon(pipeline, interval=args.interval)
+            daemon.install_signal_handlers()
+            try:
+                daemon.run()
+            finally:
+                daemon.close()
+        elif args.streaming:
+            pipeline.run_streaming()
+        else:
+            pipeline.run(resume=args.resume)
+    finally:
+        pipeline.close()
 
 
 if __name__ == "__main__":
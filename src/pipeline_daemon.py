@@ -0,0 +1,262 @@
+"""
+Long-running pipeline daemon keeping models, sessions and caches warm.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from . import serialization
+from .async_ingestion import AsyncNewsFetcher
+from .config import ASYNC_INGESTION, DAEMON, RSS_FEEDS
+from .feed_state import FeedStateStore
+from .news_ingestion import NewsFetcher, fetch_all_feeds
+from .pipeline import SentimentAnalysisPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class WarmFeedFetcher:
+    """
+    Feed fetcher whose HTTP session stays open between cycles.
+
+    The async engine runs on a private event loop that outlives each cycle,
+    so pooled connections are reused and the per-host rate limits carry
+    over from one cycle to the next.
+    """
+
+    def __init__(
+        self,
+        feeds: Dict[str, str] = None,
+        concurrent: bool = ASYNC_INGESTION["enabled"],
+        feed_state: Optional[FeedStateStore] = None,
+    ):
+        """
+        Args:
+            feeds (Dict[str, str]): Source name to feed URL, defaults to
+                ``RSS_FEEDS``
+            concurrent (bool): Use the async engine instead of the
+                sequential fetcher
+            feed_state (Optional[FeedStateStore]): Conditional GET
+                validators, committed by the pipeline after each save
+        """
+        self.feeds = feeds or RSS_FEEDS
+        self.concurrent = concurrent
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_fetcher: Optional[AsyncNewsFetcher] = None
+        self._fetcher: Optional[NewsFetcher] = None
+        if concurrent:
+            self._loop = asyncio.new_event_loop()
+            self._async_fetcher = AsyncNewsFetcher(feed_state=feed_state)
+            self._loop.run_until_complete(self._async_fetcher.__aenter__())
+        else:
+            self._fetcher = NewsFetcher(feed_state)
+
+    def fetch_all(self) -> List[Dict[str, Any]]:
+        """
+        Fetch articles from all feeds over the open session.
+
+        Returns:
+            List[Dict[str, Any]]: Combined list of articles from all feeds
+        """
+        if not self.concurrent:
+            return fetch_all_feeds(concurrent=False, fetcher=self._fetcher)
+        articles = self._loop.run_until_complete(
+            self._async_fetcher.fetch_all(self.feeds)
+        )
+        if self._async_fetcher.feed_state:
+            self._async_fetcher.feed_state.log_summary()
+        logger.info("Total articles fetched: %d", len(articles))
+        return articles
+
+    def close(self):
+        """Close the session and its event loop."""
+        if self._loop is not None:
+            self._loop.run_until_complete(
+                self._async_fetcher.__aexit__(None, None, None)
+            )
+            self._loop.close()
+            self._loop = None
+
+
+class PipelineDaemon:
+    """
+    Run pipeline cycles on a fixed schedule in one long-lived process.
+
+    Cycles run one at a time. Ticks that fall due while a cycle is still
+    running, and ``trigger`` calls made meanwhile, are coalesced into a
+    single follow-up cycle. ``stop`` lets the running cycle finish before
+    the loop returns.
+    """
+
+    def __init__(
+        self,
+        pipeline: Optional[SentimentAnalysisPipeline] = None,
+        fetcher: Optional[WarmFeedFetcher] = None,
+        interval: float = DAEMON["interval"],
+        metrics_path: Optional[str] = DAEMON["metrics_path"],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            pipeline (Optional[SentimentAnalysisPipeline]): Pipeline reused
+                by every cycle
+            fetcher (Optional[WarmFeedFetcher]): Fetcher reused by every
+                cycle, created on start by default
+            interval (float): Seconds between the starts of two cycles
+            metrics_path (Optional[str]): JSON file the metrics are exported
+                to after each cycle (None disables)
+            clock (Callable[[], float]): Monotonic source of the current time
+        """
+        self.pipeline = pipeline or SentimentAnalysisPipeline()
+        self.fetcher = fetcher
+        self.interval = interval
+        self.metrics_path = metrics_path
+        self.clock = clock
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self.metrics: Dict[str, Any] = {
+            "cycles": 0,
+            "coalesced_ticks": 0,
+            "busy_seconds": 0.0,
+            "idle_seconds": 0.0,
+            "last_cycle": None,
+        }
+
+    def warmup(self):
+        """Load the model and open the feed session ahead of the first cycle."""
+        if self.fetcher is None:
+            self.fetcher = WarmFeedFetcher(feed_state=self.pipeline.feed_state)
+        warmup = getattr(self.pipeline.analyzer, "warmup", None)
+        if warmup is not None:
+            warmup()
+
+    def trigger(self):
+        """Start a cycle now, or right after the running one."""
+        self._wake.set()
+
+    def stop(self):
+        """Stop after the running cycle, if any, has finished."""
+        self._stop.set()
+        self._wake.set()
+
+    def install_signal_handlers(self):
+        """Stop on SIGTERM and SIGINT; run a cycle now on SIGHUP."""
+        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        signal.signal(signal.SIGINT, lambda *_: self.stop())
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, lambda *_: self.trigger())
+
+    def run_cycle(self, idle_seconds: float = 0.0) -> Dict[str, Any]:
+        """
+        Run one pipeline cycle and record its metrics.
+
+        Args:
+            idle_seconds (float): Time spent waiting before this cycle
+
+        Returns:
+            Dict[str, Any]: Metrics of the cycle
+        """
+        start_time = self.clock()
+        results = self.pipeline.run(
+            save_csv=DAEMON["save_csv"],
+            generate_report=DAEMON["generate_report"],
+            fetch=self.fetcher.fetch_all,
+        )
+        duration = self.clock() - start_time
+        cycle = {
+            "started_at": time.time() - duration,
+            "duration": round(duration, 3),
+            "idle_before": round(idle_seconds, 3),
+            "articles": len(results),
+            "stages": {
+                stage: round(seconds, 3)
+                for stage, seconds in self.pipeline.stage_seconds.items()
+            },
+        }
+        self.metrics["cycles"] += 1
+        self.metrics["busy_seconds"] += duration
+        self.metrics["idle_seconds"] += idle_seconds
+        self.metrics["last_cycle"] = cycle
+        logger.info(
+            "Cycle %d: %d articles in %.2fs after %.1fs idle, stages %s",
+            self.metrics["cycles"],
+            cycle["articles"],
+            duration,
+            idle_seconds,
+            cycle["stages"],
+        )
+        self.export_metrics()
+        return cycle
+
+    def run(self, max_cycles: Optional[int] = None):
+        """
+        Run cycles until stopped.
+
+        Args:
+            max_cycles (Optional[int]): Stop after this many cycles
+        """
+        self.warmup()
+        next_due = self.clock()
+        while not self._stop.is_set() and (
+            max_cycles is None or self.metrics["cycles"] < max_cycles
+        ):
+            idle_start = self.clock()
+            delay = next_due - idle_start
+            if delay > 0:
+                self._wake.wait(delay)
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            cycle_start = self.clock()
+            self.run_cycle(idle_seconds=cycle_start - idle_start)
+
+            now = self.clock()
+            if cycle_start >= next_due:  # A scheduled tick, not an early trigger
+                next_due += self.interval
+            if next_due <= now:
+                # Ticks missed by a long cycle collapse into one cycle now
+                if self.interval > 0:
+                    missed = int((now - next_due) // self.interval) + 1
+                    self.metrics["coalesced_ticks"] += missed - 1
+                next_due = now
+        logger.info("Daemon stopped after %d cycles", self.metrics["cycles"])
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get cycle, busy and idle time metrics.
+
+        Returns:
+            Dict[str, Any]: Totals and the metrics of the last cycle
+        """
+        metrics = dict(self.metrics)
+        total = metrics["busy_seconds"] + metrics["idle_seconds"]
+        metrics["busy_seconds"] = round(metrics["busy_seconds"], 3)
+        metrics["idle_seconds"] = round(metrics["idle_seconds"], 3)
+        metrics["utilization"] = (
+            round(metrics["busy_seconds"] / total, 4) if total else 0.0
+        )
+        return metrics
+
+    def export_metrics(self):
+        """Write the metrics to ``metrics_path`` atomically."""
+        if not self.metrics_path:
+            return
+        try:
+            directory = os.path.dirname(self.metrics_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.metrics_path}.tmp"
+            serialization.dump(self.get_metrics(), tmp_path, pretty=True)
+            os.replace(tmp_path, self.metrics_path)
+        except OSError as e:
+            logger.error("Error exporting daemon metrics: %s", str(e))
+
+    def close(self):
+        """Close the feed session."""
+        if self.fetcher is not None:
+            self.fetcher.close()
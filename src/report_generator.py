@@ -2,18 +2,17 @@
 Report generation module for creating LaTeX reports from sentiment analysis results.
 """
 
-import json
 import logging
 import os
 import subprocess
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 from jinja2 import Environment, FileSystemLoader
 
+from . import serialization
+from .articles import ArticleBatch
 from .config import DATA_DIR
 
 logger = logging.getLogger(__name__)
@@ -161,8 +160,7 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
         cache_file = os.path.join(self.cache_dir, f"results_{date}.json")
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                return serialization.load(cache_file)
             except Exception as e:  # pylint: disable=broad-except
                 logger.error("Error reading cache file: %s", str(e))
         return None
@@ -177,21 +175,22 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
         """
         cache_file = os.path.join(self.cache_dir, f"results_{date}.json")
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(results, f, indent=2)
+            serialization.dump(results, cache_file)
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Error writing cache file: %s", str(e))
 
-    def _generate_visualizations(self, results: List[Dict[str, Any]], report_dir: str):
+    def _generate_visualizations(self, batch: ArticleBatch, report_dir: str):
         """
         Generate visualizations for the report.
 
         Args:
-            results (List[Dict[str, Any]]): Analysis results
+            batch (ArticleBatch): Analysis results
             report_dir (str): Directory to save visualizations
         """
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
+        # Plotting libraries are slow to import and only needed here
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
         # Set style
         plt.style.use("seaborn-v0_8")
@@ -199,7 +198,9 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
 
         # Sentiment distribution pie chart
         plt.figure(figsize=(10, 6))
-        sentiment_counts = df["sentiment"].apply(lambda x: x["label"]).value_counts()
+        sentiment_counts = pd.Series(batch.label_counts()).sort_values(
+            ascending=False, kind="stable"
+        )
         plt.pie(
             sentiment_counts,
             labels=sentiment_counts.index,
@@ -218,8 +219,12 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
 
         # Source-wise analysis with average sentiment scores
         plt.figure(figsize=(12, 6))
-        source_sentiment = pd.crosstab(
-            df["source"], df["sentiment"].apply(lambda x: x["label"])
+        source_sentiment = (
+            pd.DataFrame(
+                batch.source_label_matrix(), index=batch.sources, columns=batch.labels
+            )
+            .sort_index()
+            .sort_index(axis=1)
         )
         source_sentiment.plot(kind="bar", stacked=True)
         plt.title("Sentiment Distribution by Source")
@@ -280,8 +285,11 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
             report_dir = os.path.join(self.report_dir, date)
             os.makedirs(report_dir, exist_ok=True)
 
+            # Columnar view shared by the charts and statistics
+            batch = ArticleBatch(results)
+
             # Generate visualizations
-            self._generate_visualizations(results, report_dir)
+            self._generate_visualizations(batch, report_dir)
 
             # Format article titles
             for article in results:
@@ -292,28 +300,12 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
                 "date": date,
                 "total_articles": len(results),
                 "time_period": f"Last 24 hours until {date}",
-                "sources": sorted(set(article["source"] for article in results)),
-                "source_stats": self._calculate_source_stats(results),
-                "top_positive": sorted(
-                    results,
-                    key=lambda x: (
-                        x["sentiment"]["score"]
-                        if x["sentiment"]["label"] == "Positive"
-                        else 0
-                    ),
-                    reverse=True,
-                )[:5],
-                "top_negative": sorted(
-                    results,
-                    key=lambda x: (
-                        x["sentiment"]["score"]
-                        if x["sentiment"]["label"] == "Negative"
-                        else 0
-                    ),
-                    reverse=True,
-                )[:5],
-                "overall_sentiment": self._calculate_overall_sentiment(results),
-                "interpretation": self._generate_interpretation(results),
+                "sources": sorted(batch.sources),
+                "source_stats": self._calculate_source_stats(batch),
+                "top_positive": batch.top("Positive", 5),
+                "top_negative": batch.top("Negative", 5),
+                "overall_sentiment": self._calculate_overall_sentiment(batch),
+                "interpretation": self._generate_interpretation(batch),
             }
 
             # Render template
@@ -353,60 +345,36 @@ This report uses the FinBERT model, a specialized BERT model trained on financia
             logger.error("Error generating report: %s", str(e))
             raise
 
-    def _calculate_source_stats(
-        self, results: List[Dict[str, Any]]
-    ) -> Dict[str, Dict[str, int]]:
+    def _calculate_source_stats(self, batch: ArticleBatch) -> Dict[str, Dict[str, int]]:
         """
         Calculate sentiment statistics by source.
 
         Args:
-            results (List[Dict[str, Any]]): Analysis results
+            batch (ArticleBatch): Analysis results
 
         Returns:
             Dict[str, Dict[str, int]]: Statistics by source
         """
-        stats = {}
-        for article in results:
-            source = article["source"]
-            sentiment = article["sentiment"]["label"]
+        return batch.source_stats()
 
-            if source not in stats:
-                stats[source] = {"positive": 0, "neutral": 0, "negative": 0}
-
-            stats[source][sentiment.lower()] += 1
-
-        return stats
-
-    def _calculate_overall_sentiment(self, results: List[Dict[str, Any]]) -> str:
+    def _calculate_overall_sentiment(self, batch: ArticleBatch) -> str:
         """
         Calculate the overall sentiment based on the majority sentiment label.
 
         Args:
-            results (List[Dict[str, Any]]): Analysis results
+            batch (ArticleBatch): Analysis results
 
         Returns:
             str: Overall sentiment label
         """
-        sentiment_counts = {}
-        for result in results:
-            label = result["sentiment"]["label"]
-            sentiment_counts[label] = sentiment_counts.get(label, 0) + 1
-        return max(sentiment_counts.items(), key=lambda x: x[1])[0]
+        return max(batch.label_counts().items(), key=lambda x: x[1])[0]
 
-    def _generate_interpretation(self, results: List[Dict[str, Any]]) -> str:
+    def _generate_interpretation(self, batch: ArticleBatch) -> str:
         """
         Generate a brief interpretation of the sentiment analysis results.
         """
-        sentiment_counts = {}
-        source_sentiment = {}
-        for result in results:
-            label = result["sentiment"]["label"]
-            source = result["source"]
-            sentiment_counts[label] = sentiment_counts.get(label, 0) + 1
-            if source not in source_sentiment:
-                source_sentiment[source] = {"positive": 0, "neutral": 0, "negative": 0}
-            source_sentiment[source][label.lower()] += 1
-        total = len(results)
+        source_sentiment = batch.source_stats()
+        total = len(batch)
         if source_sentiment:
             most_negative_source = max(
                 source_sentiment.items(),
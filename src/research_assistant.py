@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
 from datetime import datetime
 from typing import List, Dict
 import requests
 from bs4 import BeautifulSoup
-from transformers import pipeline
 import pandas as pd
 from pathlib import Path
 import logging
 
+try:
+    from src import serialization
+    from src.model_registry import get_pipeline
+except ModuleNotFoundError:
+    # Run as a script (python src/research_assistant.py): src/ is on sys.path
+    import serialization
+    from model_registry import get_pipeline
+
+SUMMARIZATION_MODEL = "facebook/bart-large-cnn"
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,17 +29,19 @@ logger = logging.getLogger(__name__)
 
 class ResearchAssistant:
     def __init__(self):
-        """Initialize the Research Assistant with necessary models and configurations."""
+        """Initialize the Research Assistant; models are loaded on first use."""
         logger.info("Initializing Research Assistant...")
-        try:
-            # Initialize the summarization and sentiment analysis pipelines
-            self.summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
-            self.sentiment_analyzer = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
-            logger.info("Models loaded successfully")
-        except Exception as e:
-            logger.error(f"Error initializing models: {e}")
-            raise
-        
+
+    @property
+    def summarizer(self):
+        """Shared summarization pipeline, loaded on first use."""
+        return get_pipeline("summarization", SUMMARIZATION_MODEL)
+
+    @property
+    def sentiment_analyzer(self):
+        """Shared sentiment analysis pipeline, loaded on first use."""
+        return get_pipeline("sentiment-analysis", SENTIMENT_MODEL)
+
     def scrape_news(self, topic: str, num_articles: int = 5) -> List[Dict]:
         """
         Scrape news articles related to the given topic using NewsAPI
@@ -180,8 +191,7 @@ class ResearchAssistant:
         filepath = output_path / filename
         
         try:
-            with open(filepath, 'w') as f:
-                json.dump(report, f, indent=2)
+            serialization.dump(report, str(filepath), pretty=True)
             logger.info(f"Report saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving report: {e}")
@@ -0,0 +1,177 @@
+"""
+Persistent index of already ingested articles.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List
+
+from .config import SEEN_INDEX
+
+logger = logging.getLogger(__name__)
+
+
+def article_keys(article: Dict[str, Any]) -> List[bytes]:
+    """
+    Build the identity keys of an article.
+
+    An article is identified by its GUID and its link when present, and by
+    a hash of its normalized title and summary, which catches feeds that
+    rotate links or omit GUIDs.
+
+    Args:
+        article (Dict[str, Any]): Raw article from the fetcher
+
+    Returns:
+        List[bytes]: 16-byte digests, one per identity
+    """
+    identities = []
+    if article.get("guid"):
+        identities.append(f"guid\0{article['guid']}")
+    if article.get("link"):
+        identities.append(f"link\0{article['link']}")
+    content = " ".join(
+        f"{article.get('title', '')} {article.get('summary', '')}".lower().split()
+    )
+    if content:
+        identities.append(f"content\0{content}")
+    return [
+        hashlib.blake2b(identity.encode("utf-8"), digest_size=16).digest()
+        for identity in identities
+    ]
+
+
+class SeenIndex:
+    """
+    SQLite set of article keys with time-based compaction.
+
+    Keys are fixed-size digests in a ``WITHOUT ROWID`` table, so a million
+    articles take a few tens of megabytes and lookups are single B-tree
+    probes.
+    """
+
+    def __init__(
+        self,
+        path: str = SEEN_INDEX["path"],
+        ttl_days: float = SEEN_INDEX["ttl_days"],
+    ):
+        """
+        Open (or create) the index and drop expired keys.
+
+        Args:
+            path (str): SQLite database file
+            ttl_days (float): Age after which keys are forgotten
+        """
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            "key BLOB PRIMARY KEY, seen_at REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_at ON seen (seen_at)")
+        self._conn.commit()
+        self.compact()
+
+    def _contains(self, keys: List[bytes]) -> set:
+        """Return the subset of keys present in the index."""
+        found = set()
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key FROM seen WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    def filter_unseen(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep the articles none of whose keys have been seen.
+
+        Repeats within ``articles`` are dropped as well, keeping the first.
+
+        Args:
+            articles (List[Dict[str, Any]]): Raw articles from the fetcher
+
+        Returns:
+            List[Dict[str, Any]]: Articles not ingested before, in input order
+        """
+        keys_per_article = [article_keys(article) for article in articles]
+        with self._lock:
+            try:
+                seen = self._contains(
+                    [key for keys in keys_per_article for key in keys]
+                )
+            except sqlite3.Error as e:
+                logger.error("Error reading seen index: %s", str(e))
+                return articles
+
+        unseen = []
+        for article, keys in zip(articles, keys_per_article):
+            if seen.isdisjoint(keys):
+                unseen.append(article)
+                seen.update(keys)
+        logger.info(
+            "Seen index: %d new of %d fetched articles", len(unseen), len(articles)
+        )
+        return unseen
+
+    def mark_seen(self, articles: List[Dict[str, Any]]):
+        """
+        Record articles as ingested.
+
+        Args:
+            articles (List[Dict[str, Any]]): Raw articles from the fetcher
+        """
+        now = time.time()
+        rows = [(key, now) for article in articles for key in article_keys(article)]
+        with self._lock:
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)", rows
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error("Error writing seen index: %s", str(e))
+
+    def compact(self) -> int:
+        """
+        Forget keys older than the TTL.
+
+        Returns:
+            int: Number of keys removed
+        """
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            try:
+                removed = self._conn.execute(
+                    "DELETE FROM seen WHERE seen_at < ?", (cutoff,)
+                ).rowcount
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error("Error compacting seen index: %s", str(e))
+                return 0
+        if removed:
+            logger.info("Compacted %d expired keys from seen index", removed)
+        return removed
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self):
+        """Close the on-disk index."""
+        with self._lock:
+            self._conn.close()
@@ -3,43 +3,314 @@ Sentiment analysis module using FinBERT model.
 """
 
 import logging
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-import torch
+import numpy as np
 from tqdm import tqdm
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
 
-from .config import MODEL_NAME, SENTIMENT_LABELS
+from .config import (
+    BATCH_SIZE,
+    CASCADE_THRESHOLD,
+    INFERENCE_BACKEND,
+    LONG_TEXTS,
+    MAX_BATCH_TOKENS,
+    MAX_LENGTH,
+    MODEL_NAME,
+    MODEL_REVISION,
+    SENTIMENT_CACHE,
+    SENTIMENT_LABELS,
+)
+from .instrumentation import profiler
+from .lexicon_scorer import LexiconScorer
+from .model_registry import get_backend
+from .sentiment_cache import SentimentCache
 
 logger = logging.getLogger(__name__)
 
 
+def plan_token_batches(
+    lengths: List[int], max_batch_size: int, max_batch_tokens: Optional[int]
+) -> List[List[int]]:
+    """
+    Group input indices into batches that respect a padded token budget.
+
+    Inputs are sorted by token length so each batch holds texts of similar
+    length, and a batch is closed once adding the next (longest so far) text
+    would push ``batch size * longest length`` over the budget. A single text
+    longer than the budget still gets a batch of its own. Without a budget the
+    inputs are split into consecutive fixed-size batches.
+
+    Args:
+        lengths (List[int]): Token length of each input
+        max_batch_size (int): Maximum number of inputs per batch
+        max_batch_tokens (Optional[int]): Padded token budget per batch
+
+    Returns:
+        List[List[int]]: Input indices per batch
+    """
+    if max_batch_tokens is None:
+        return [
+            list(range(start, min(start + max_batch_size, len(lengths))))
+            for start in range(0, len(lengths), max_batch_size)
+        ]
+
+    batches = []
+    batch = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        padded_cost = (len(batch) + 1) * lengths[index]
+        if batch and (len(batch) >= max_batch_size or padded_cost > max_batch_tokens):
+            batches.append(batch)
+            batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+AGGREGATIONS = ("mean", "max_negative", "length_weighted")
+
+
+def aggregate_windows(
+    probabilities: np.ndarray,
+    lengths: List[int],
+    method: str,
+    negative_index: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Combine the class probabilities of one text's windows.
+
+    Args:
+        probabilities (np.ndarray): ``(windows, num_labels)`` probabilities
+        lengths (List[int]): Token length of each window
+        method (str): ``"mean"`` averages the windows, ``"length_weighted"``
+            weights them by token length and ``"max_negative"`` keeps the
+            window most likely to be negative
+        negative_index (Optional[int]): Class index of the negative label;
+            without one ``"max_negative"`` falls back to the mean
+
+    Returns:
+        np.ndarray: Probabilities of the whole text
+    """
+    if method == "max_negative" and negative_index is not None:
+        return probabilities[int(probabilities[:, negative_index].argmax())]
+    if method == "length_weighted":
+        return np.average(probabilities, axis=0, weights=lengths)
+    return probabilities.mean(axis=0)
+
+
 class SentimentAnalyzer:
     """Class for performing sentiment analysis using FinBERT."""
 
-    def __init__(self):
-        """Initialize the sentiment analyzer with FinBERT model."""
+    def __init__(
+        self,
+        model_name: str = MODEL_NAME,
+        batch_size: int = BATCH_SIZE,
+        max_batch_tokens: Optional[int] = MAX_BATCH_TOKENS,
+        use_cache: bool = SENTIMENT_CACHE["enabled"],
+        backend: str = INFERENCE_BACKEND,
+        cascade_threshold: Optional[float] = CASCADE_THRESHOLD,
+        long_text_mode: str = LONG_TEXTS["mode"],
+        aggregation: str = LONG_TEXTS["aggregation"],
+    ):
+        """
+        Initialize the sentiment analyzer with FinBERT model.
+
+        Args:
+            model_name (str): Hugging Face model name or local path
+            batch_size (int): Maximum number of texts scored per forward pass
+            max_batch_tokens (Optional[int]): Padded token budget per forward
+                pass; None disables length bucketing
+            use_cache (bool): Reuse results for previously scored texts
+            backend (str): Inference backend, one of ``"pytorch"``,
+                ``"pytorch-int8"`` or ``"onnx"``
+            cascade_threshold (Optional[float]): Lexicon confidence at which
+                a text skips the model; None scores everything with the model
+            long_text_mode (str): ``"truncate"`` scores the first MAX_LENGTH
+                tokens of a text, ``"chunk"`` scores overlapping windows
+            aggregation (str): How window probabilities are combined in chunk
+                mode, one of ``AGGREGATIONS``
+        """
+        if long_text_mode not in ("truncate", "chunk"):
+            raise ValueError(f"Unknown long text mode '{long_text_mode}'")
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f"Unknown window aggregation '{aggregation}'")
+        self.model_name = model_name
+        self.backend_name = backend
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
+        self.use_cache = use_cache
+        self.batch_metrics: Dict[str, Any] = {}
+        self.cascade_threshold = cascade_threshold
+        self.long_text_mode = long_text_mode
+        self.aggregation = aggregation
+        self.lexicon = LexiconScorer()
+        self.cascade_stats = {"texts": 0, "escalated": 0, "lexicon_cpu_seconds": 0.0}
+        self._cache: Optional[SentimentCache] = None
+
+    @property
+    def backend(self):
+        """Inference backend, loaded through the shared registry on first use."""
+        return get_backend(self.model_name, self.backend_name, MODEL_REVISION)
+
+    @property
+    def tokenizer(self):
+        """Tokenizer of the inference backend."""
+        return self.backend.tokenizer
+
+    @property
+    def id2label(self) -> Dict[int, str]:
+        """Mapping from class index to model label."""
+        return self.backend.id2label
+
+    @property
+    def cache(self) -> Optional[SentimentCache]:
+        """Result cache, or None when caching is disabled."""
+        if self.use_cache and self._cache is None:
+            # Results differ slightly between backends and long text
+            # handling, so each combination gets its own keys
+            namespace = f"{self.model_name}@{self.backend.revision}/{self.backend_name}"
+            if self.long_text_mode == "chunk":
+                namespace += f"/chunk-{self.aggregation}"
+            self._cache = SentimentCache(namespace)
+        return self._cache
+
+    def warmup(self):
+        """Load the model and open the cache ahead of the first request."""
+        _ = self.backend, self.cache
+        logger.info("Successfully initialized sentiment analyzer")
+
+    @staticmethod
+    def _format_result(label: str, score: float) -> Dict[str, Any]:
+        """Map a raw model label and score to the stored result format."""
+        return {
+            "label": SENTIMENT_LABELS.get(label.lower(), label),
+            "score": round(score, 3),
+        }
+
+    @property
+    def negative_index(self) -> Optional[int]:
+        """Class index of the negative label, if the model has one."""
+        return next(
+            (
+                index
+                for index, label in self.id2label.items()
+                if SENTIMENT_LABELS.get(label.lower()) == "Negative"
+            ),
+            None,
+        )
+
+    def _encode(self, texts: List[str]) -> Tuple[List[Dict[str, List[int]]], List[int]]:
+        """
+        Tokenize texts into model inputs of at most MAX_LENGTH tokens.
+
+        In chunk mode a long text yields up to ``max_windows`` windows that
+        overlap by ``stride`` tokens; otherwise every text is truncated to a
+        single input.
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            Tuple[List[Dict[str, List[int]]], List[int]]: Unpadded tokenizer
+            outputs, and the index of the text each one belongs to
+        """
+        if self.long_text_mode == "chunk":
+            encodings = self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=MAX_LENGTH,
+                stride=LONG_TEXTS["stride"],
+                return_overflowing_tokens=True,
+            )
+            owners = list(encodings.pop("overflow_to_sample_mapping"))
+        else:
+            encodings = self.tokenizer(texts, truncation=True, max_length=MAX_LENGTH)
+            owners = list(range(len(texts)))
+
+        features = []
+        kept_owners = []
+        windows = [0] * len(texts)
+        for i, owner in enumerate(owners):
+            windows[owner] += 1
+            if windows[owner] <= LONG_TEXTS["max_windows"]:
+                features.append({key: values[i] for key, values in encodings.items()})
+                kept_owners.append(owner)
+        return features, kept_owners
+
+    def _combine(
+        self, probabilities: List[Optional[np.ndarray]], lengths: List[int]
+    ) -> Dict[str, Any]:
+        """
+        Turn the window probabilities of one text into a sentiment result.
+
+        Args:
+            probabilities (List[Optional[np.ndarray]]): Probabilities per
+                window, None where scoring failed
+            lengths (List[int]): Token length of each window
+
+        Returns:
+            Dict[str, Any]: Sentiment result
+        """
+        if not probabilities or any(row is None for row in probabilities):
+            return {"label": "Unknown", "score": 0.0}
+        row = aggregate_windows(
+            np.stack(probabilities), lengths, self.aggregation, self.negative_index
+        )
+        label_id = int(row.argmax())
+        return self._format_result(self.id2label[label_id], float(row[label_id]))
+
+    def _predict_window(self, feature: Dict[str, List[int]]) -> Optional[np.ndarray]:
+        """Score one tokenized window as a batch of one."""
+        try:
+            return self.backend.predict_proba([feature])[0]
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error analyzing text: %s", str(e))
+            return None
+
+    def _score_text(self, text: str) -> Dict[str, Any]:
+        """Score a single text, whose windows form one batch."""
         try:
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            logger.info("Using device: %s", self.device)
-
-            # Load model and tokenizer
-            self.tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-            self.model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-
-            # Create pipeline
-            self.analyzer = pipeline(
-                "sentiment-analysis",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if self.device == "cuda" else -1,
+            features, _ = self._encode([text])
+            probabilities = self.backend.predict_proba(features)
+            return self._combine(
+                list(probabilities), [len(f["input_ids"]) for f in features]
             )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error analyzing text: %s", str(e))
+            return {"label": "Unknown", "score": 0.0}
 
-            logger.info("Successfully initialized sentiment analyzer")
+    def _store_in_cache(self, texts: List[str], results: List[Dict[str, Any]]):
+        """Cache successful results; failures are retried on the next run."""
+        scored = [
+            (text, result)
+            for text, result in zip(texts, results)
+            if result["label"] != "Unknown"
+        ]
+        if self.cache is not None and scored:
+            self.cache.put_many(*map(list, zip(*scored)))
 
-        except Exception as e:
-            logger.error("Error initializing sentiment analyzer: %s", str(e))
-            raise
+    def _apply_cascade(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Score texts with the lexicon and keep only confident results.
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Lexicon result, or None where the
+            text must be escalated to the model
+        """
+        start_time = time.process_time()
+        results = [
+            result if result["score"] >= self.cascade_threshold else None
+            for result in self.lexicon.score_texts(texts)
+        ]
+        escalated = sum(result is None for result in results)
+        self.cascade_stats["texts"] += len(texts)
+        self.cascade_stats["escalated"] += escalated
+        self.cascade_stats["lexicon_cpu_seconds"] += time.process_time() - start_time
+        return results
 
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -51,51 +322,218 @@ class SentimentAnalyzer:
         Returns:
             Dict[str, Any]: Sentiment analysis results
         """
-        try:
-            result = self.analyzer(text)[0]
-            return {
-                "label": SENTIMENT_LABELS.get(result["label"].lower(), result["label"]),
-                "score": round(result["score"], 3),
-            }
-        except Exception as e:  # pylint: disable=broad-except
-            logger.error("Error analyzing text: %s", str(e))
-            return {"label": "Unknown", "score": 0.0}
+        if self.cache is not None:
+            cached = self.cache.get(text)
+            if cached is not None:
+                return cached
+
+        if self.cascade_threshold is not None:
+            lexicon_result = self._apply_cascade([text])[0]
+            if lexicon_result is not None:
+                return lexicon_result
 
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        result = self._score_text(text)
+        self._store_in_cache([text], [result])
+        return result
+
+    def analyze_batch(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Analyze sentiment of multiple texts.
+        Analyze sentiment of multiple texts in length-bucketed batches.
+
+        Texts with a cached result skip tokenization and inference. In cascade
+        mode the remaining texts are scored by the lexicon first and only the
+        uncertain ones reach the model. Those are tokenized in one call,
+        grouped by token length under the analyzer's token budget and padded
+        per batch only. Results are returned in input order.
 
         Args:
             texts (List[str]): List of input texts
+            batch_size (Optional[int]): Maximum texts per forward pass
+                (defaults to the analyzer's batch size)
 
         Returns:
             List[Dict[str, Any]]: List of sentiment analysis results
         """
-        results = []
-        for text in tqdm(texts, desc="Analyzing sentiments"):
-            result = self.analyze_text(text)
-            results.append(result)
+        if self.cache is not None:
+            results = self.cache.get_many(texts)
+        else:
+            results = [None] * len(texts)
+        pending = [i for i, result in enumerate(results) if result is None]
+        if self.cache is not None:
+            logger.info(
+                "Sentiment cache: %d hits, %d misses",
+                len(texts) - len(pending),
+                len(pending),
+            )
+
+        if self.cascade_threshold is not None and pending:
+            lexicon_results = self._apply_cascade([texts[i] for i in pending])
+            for index, result in zip(pending, lexicon_results):
+                results[index] = result
+            escalated = [i for i in pending if results[i] is None]
+            logger.info(
+                "Cascade escalated %d of %d texts to the model (%.1f%%)",
+                len(escalated),
+                len(pending),
+                100 * len(escalated) / len(pending),
+            )
+            pending = escalated
+
+        if pending:
+            pending_texts = [texts[i] for i in pending]
+            scored = self._score_batch(pending_texts, batch_size)
+            self._store_in_cache(pending_texts, scored)
+            for index, result in zip(pending, scored):
+                results[index] = result
+        return results
+
+    def _score_batch(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score texts in length-bucketed batches, bypassing the cache.
+
+        In chunk mode the windows of all texts share the batches and are
+        aggregated per text afterwards. A batch that fails as a whole is
+        retried window by window, so a single bad input only costs its own
+        result.
+
+        Args:
+            texts (List[str]): List of input texts
+            batch_size (Optional[int]): Maximum texts per forward pass
+
+        Returns:
+            List[Dict[str, Any]]: Sentiment results in input order
+        """
+        if not texts:
+            return []
+
+        start_time = time.perf_counter()
+        features, owners = self._encode(texts)
+        lengths = [len(feature["input_ids"]) for feature in features]
+        batches = plan_token_batches(
+            lengths, batch_size or self.batch_size, self.max_batch_tokens
+        )
+
+        probabilities: List[Optional[np.ndarray]] = [None] * len(features)
+        padded_tokens = 0
+        for indices in tqdm(batches, desc="Analyzing sentiments"):
+            padded_tokens += len(indices) * max(lengths[i] for i in indices)
+            with profiler.span("infer", len(indices)):
+                try:
+                    rows = self.backend.predict_proba([features[i] for i in indices])
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.error("Error analyzing batch, retrying per text: %s", str(e))
+                    rows = [self._predict_window(features[i]) for i in indices]
+            for index, row in zip(indices, rows):
+                probabilities[index] = row
+
+        windows: List[List[int]] = [[] for _ in texts]
+        for index, owner in enumerate(owners):
+            windows[owner].append(index)
+        results = [
+            self._combine(
+                [probabilities[i] for i in indices], [lengths[i] for i in indices]
+            )
+            for indices in windows
+        ]
+
+        self._record_batch_metrics(
+            len(texts), len(batches), sum(lengths), padded_tokens, start_time
+        )
+        self.batch_metrics["windows"] = len(features)
         return results
 
-    def analyze_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _record_batch_metrics(
+        self,
+        num_texts: int,
+        num_batches: int,
+        real_tokens: int,
+        padded_tokens: int,
+        start_time: float,
+    ):
+        """Store and log padding efficiency and throughput of the last call."""
+        duration = max(time.perf_counter() - start_time, 1e-9)
+        self.batch_metrics = {
+            "texts": num_texts,
+            "batches": num_batches,
+            "real_tokens": real_tokens,
+            "padded_tokens": padded_tokens,
+            "padding_efficiency": round(real_tokens / max(padded_tokens, 1), 4),
+            "seconds": round(duration, 4),
+            "texts_per_second": round(num_texts / duration, 2),
+            "tokens_per_second": round(real_tokens / duration, 2),
+        }
+        logger.info(
+            "Scored %d texts in %d batches: %.1f%% padding efficiency, "
+            "%.1f texts/s, %.0f tokens/s",
+            num_texts,
+            num_batches,
+            100 * self.batch_metrics["padding_efficiency"],
+            self.batch_metrics["texts_per_second"],
+            self.batch_metrics["tokens_per_second"],
+        )
+
+    def get_batch_metrics(self) -> Dict[str, Any]:
+        """
+        Get padding and throughput metrics of the most recent batch call.
+
+        Returns:
+            Dict[str, Any]: Metrics (empty before the first batch call)
+        """
+        return dict(self.batch_metrics)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters and sizes of the result cache.
+
+        Returns:
+            Dict[str, Any]: Cache statistics (empty when caching is disabled)
+        """
+        return self.cache.get_stats() if self.cache is not None else {}
+
+    def get_cascade_stats(self) -> Dict[str, Any]:
+        """
+        Get cumulative lexicon cascade statistics.
+
+        Returns:
+            Dict[str, Any]: Texts scored by the lexicon, texts escalated to
+            the model, escalation rate and lexicon CPU time
+        """
+        stats = dict(self.cascade_stats)
+        stats["escalation_rate"] = (
+            round(stats["escalated"] / stats["texts"], 4) if stats["texts"] else 0.0
+        )
+        return stats
+
+    def analyze_articles(
+        self, articles: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Analyze sentiment of multiple articles.
 
         Args:
             articles (List[Dict[str, Any]]): List of articles
+            batch_size (Optional[int]): Texts per forward pass (defaults to
+                the analyzer's batch size)
 
         Returns:
             List[Dict[str, Any]]: List of articles with sentiment analysis
         """
         processed_articles = []
-
-        for article in tqdm(articles, desc="Processing articles"):
+        for article in articles:
             if "processed_text" not in article:
                 logger.warning("Article missing processed text, skipping")
                 continue
+            processed_articles.append(article)
 
-            sentiment = self.analyze_text(article["processed_text"])
+        sentiments = self.analyze_batch(
+            [article["processed_text"] for article in processed_articles],
+            batch_size=batch_size,
+        )
+        for article, sentiment in zip(processed_articles, sentiments):
             article["sentiment"] = sentiment
-            processed_articles.append(article)
 
         return processed_articles
@@ -0,0 +1,238 @@
+"""
+Content-addressed cache for sentiment analysis results.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .config import SENTIMENT_CACHE
+
+logger = logging.getLogger(__name__)
+
+
+class SentimentCache:
+    """
+    Two-level cache of sentiment results keyed on text and model.
+
+    Keys are SHA-256 digests of the model namespace and the whitespace
+    normalized text. Lookups go to an in-process LRU first and then to a
+    SQLite table; both levels are size bounded and evict the least recently
+    used entries.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        path: str = SENTIMENT_CACHE["path"],
+        memory_entries: int = SENTIMENT_CACHE["memory_entries"],
+        disk_entries: int = SENTIMENT_CACHE["disk_entries"],
+    ):
+        """
+        Initialize the cache and open (or create) the on-disk store.
+
+        Args:
+            namespace (str): Model identity, e.g. ``"name@revision"``
+            path (str): SQLite database file
+            memory_entries (int): Maximum entries held in memory
+            disk_entries (int): Maximum entries held on disk
+        """
+        self.namespace = namespace
+        self.path = path
+        self.memory_entries = memory_entries
+        self.disk_entries = disk_entries
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, label TEXT NOT NULL, score REAL NOT NULL, "
+            "accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        self._disk_size = row[0]
+
+    def make_key(self, text: str) -> str:
+        """
+        Build the cache key for a text under this cache's namespace.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            str: Hex digest key
+        """
+        normalized = " ".join(text.split())
+        payload = f"{self.namespace}\0{normalized}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached result for a single text.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            Optional[Dict[str, Any]]: Cached result or None on a miss
+        """
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Look up cached results for several texts.
+
+        Args:
+            texts (List[str]): Input texts
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Results in input order, None on a miss
+        """
+        keys = [self.make_key(text) for text in texts]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(keys)
+        with self._lock:
+            disk_lookups = {}
+            for index, key in enumerate(keys):
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    results[index] = dict(self._memory[key])
+                    self.stats["memory_hits"] += 1
+                else:
+                    disk_lookups.setdefault(key, []).append(index)
+
+            found = self._fetch_from_disk(list(disk_lookups))
+            for key, indices in disk_lookups.items():
+                if key not in found:
+                    self.stats["misses"] += len(indices)
+                    continue
+                self._remember(key, found[key])
+                for index in indices:
+                    results[index] = dict(found[key])
+                self.stats["disk_hits"] += len(indices)
+        return results
+
+    def put_many(self, texts: List[str], results: List[Dict[str, Any]]):
+        """
+        Store results for several texts, evicting old entries if needed.
+
+        Args:
+            texts (List[str]): Input texts
+            results (List[Dict[str, Any]]): Sentiment results, same order
+        """
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text, result in zip(texts, results):
+                key = self.make_key(text)
+                entry = {"label": result["label"], "score": result["score"]}
+                self._remember(key, entry)
+                rows.append((key, entry["label"], entry["score"], now))
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO results (key, label, score, accessed) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.commit()
+                self._disk_size += self._conn.total_changes - before
+                if self._disk_size > self.disk_entries:
+                    self._evict_from_disk()
+            except sqlite3.Error as e:
+                logger.error("Error writing sentiment cache: %s", str(e))
+
+    def put(self, text: str, result: Dict[str, Any]):
+        """
+        Store the result for a single text.
+
+        Args:
+            text (str): Input text
+            result (Dict[str, Any]): Sentiment result
+        """
+        self.put_many([text], [result])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters and current sizes.
+
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (
+                round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4)
+                if lookups
+                else 0.0
+            )
+            stats["memory_size"] = len(self._memory)
+            stats["disk_size"] = self._disk_size
+        return stats
+
+    def close(self):
+        """Close the on-disk store."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """Insert an entry into the in-memory LRU, evicting the oldest."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _fetch_from_disk(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch entries from SQLite and refresh their access time."""
+        found = {}
+        try:
+            # Stay well below SQLite's bound parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT key, label, score FROM results "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, label, score in rows:
+                    found[key] = {"label": label, "score": score}
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE results SET accessed = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error("Error reading sentiment cache: %s", str(e))
+        return found
+
+    def _evict_from_disk(self):
+        """Trim the on-disk store to 90% of its capacity, oldest first."""
+        excess = self._disk_size - int(self.disk_entries * 0.9)
+        self._conn.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY accessed LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        self._disk_size -= excess
+        self.stats["evictions"] += excess
+        logger.info("Evicted %d entries from sentiment cache", excess)
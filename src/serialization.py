@@ -0,0 +1,202 @@
+"""
+JSON serialization using orjson when it is installed, stdlib json otherwise.
+
+Output is compact unless ``pretty`` is requested, and NaN and infinities
+are written as null by both. ``iter_records`` streams the records of a JSON
+array or JSON Lines file without loading it whole.
+"""
+
+import itertools
+import json
+import math
+from typing import Any, Iterator, TextIO, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without orjson
+    orjson = None
+
+_COMPACT = {"ensure_ascii": False, "allow_nan": False, "separators": (",", ":")}
+_PRETTY = {"ensure_ascii": False, "allow_nan": False, "indent": 2}
+_DECODER = json.JSONDecoder()
+
+
+def _default(value: Any) -> Any:
+    """Serialize NumPy values and dates, which stdlib json rejects."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinities with None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _default_finite(value: Any) -> Any:
+    """``_default`` for stdlib json, whose NumPy values may hold NaN."""
+    return _finite(_default(value))
+
+
+def dumps_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON.
+
+    Args:
+        data (Any): JSON-serializable data
+        pretty (bool): Indent by two spaces
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+    return dumps(data, pretty).encode("utf-8")
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Args:
+        data (Any): JSON-serializable data
+        pretty (bool): Indent by two spaces
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        return dumps_bytes(data, pretty).decode("utf-8")
+    options = _PRETTY if pretty else _COMPACT
+    try:
+        return json.dumps(data, default=_default_finite, **options)
+    except ValueError:
+        # Only data holding NaN or infinities pays for the copy
+        return json.dumps(_finite(data), default=_default_finite, **options)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Args:
+        data (Union[str, bytes]): JSON text or UTF-8 bytes
+
+    Returns:
+        Any: Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(data: Any, path: str, pretty: bool = False):
+    """
+    Write data to a JSON file.
+
+    Args:
+        data (Any): JSON-serializable data
+        path (str): Output file
+        pretty (bool): Indent by two spaces
+    """
+    with open(path, "wb") as f:
+        f.write(dumps_bytes(data, pretty))
+
+
+def load(path: str) -> Any:
+    """
+    Read a JSON file.
+
+    Args:
+        path (str): Input file
+
+    Returns:
+        Any: Parsed data
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dumps_line(record: Any) -> bytes:
+    """
+    Serialize one JSON Lines record, newline included.
+
+    Args:
+        record (Any): JSON-serializable record
+
+    Returns:
+        bytes: Encoded line
+    """
+    return dumps_bytes(record) + b"\n"
+
+
+def iter_records(path: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Stream the records of a JSON array file or a JSON Lines file.
+
+    Only one chunk and the record being parsed are held in memory. A file
+    starting with ``[`` is read as an array, anything else as JSON Lines.
+
+    Args:
+        path (str): Input file
+        chunk_size (int): Characters read at a time
+
+    Yields:
+        Any: One record at a time, in file order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            yield from _iter_lines(buffer, f)
+            return
+
+        position, eof = 1, False
+        while True:
+            # Skip separators, reading on until the next record starts
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position < len(buffer) or eof:
+                    break
+                buffer, position = f.read(chunk_size), 0
+                eof = not buffer
+            if eof and position >= len(buffer):
+                raise ValueError(f"Unterminated JSON array in {path}")
+            if buffer[position] == "]":
+                return
+            try:
+                record, end = _DECODER.raw_decode(buffer, position)
+                # A number at the end of the buffer may continue in the next chunk
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if complete:
+                yield record
+                position = end
+                continue
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, position = buffer[position:] + chunk, 0
+
+
+def _iter_lines(buffer: str, f: TextIO) -> Iterator[Any]:
+    """Parse JSON Lines from ``buffer`` followed by the rest of ``f``."""
+    # Complete the last line of the chunk; split on "\n" only, as JSON
+    # strings may contain the other characters splitlines() breaks on
+    head = buffer + f.readline()
+    for line in itertools.chain(head.split("\n"), f):
+        if line.strip():
+            yield loads(line)
@@ -0,0 +1,254 @@
+"""
+Streaming stage graph: concurrent stages connected by bounded queues.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream on a queue
+_END = object()
+
+LATENCY_SAMPLES = 10_000  # Most recent end-to-end latencies kept for percentiles
+
+
+class Stage:
+    """
+    One step of a stage graph, run by its own worker threads.
+
+    ``func`` receives a micro-batch of items and returns one output per item,
+    None dropping the item. An ``expand`` stage instead returns an iterable
+    per item whose elements are emitted separately; their end-to-end latency
+    is measured from the moment they are emitted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[List[Any]], List[Any]],
+        workers: int = 1,
+        batch_size: int = 1,
+        batch_timeout: float = 0.05,
+        expand: bool = False,
+    ):
+        """
+        Args:
+            name (str): Stage name used in logs and statistics
+            func (Callable[[List[Any]], List[Any]]): Batch function
+            workers (int): Worker threads running ``func``
+            batch_size (int): Maximum items per call
+            batch_timeout (float): Seconds to wait for a batch to fill up
+                before calling ``func`` with what has arrived
+            expand (bool): Emit every element of each output separately
+        """
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.batch_timeout = batch_timeout
+        self.expand = expand
+
+
+class StageGraph:
+    """
+    Linear chain of stages connected by bounded queues.
+
+    A queue holds at most ``queue_size`` items, so a stage that falls behind
+    blocks the stages feeding it. Memory is therefore bounded by the queue
+    sizes and batch sizes rather than by the number of items streamed.
+    """
+
+    def __init__(
+        self,
+        stages: List[Stage],
+        queue_size: int = 256,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Args:
+            stages (List[Stage]): Stages in execution order
+            queue_size (int): Items buffered in front of each stage
+            clock (Callable[[], float]): Source of the current time
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._queues: List[queue.Queue] = []
+        self._running: List[int] = []
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self._completed = 0
+        self._seconds = 0.0
+
+    def _take_batch(
+        self, inbox: queue.Queue, stage: Stage
+    ) -> Tuple[List[Tuple[float, Any]], bool]:
+        """
+        Collect up to one micro-batch from a stage's queue.
+
+        Returns:
+            Tuple[List[Tuple[float, Any]], bool]: Timestamped items, and
+            whether the end of the stream was reached
+        """
+        item = inbox.get()
+        if item is _END:
+            inbox.put(_END)  # Let the stage's other workers see it too
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + stage.batch_timeout
+        while len(batch) < stage.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = inbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _END:
+                inbox.put(_END)
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _emit(self, index: int, started: float, item: Any):
+        """Pass an item to the next stage, or record it as completed."""
+        if index + 1 < len(self.stages):
+            self._queues[index + 1].put((started, item))
+            return
+        latency = self.clock() - started
+        with self._lock:
+            self._completed += 1
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+            self._latencies.append(latency)
+
+    def _work(self, index: int):
+        """Worker loop of one stage."""
+        stage = self.stages[index]
+        stats = self._stats[stage.name]
+        done = False
+        while not done:
+            batch, done = self._take_batch(self._queues[index], stage)
+            if not batch:
+                continue
+            start_time = self.clock()
+            try:
+                outputs = stage.func([item for _, item in batch])
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Stage %s failed on a batch: %s", stage.name, str(e))
+                outputs = [None] * len(batch)
+                with self._lock:
+                    stats["failed"] += len(batch)
+            emitted = 0
+            for (started, _), output in zip(batch, outputs):
+                if output is None:
+                    continue
+                if stage.expand:
+                    for item in output:
+                        self._emit(index, self.clock(), item)
+                        emitted += 1
+                else:
+                    self._emit(index, started, output)
+                    emitted += 1
+            with self._lock:
+                stats["in"] += len(batch)
+                stats["out"] += emitted
+                stats["batches"] += 1
+                stats["busy_seconds"] += self.clock() - start_time
+
+        with self._lock:
+            self._running[index] -= 1
+            last = self._running[index] == 0
+        if last and index + 1 < len(self.stages):
+            self._queues[index + 1].put(_END)
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Stream items through every stage and wait until all are handled.
+
+        Args:
+            items (Iterable[Any]): Input of the first stage
+
+        Returns:
+            Dict[str, Any]: Statistics, as returned by ``get_stats``
+        """
+        self._queues = [queue.Queue(self.queue_size) for _ in self.stages]
+        self._running = [stage.workers for stage in self.stages]
+        self._stats = {
+            stage.name: {
+                "workers": stage.workers,
+                "in": 0,
+                "out": 0,
+                "failed": 0,
+                "batches": 0,
+                "busy_seconds": 0.0,
+            }
+            for stage in self.stages
+        }
+        self._latencies.clear()
+        self._latency_sum = self._latency_max = 0.0
+        self._completed = 0
+
+        start_time = self.clock()
+        threads = [
+            threading.Thread(
+                target=self._work, args=(index,), name=f"{stage.name}-{worker}"
+            )
+            for index, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            for item in items:
+                self._queues[0].put((self.clock(), item))
+        finally:
+            self._queues[0].put(_END)
+            for thread in threads:
+                thread.join()
+        self._seconds = self.clock() - start_time
+        return self.get_stats()
+
+    @staticmethod
+    def _percentile(samples: List[float], fraction: float) -> Optional[float]:
+        """Nearest-rank percentile of sorted samples."""
+        if not samples:
+            return None
+        return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 4)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage throughput and end-to-end latency of the last run.
+
+        Percentiles cover the most recent ``LATENCY_SAMPLES`` items.
+
+        Returns:
+            Dict[str, Any]: Completed items, wall time, latency in seconds
+            and per-stage counters
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+            return {
+                "completed": self._completed,
+                "seconds": round(self._seconds, 3),
+                "latency": {
+                    "mean": (
+                        round(self._latency_sum / self._completed, 4)
+                        if self._completed
+                        else None
+                    ),
+                    "p50": self._percentile(samples, 0.5),
+                    "p95": self._percentile(samples, 0.95),
+                    "max": round(self._latency_max, 4),
+                },
+                "stages": {name: dict(stats) for name, stats in self._stats.items()},
+            }
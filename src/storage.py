@@ -2,28 +2,421 @@
 Data storage module for saving sentiment analysis results.
 """
 
-import json
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
-from .config import DATA_DIR, RESULTS_FILE
+from . import serialization
+from .article_repository import ArticleRepository, article_date
+from .config import (
+    ARTICLE_DB,
+    ARTICLE_STORE,
+    COLUMNAR_STORE,
+    DATA_DIR,
+    RESULTS_FILE,
+    STORAGE,
+)
 
 logger = logging.getLogger(__name__)
 
+PRIMARY_STORES = ("repository", "articles", "json")
+PARTITION_PREFIX = "date="
+SEGMENT_SUFFIX = ".jsonl"
+COMPACTION_LOG = "compaction.json"
+
+
+def _write_atomic(path: str, lines: Iterable[str]):
+    """Write lines to a temporary file, sync it and rename it over ``path``."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(lines)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class PartitionedStore:
+    """
+    Append-only store of records split into one directory per date.
+
+    Every append writes new JSON Lines segments, renamed into place once
+    complete, so readers never see a partial segment and earlier runs are
+    never rewritten. Reads only open the partitions of the requested date
+    range. Compaction merges the small segments of a partition; it records
+    its inputs first so that an interrupted merge is finished or rolled back
+    by the next writer, while readers skip the inputs of a merge whose
+    output is already in place. There must be a single writer at a time.
+    Subclasses change the segment format by overriding ``suffix`` and the
+    ``_write_segment``, ``_read_segment`` and ``_merge_segments`` hooks.
+    """
+
+    suffix = SEGMENT_SUFFIX
+
+    def __init__(
+        self,
+        root: str = ARTICLE_STORE["root"],
+        compact_min_segments: int = ARTICLE_STORE["compact_min_segments"],
+        compact_target_bytes: int = ARTICLE_STORE["compact_target_bytes"],
+    ):
+        """
+        Args:
+            root (str): Directory holding the partitions
+            compact_min_segments (int): Small segments a partition must have
+                before they are merged
+            compact_target_bytes (int): Segments at least this large are not
+                merged any further
+        """
+        self.root = root
+        self.compact_min_segments = compact_min_segments
+        self.compact_target_bytes = compact_target_bytes
+
+    def _partition_dir(self, date: str) -> str:
+        return os.path.join(self.root, f"{PARTITION_PREFIX}{date}")
+
+    def _new_segment_name(self, sequence: Optional[int] = None) -> str:
+        """Name segments so that sorting them follows write order."""
+        sequence = time.time_ns() if sequence is None else sequence
+        return (
+            f"part-{sequence:020d}-{os.getpid()}-{time.time_ns() % 10**9:09d}"
+            f"{self.suffix}"
+        )
+
+    def _write_segment(self, path: str, records: List[Dict[str, Any]]):
+        """Write the records of one partition as a complete segment."""
+        _write_atomic(path, (serialization.dumps(record) + "\n" for record in records))
+
+    def _read_segment(self, path: str) -> Iterable[Dict[str, Any]]:
+        """Read the records of one segment."""
+        return serialization.iter_records(path)
+
+    def _merge_segments(self, paths: List[str], output: str):
+        """Write the concatenation of segments as one complete segment."""
+
+        def lines():
+            for path in paths:
+                with open(path, "r", encoding="utf-8") as f:
+                    yield from f
+
+        _write_atomic(output, lines())
+
+    def partitions(self) -> List[str]:
+        """
+        Get the dates that have a partition.
+
+        Returns:
+            List[str]: Dates as YYYY-MM-DD, in ascending order
+        """
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name[len(PARTITION_PREFIX) :]
+            for name in os.listdir(self.root)
+            if name.startswith(PARTITION_PREFIX)
+        )
+
+    def _read_compaction_log(self, directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            return serialization.load(os.path.join(directory, COMPACTION_LOG))
+        except FileNotFoundError:
+            return None
+
+    def segments(self, date: str) -> List[str]:
+        """
+        Get the complete segments of a partition, in write order.
+
+        Args:
+            date (str): Partition date as YYYY-MM-DD
+
+        Returns:
+            List[str]: Segment paths
+        """
+        directory = self._partition_dir(date)
+        if not os.path.isdir(directory):
+            return []
+        names = sorted(
+            name for name in os.listdir(directory) if name.endswith(self.suffix)
+        )
+        log = self._read_compaction_log(directory)
+        if log is not None and log["output"] in names:
+            # Merge done but its inputs not deleted yet
+            names = [name for name in names if name not in log["inputs"]]
+        return [os.path.join(directory, name) for name in names]
+
+    def append(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Append records as one new segment per date partition.
+
+        Args:
+            records (List[Dict[str, Any]]): JSON-serializable records
+
+        Returns:
+            List[str]: Dates of the partitions written to
+        """
+        by_date: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_date.setdefault(article_date(record), []).append(record)
+        for date, partition in by_date.items():
+            directory = self._partition_dir(date)
+            os.makedirs(directory, exist_ok=True)
+            self._write_segment(
+                os.path.join(directory, self._new_segment_name()), partition
+            )
+        return sorted(by_date)
+
+    def iter_records(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the records of a date range one at a time.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Yields:
+            Dict[str, Any]: Records by date, then write order
+        """
+        for date in self.partitions():
+            if (start and date < start) or (end and date > end):
+                continue
+            for path in self.segments(date):
+                yield from self._read_segment(path)
+
+    def read(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read the records of a date range.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            List[Dict[str, Any]]: Records by date, then write order
+        """
+        return list(self.iter_records(start, end))
+
+    def _recover(self, directory: str):
+        """Finish or roll back a merge interrupted in ``directory``."""
+        log = self._read_compaction_log(directory)
+        if log is None:
+            return
+        output = os.path.join(directory, log["output"])
+        if os.path.exists(output):
+            for name in log["inputs"]:
+                try:
+                    os.remove(os.path.join(directory, name))
+                except FileNotFoundError:
+                    pass
+        else:
+            try:
+                os.remove(f"{output}.tmp")
+            except FileNotFoundError:
+                pass
+        os.remove(os.path.join(directory, COMPACTION_LOG))
+
+    def compact(self, dates: Optional[List[str]] = None) -> int:
+        """
+        Merge the small segments of partitions that have accumulated enough.
+
+        Args:
+            dates (Optional[List[str]]): Partitions to check, all by default
+
+        Returns:
+            int: Number of segments merged away
+        """
+        merged = 0
+        for date in self.partitions() if dates is None else dates:
+            directory = self._partition_dir(date)
+            if not os.path.isdir(directory):
+                continue
+            self._recover(directory)
+            small = [
+                path
+                for path in self.segments(date)
+                if os.path.getsize(path) < self.compact_target_bytes
+            ]
+            if len(small) < self.compact_min_segments:
+                continue
+            inputs = [os.path.basename(path) for path in small]
+            # Keep the position of the oldest input in the write order
+            output = self._new_segment_name(int(inputs[0].split("-")[1]))
+            _write_atomic(
+                os.path.join(directory, COMPACTION_LOG),
+                [serialization.dumps({"output": output, "inputs": inputs})],
+            )
+            self._merge_segments(small, os.path.join(directory, output))
+            self._recover(directory)
+            merged += len(inputs) - 1
+            logger.info("Compacted %d segments of partition %s", len(inputs), date)
+        return merged
+
 
 class DataStorage:
-    """Class for saving and loading sentiment analysis results in JSON and CSV formats."""
+    """
+    Class for saving and loading sentiment analysis results.
+
+    Results are saved to and read back from the store named by
+    ``STORAGE["primary"]``; the other stores only get a copy when enabled.
+    The repository is always opened, as the web apps query it.
+    """
+
+    def __init__(self, primary: str = STORAGE["primary"]):
+        """
+        Initialize data storage with directory creation.
 
-    def __init__(self):
-        """Initialize data storage with directory creation."""
+        Args:
+            primary (str): Store holding the results, one of ``PRIMARY_STORES``
+        """
+        if primary not in PRIMARY_STORES:
+            raise ValueError(f"Unknown primary store '{primary}'")
         os.makedirs(DATA_DIR, exist_ok=True)
+        self.primary = primary
+        self.repository = ArticleRepository()
+        self.article_store = (
+            PartitionedStore()
+            if primary == "articles" or ARTICLE_STORE["enabled"]
+            else None
+        )
+        if self._indexes_repository() and self.repository.count() == 0:
+            self._backfill_repository()
+        self.columnar_store = None
+        if COLUMNAR_STORE["enabled"]:
+            # Imported here because the columnar store builds on this module
+            from . import columnar_store  # pylint: disable=import-outside-toplevel
+
+            if columnar_store.is_available():
+                self.columnar_store = columnar_store.ColumnarStore()
+            else:
+                logger.warning("pyarrow is not installed, columnar store disabled")
+
+    def _indexes_repository(self) -> bool:
+        """Whether saved results go to the repository."""
+        return self.primary == "repository" or ARTICLE_DB["enabled"]
+
+    def _backfill_repository(self):
+        """Index results saved before the repository existed."""
+        # The article store may hold history even when no longer enabled
+        article_store = self.article_store or PartitionedStore()
+        if article_store.partitions():
+            results = article_store.read()
+        elif os.path.exists(RESULTS_FILE):
+            results = self.load_from_json()
+        else:
+            return
+        if results:
+            written = self.repository.upsert(results)
+            logger.info("Indexed %d existing records in the repository", written)
+
+    def save_results(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        Save the scored articles of a run to the primary store.
+
+        The repository upserts them, the article store appends them and
+        compacts the touched partitions if needed, and ``RESULTS_FILE`` is
+        rewritten with them. Enabled copies get the same run afterwards.
+
+        Args:
+            data (List[Dict[str, Any]]): Scored articles
+
+        Returns:
+            bool: Whether the primary store saved them
+        """
+        if self.primary == "repository":
+            saved = self.repository.upsert(data) > 0 or not data
+        elif self.primary == "articles":
+            saved = self._append_to_store(data)
+        else:
+            saved = self.save_to_json(data)
+        if not saved:
+            return False
+
+        if self.primary != "repository" and ARTICLE_DB["enabled"]:
+            self.repository.upsert(data)
+        if self.primary != "articles" and self.article_store is not None:
+            self._append_to_store(data)
+        if self.columnar_store is not None:
+            try:
+                self.columnar_store.compact(self.columnar_store.append(data))
+            except Exception as e:  # pylint: disable=broad-except
+                logger.error("Error appending to the columnar store: %s", str(e))
+        return True
+
+    def _append_to_store(self, data: List[Dict[str, Any]]) -> bool:
+        """Append to the article store and compact the touched partitions."""
+        try:
+            dates = self.article_store.append(data)
+            self.article_store.compact(dates)
+            logger.info("Appended %d records to %s", len(data), self.article_store.root)
+            return True
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error appending to the article store: %s", str(e))
+            return False
+
+    def load_results(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load scored articles of a date range from the primary store.
+
+        The repository and the article store only read the requested dates.
+        ``RESULTS_FILE`` is read whole; it is also the fallback of an
+        article store that is still empty.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Returns:
+            List[Dict[str, Any]]: Loaded data
+        """
+        if self._reads_results_file():
+            return self.load_from_json()
+        try:
+            return list(self.iter_results(start, end))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error reading the %s store: %s", self.primary, str(e))
+            return []
+
+    def iter_results(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream scored articles without holding them all in memory.
+
+        Same sources as ``load_results``, with ``RESULTS_FILE`` read
+        incrementally.
+
+        Args:
+            start (Optional[str]): First date, YYYY-MM-DD, unbounded if None
+            end (Optional[str]): Last date, inclusive, unbounded if None
+
+        Yields:
+            Dict[str, Any]: One article at a time
+        """
+        if self.primary == "repository":
+            yield from self.repository.iter_records(start, end)
+        elif not self._reads_results_file():
+            yield from self.article_store.iter_records(start, end)
+        elif os.path.exists(RESULTS_FILE):
+            yield from serialization.iter_records(RESULTS_FILE)
+
+    def _reads_results_file(self) -> bool:
+        """Whether results are read from ``RESULTS_FILE``."""
+        return self.primary == "json" or (
+            self.primary == "articles" and not self.article_store.partitions()
+        )
 
     def save_to_json(
-        self, data: List[Dict[str, Any]], filename: str = RESULTS_FILE
+        self,
+        data: List[Dict[str, Any]],
+        filename: str = RESULTS_FILE,
+        pretty: bool = False,
     ) -> bool:
         """
         Save results to JSON file.
@@ -31,19 +424,39 @@ class DataStorage:
         Args:
             data (List[Dict[str, Any]]): Data to save
             filename (str): Output filename
+            pretty (bool): Indent the JSON for reading, compact by default
 
         Returns:
             bool: Success status
         """
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            serialization.dump(data, filename, pretty)
             logger.info("Successfully saved %d records to %s", len(data), filename)
             return True
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Error saving to JSON: %s", str(e))
             return False
 
+    def append_to_jsonl(self, data: List[Dict[str, Any]], filename: str) -> bool:
+        """
+        Append results to a JSON Lines file, one record per line.
+
+        Args:
+            data (List[Dict[str, Any]]): Data to append
+            filename (str): Output filename
+
+        Returns:
+            bool: Success status
+        """
+        try:
+            with open(filename, "ab") as f:
+                f.writelines(serialization.dumps_line(record) for record in data)
+            logger.debug("Appended %d records to %s", len(data), filename)
+            return True
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error appending to JSON Lines: %s", str(e))
+            return False
+
     def save_to_csv(self, data: List[Dict[str, Any]], filename: str = None) -> bool:
         """
         Save results to CSV file.
@@ -63,15 +476,13 @@ class DataStorage:
             # Convert to DataFrame for easier handling
             df = pd.DataFrame(data)
 
-            # Flatten nested sentiment dictionary
+            # Flatten nested sentiment dictionary in one pass over the column
             if "sentiment" in df.columns:
-                df["sentiment_label"] = df["sentiment"].apply(
-                    lambda x: x.get("label", "")
-                )
-                df["sentiment_score"] = df["sentiment"].apply(
-                    lambda x: x.get("score", 0)
-                )
-                df = df.drop("sentiment", axis=1)
+                sentiments = [
+                    s if isinstance(s, dict) else {} for s in df.pop("sentiment")
+                ]
+                df["sentiment_label"] = [s.get("label", "") for s in sentiments]
+                df["sentiment_score"] = [s.get("score", 0) for s in sentiments]
 
             # Save to CSV
             df.to_csv(filename, index=False, encoding="utf-8")
@@ -97,11 +508,14 @@ class DataStorage:
                 logger.warning("File %s does not exist", filename)
                 return []
 
-            with open(filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = serialization.load(filename)
             logger.info("Successfully loaded %d records from %s", len(data), filename)
             return data
 
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Error loading from JSON: %s", str(e))
             return []
+
+    def close(self):
+        """Close the article repository."""
+        self.repository.close()
@@ -3,14 +3,16 @@ Text preprocessing module for cleaning and normalizing article text.
 """
 
 import logging
+import multiprocessing
+import os
 import re
 import unicodedata
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from bs4 import BeautifulSoup
-
-from .config import MAX_TEXT_LENGTH, MIN_TEXT_LENGTH
+from .config import MAX_TEXT_LENGTH, MIN_TEXT_LENGTH, PREPROCESSING
+from .html_extraction import get_extractor
+from .instrumentation import profiler
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,51 @@ FINANCIAL_TERMS = {
     "pboc": "People's Bank of China",
 }
 
-
+# Common ad phrases and boilerplate
+NOISE_PHRASES = [
+    "click here to read more",
+    "subscribe to our newsletter",
+    "follow us on",
+    "like us on facebook",
+    "follow us on twitter",
+    "disclaimer:",
+    "terms of use:",
+    "privacy policy:",
+    "copyright ©",
+    "all rights reserved",
+]
+
+# Patterns are compiled once at import. Alternations put longer phrases
+# first so that e.g. "follow us on twitter" is removed as a whole.
+URL_PATTERN = re.compile(r"http\S+|www\S+")
+EMAIL_PATTERN = re.compile(r"\S+@\S+")
+SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s.,$%€£¥&+-]")
+NOISE_PATTERN = re.compile(
+    "|".join(
+        r"\s+".join(re.escape(word) for word in phrase.split())
+        for phrase in sorted(NOISE_PHRASES, key=len, reverse=True)
+    ),
+    re.IGNORECASE,
+)
+# One word of each phrase; the noise regex only runs when one is present
+NOISE_KEYWORDS = sorted({max(phrase.split(), key=len) for phrase in NOISE_PHRASES})
+
+_TERMS_ALTERNATION = (
+    r"(?<!\w)(?:"
+    + "|".join(
+        re.escape(term) for term in sorted(FINANCIAL_TERMS, key=len, reverse=True)
+    )
+    + r")(?!\w)"
+)
+FINANCIAL_TERMS_PATTERN = re.compile(_TERMS_ALTERNATION, re.IGNORECASE)
+# Case-sensitive variant for already lowercased text, about twice as fast
+_LOWERCASE_TERMS_PATTERN = re.compile(_TERMS_ALTERNATION)
+
+# HTML extraction backend selected by HTML_BACKEND
+_extract_text = get_extractor()
+
+
+@profiler.traced("clean")
 def clean_html(raw_html: str) -> str:
     """
     Remove HTML tags and extract clean text with improved handling.
@@ -47,39 +93,32 @@ def clean_html(raw_html: str) -> str:
         str: Cleaned text
     """
     try:
-        soup = BeautifulSoup(raw_html, "html.parser")
-
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
-            element.decompose()
-
-        # Remove comments
-        for comment in soup.find_all(
-            text=lambda text: isinstance(text, str) and text.strip().startswith("<!--")
-        ):
-            comment.extract()
-
-        # Get text and normalize whitespace
-        text = soup.get_text(separator=" ", strip=True)
-
-        # Remove multiple spaces and newlines
-        text = re.sub(r"\s+", " ", text)
-
-        return text.strip()
+        if "<" not in raw_html and "&" not in raw_html:
+            # Plain-text snippet, nothing to parse
+            return " ".join(raw_html.split())
+        return _extract_text(raw_html)
 
     except Exception as e:  # pylint: disable=broad-except
         logger.error("Error cleaning HTML: %s", str(e))
         return raw_html
 
 
+def _replace_financial_term(match: re.Match) -> str:
+    """Look up the normalized form of a matched financial term."""
+    return FINANCIAL_TERMS[match.group(0).lower()]
+
+
 def normalize_financial_terms(text: str) -> str:
     """
     Normalize common financial terms and symbols.
+
+    Args:
+        text (str): Input text
+
+    Returns:
+        str: Text with every ``FINANCIAL_TERMS`` match replaced in one pass
     """
-    for term, replacement in FINANCIAL_TERMS.items():
-        pattern = r"\\b" + re.escape(term) + r"\\b"
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-    return text
+    return FINANCIAL_TERMS_PATTERN.sub(_replace_financial_term, text)
 
 
 def remove_noise(text: str) -> str:
@@ -92,24 +131,10 @@ def remove_noise(text: str) -> str:
     Returns:
         str: Cleaned text
     """
-    # Remove common ad phrases
-    ad_patterns = [
-        r"click here to read more",
-        r"subscribe to our newsletter",
-        r"follow us on",
-        r"like us on facebook",
-        r"follow us on twitter",
-        r"disclaimer:",
-        r"terms of use:",
-        r"privacy policy:",
-        r"copyright ©",
-        r"all rights reserved",
-    ]
-
-    for pattern in ad_patterns:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
-
-    return text
+    lowered = text.lower()
+    if not any(keyword in lowered for keyword in NOISE_KEYWORDS):
+        return text
+    return NOISE_PATTERN.sub("", text)
 
 
 def preprocess_text(text: str) -> Optional[str]:
@@ -127,23 +152,23 @@ def preprocess_text(text: str) -> Optional[str]:
         text = text.lower()
 
         # Remove URLs
-        text = re.sub(r"http\S+|www\S+|https\S+", "", text, flags=re.MULTILINE)
+        text = URL_PATTERN.sub("", text)
 
         # Remove email addresses
-        text = re.sub(r"\S+@\S+", "", text)
+        if "@" in text:
+            text = EMAIL_PATTERN.sub("", text)
 
-        # Remove special characters but keep important ones
-        text = re.sub(r"[^\w\s.,$%€£¥+-]", " ", text)
+        # Remove noise while its punctuation (":", "©") is still present
+        text = remove_noise(text)
 
-        # Normalize whitespace
-        text = re.sub(r"\s+", " ", text)
-        text = text.strip()
+        # Remove special characters but keep important ones ("&" for "s&p")
+        text = SPECIAL_CHARS_PATTERN.sub(" ", text)
 
-        # Remove noise
-        text = remove_noise(text)
+        # Normalize whitespace
+        text = " ".join(text.split())
 
         # Normalize financial terms
-        text = normalize_financial_terms(text)
+        text = _LOWERCASE_TERMS_PATTERN.sub(_replace_financial_term, text)
 
         # Normalize unicode characters
         text = unicodedata.normalize("NFKD", text)
@@ -203,3 +228,36 @@ def process_article(article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     except Exception as e:  # pylint: disable=broad-except
         logger.error("Error processing article: %s", str(e))
         return None
+
+
+def process_articles(
+    articles: List[Dict[str, Any]],
+    workers: Optional[int] = PREPROCESSING["workers"],
+    chunksize: int = PREPROCESSING["chunksize"],
+) -> List[Dict[str, Any]]:
+    """
+    Process a batch of articles, dropping the ones that fail.
+
+    Batches of at least ``PREPROCESSING["min_parallel_batch"]`` articles are
+    spread over a process pool; smaller ones are not worth the pool startup
+    and are processed in-process. Workers return copies of the articles, so
+    use the returned list rather than the inputs.
+
+    Args:
+        articles (List[Dict[str, Any]]): Article data
+        workers (Optional[int]): Worker processes, None uses every core
+        chunksize (int): Articles sent to a worker per task
+
+    Returns:
+        List[Dict[str, Any]]: Processed articles in input order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(articles))
+    if workers <= 1 or len(articles) < PREPROCESSING["min_parallel_batch"]:
+        processed = [process_article(article) for article in articles]
+    else:
+        logger.info("Processing %d articles in %d workers", len(articles), workers)
+        # Spawn like the scoring pool; forking after torch is loaded can deadlock
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers) as pool:
+            processed = pool.map(process_article, articles, chunksize=chunksize)
+    return [article for article in processed if article is not None]
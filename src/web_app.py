@@ -3,13 +3,15 @@ Web application for displaying sentiment analysis reports.
 """
 
 # pylint: disable=import-error
-import json
 import os
 from typing import Any, Dict, List
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
 
+from . import serialization
 from .config import DATA_DIR
+from .instrumentation import profiler
 from .report_generator import ReportGenerator
 from .storage import DataStorage
 from .market_data_pipeline import fetch_market_data, get_market_dataframe
@@ -20,7 +22,19 @@ import io
 import base64
 import numpy as np
 
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Encode API responses compactly with the serialization layer."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return serialization.dumps(obj)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return serialization.loads(s)
+
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 # Initialize components
 report_generator = ReportGenerator()
@@ -79,23 +93,16 @@ def view_report(date: str):
     if not os.path.exists(report_dir):
         return "Report not found", 404
 
-    # Load report data from main results file
-    results_file = os.path.join(DATA_DIR, "sentiment_results.json")
-    if os.path.exists(results_file):
-        with open(results_file, "r", encoding="utf-8") as f:
-            results = json.load(f)
-    else:
-        results = []
-
-    # Get report metadata
+    # Counts are aggregated in SQLite, only the top articles are loaded
+    repository = data_storage.repository
     report_data = {
         "date": date,
-        "total_articles": len(results),
-        "sources": sorted(set(article["source"] for article in results)),
-        "sentiment_distribution": get_sentiment_distribution(results),
-        "source_stats": get_source_stats(results),
-        "top_positive": get_top_articles(results, "Positive"),
-        "top_negative": get_top_articles(results, "Negative"),
+        "total_articles": repository.count(date, date),
+        "sources": repository.sources(date, date),
+        "sentiment_distribution": repository.sentiment_distribution(date, date),
+        "source_stats": repository.source_stats(date, date),
+        "top_positive": repository.query(date, date, label="Positive", limit=5),
+        "top_negative": repository.query(date, date, label="Negative", limit=5),
     }
 
     return render_template("report.html", report=report_data)
@@ -108,8 +115,7 @@ def get_report_data(date: str):
     if not os.path.exists(cache_file):
         return jsonify({"error": "Report not found"}), 404
 
-    with open(cache_file, "r", encoding="utf-8") as f:
-        results = json.load(f)
+    results = serialization.load(cache_file)
 
     return jsonify(
         {
@@ -124,6 +130,40 @@ def get_report_data(date: str):
     )
 
 
+@app.route("/api/articles")
+def query_articles():
+    """Get one page of articles filtered by date range, source and label."""
+    try:
+        articles = data_storage.repository.query(
+            start=request.args.get("start"),
+            end=request.args.get("end"),
+            source=request.args.get("source"),
+            label=request.args.get("label"),
+            order_by=request.args.get("order_by", default="score"),
+            limit=request.args.get("limit", default=50, type=int),
+            offset=request.args.get("offset", default=0, type=int),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify(articles)
+
+
+@app.route("/api/profiles")
+def get_run_profiles():
+    """Get the latest pipeline run profiles as JSON, newest first."""
+    limit = request.args.get("limit", default=10, type=int)
+    return jsonify(profiler.recent_profiles(limit))
+
+
+@app.route("/api/profiles/latest")
+def get_latest_run_profile():
+    """Get the profile of the latest pipeline run as JSON."""
+    profiles = profiler.recent_profiles(1)
+    if not profiles:
+        return jsonify({"error": "No run profile recorded"}), 404
+    return jsonify(profiles[0])
+
+
 def get_sentiment_distribution(results: List[Dict[str, Any]]) -> Dict[str, int]:
     """Calculate sentiment distribution."""
     distribution = {"Positive": 0, "Neutral": 0, "Negative": 0}
@@ -160,27 +200,25 @@ def get_top_articles(
 
 @app.route("/report/<date>/positive")
 def see_all_positive(date: str):
-    results_file = os.path.join(DATA_DIR, "sentiment_results.json")
-    if os.path.exists(results_file):
-        with open(results_file, "r", encoding="utf-8") as f:
-            results = json.load(f)
-    else:
-        results = []
-    positive_articles = [r for r in results if r["sentiment"]["label"] == "Positive"]
-    positive_articles = sorted(positive_articles, key=lambda x: x["sentiment"]["score"], reverse=True)
+    positive_articles = data_storage.repository.query(
+        date,
+        date,
+        label="Positive",
+        limit=request.args.get("limit", type=int),
+        offset=request.args.get("offset", default=0, type=int),
+    )
     return render_template("see_all_positive.html", date=date, articles=positive_articles)
 
 
 @app.route("/report/<date>/negative")
 def see_all_negative(date: str):
-    results_file = os.path.join(DATA_DIR, "sentiment_results.json")
-    if os.path.exists(results_file):
-        with open(results_file, "r", encoding="utf-8") as f:
-            results = json.load(f)
-    else:
-        results = []
-    negative_articles = [r for r in results if r["sentiment"]["label"] == "Negative"]
-    negative_articles = sorted(negative_articles, key=lambda x: x["sentiment"]["score"], reverse=True)
+    negative_articles = data_storage.repository.query(
+        date,
+        date,
+        label="Negative",
+        limit=request.args.get("limit", type=int),
+        offset=request.args.get("offset", default=0, type=int),
+    )
     return render_template("see_all_negative.html", date=date, articles=negative_articles)
 
 
@@ -0,0 +1,94 @@
+"""
+Tests for the SQLite article repository.
+"""
+
+import pytest
+
+from src.article_repository import ArticleRepository
+
+
+def _article(i, date="2024-01-01", label="Positive", source="Reuters"):
+    """Scored article with a distinct score."""
+    return {
+        "link": f"http://example.com/{i}",
+        "source": source,
+        "timestamp": f"{date}T09:00:00",
+        "sentiment": {"label": label, "score": i / 100},
+    }
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository holding two days of articles from two sources."""
+    repository = ArticleRepository(str(tmp_path / "articles.sqlite3"))
+    repository.upsert(
+        [_article(i) for i in range(1, 6)]
+        + [_article(i, label="Negative", source="FT") for i in range(6, 9)]
+        + [_article(i, date="2024-01-02") for i in range(9, 11)]
+    )
+    yield repository
+    repository.close()
+
+
+def test_upsert_replaces_articles_with_the_same_link(repository):
+    """Test that re-saving an article updates it in place."""
+    assert repository.count() == 10
+    repository.upsert([_article(1, label="Negative")])
+    assert repository.count() == 10
+    assert repository.count(label="Negative") == 4
+
+
+def test_query_filters_sorts_and_paginates(repository):
+    """Test top-k by score within a date, source and label, page by page."""
+    top = repository.query("2024-01-01", "2024-01-01", label="Positive", limit=2)
+    assert [a["link"][-1] for a in top] == ["5", "4"]
+    page = repository.query(
+        "2024-01-01", "2024-01-01", label="Positive", limit=2, offset=2
+    )
+    assert [a["link"][-1] for a in page] == ["3", "2"]
+    assert len(repository.query(source="FT")) == 3
+    assert len(repository.query(start="2024-01-02")) == 2
+    assert repository.query(order_by="date", limit=1)[0]["timestamp"].startswith(
+        "2024-01-02"
+    )
+    with pytest.raises(ValueError):
+        repository.query(order_by="title")
+
+
+def test_aggregates_are_computed_per_date(repository):
+    """Test distribution, source stats and sources of one day."""
+    day = ("2024-01-01", "2024-01-01")
+    assert repository.sentiment_distribution(*day) == {
+        "Positive": 5,
+        "Neutral": 0,
+        "Negative": 3,
+    }
+    assert repository.source_stats(*day) == {
+        "FT": {"positive": 0, "neutral": 0, "negative": 3},
+        "Reuters": {"positive": 5, "neutral": 0, "negative": 0},
+    }
+    assert repository.sources(*day) == ["FT", "Reuters"]
+
+
+def test_top_k_of_a_day_uses_the_index_without_sorting(repository):
+    """Test that the report query walks the index instead of sorting rows."""
+    # pylint: disable=protected-access
+    where, params = repository._where("2024-01-01", "2024-01-01", label="Positive")
+    plan = " ".join(
+        row[-1]
+        for row in repository._conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT record FROM articles{where} "
+            "ORDER BY score DESC LIMIT 5",
+            params,
+        )
+    )
+    assert "idx_articles_date_label_score" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_iter_records_pages_by_date_then_insertion_order(repository):
+    """Test that streamed pages neither skip nor repeat articles."""
+    links = [r["link"] for r in repository.iter_records(page_size=3)]
+    assert links == [f"http://example.com/{i}" for i in range(1, 11)]
+    day = repository.iter_records("2024-01-02", "2024-01-02", page_size=2)
+    assert [r["link"][-2:] for r in day] == ["/9", "10"]
@@ -0,0 +1,67 @@
+"""
+Tests for the compact article representations.
+"""
+
+import math
+
+from src.articles import Article, ArticleBatch, SentimentResult
+
+
+def _scored(i, label, source="Reuters"):
+    """Scored article record as the pipeline produces it."""
+    return {
+        "title": f"Title {i}",
+        "link": f"http://example.com/{i}",
+        "guid": f"urn:article:{i}",
+        "source": source,
+        "processed_text": "text",
+        "text_length": 4,
+        "duplicate_of": None,
+        "sentiment": {"label": label, "score": i / 10},
+    }
+
+
+def test_article_round_trips_through_dicts():
+    """Test that present keys, explicit None and unknown keys survive."""
+    record = dict(_scored(3, "Positive"), market="NYSE")
+    article = Article.from_dict(record)
+
+    assert not hasattr(article, "__dict__")
+    assert isinstance(article.sentiment, SentimentResult)
+    assert article.sentiment.label == "Positive"
+    assert article.summary is None
+    assert article.guid == "urn:article:3"
+    assert article.extra == {"market": "NYSE"}
+    assert article.to_dict() == record
+    assert "summary" not in article.to_dict()
+
+
+def test_batch_aggregates_match_the_dict_form():
+    """Test counts, per-source stats, means and top-k against the dicts."""
+    results = [
+        _scored(1, "Negative", "FT"),
+        _scored(5, "Positive"),
+        _scored(2, "Positive", "FT"),
+        _scored(9, "Neutral"),
+        _scored(7, "Positive"),
+    ]
+    for articles in (results, [Article.from_dict(r) for r in results]):
+        batch = ArticleBatch(articles)
+        assert batch.label_counts() == {"Negative": 1, "Positive": 3, "Neutral": 1}
+        assert batch.source_stats() == {
+            "FT": {"positive": 1, "neutral": 0, "negative": 1},
+            "Reuters": {"positive": 2, "neutral": 1, "negative": 0},
+        }
+        assert math.isclose(batch.mean_score("Positive"), 14 / 30, rel_tol=1e-6)
+        assert math.isnan(batch.mean_score("Unknown"))
+
+    batch = ArticleBatch(results)
+    for label in ("Positive", "Negative"):
+        expected = sorted(
+            results,
+            key=lambda x, label=label: (
+                x["sentiment"]["score"] if x["sentiment"]["label"] == label else 0
+            ),
+            reverse=True,
+        )[:3]
+        assert batch.top(label, 3) == expected
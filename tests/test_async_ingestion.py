@@ -0,0 +1,100 @@
+"""
+Tests for the concurrent feed fetcher.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.async_ingestion import AsyncNewsFetcher, HostRateLimiter, TokenBucket
+from src.config import RATE_LIMIT
+from src.feed_state import FeedStateStore
+
+FEED = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>'
+    "<item><title>Stocks rise</title><link>http://example.com/1</link></item>"
+    "<item><title>Bonds fall</title><link>http://example.com/2</link></item>"
+    "</channel></rss>"
+).encode("utf-8")
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serve the fixture feed, failing the first request to /flaky."""
+
+    failures = {"/flaky": 1}
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer with the feed or a transient error."""
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    """Test that requests beyond the burst wait for refilled tokens."""
+
+    async def run():
+        bucket = TokenBucket(rate_per_second=20, capacity=2)
+        start = time.monotonic()
+        for _ in range(4):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_host_rate_limiter_isolates_hosts():
+    """Test that a throttled host does not delay another host."""
+
+    async def run():
+        limiter = HostRateLimiter(requests_per_minute=60, burst=1)
+        await limiter.wait("http://a.example/rss")
+        start = time.monotonic()
+        await limiter.wait("http://b.example/rss")
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.1
+
+
+def test_fetch_all_retries_and_skips_failed_feeds(monkeypatch, tmp_path):
+    """Test concurrent fetching with a transient error and a dead feed."""
+    monkeypatch.setitem(RATE_LIMIT, "retry_delay", 0.01)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    feeds = {"ok": f"{base}/ok", "flaky": f"{base}/flaky", "dead": f"{base}/missing"}
+
+    async def run():
+        async with AsyncNewsFetcher(
+            requests_per_minute=6000, burst=10, feed_state=state
+        ) as fetcher:
+            return await fetcher.fetch_all(feeds)
+
+    state = FeedStateStore(str(tmp_path / "feed_state.json"))
+    try:
+        articles = asyncio.run(run())
+        state.commit()
+        repeated = asyncio.run(run())
+    finally:
+        server.shutdown()
+
+    assert [article["source"] for article in articles] == ["ok", "ok", "flaky", "flaky"]
+    assert articles[0]["title"] == "Stocks rise"
+    # The server ignores validators, so the body hash catches the repeat
+    assert not repeated
+    assert state.get_stats()[feeds["ok"]] == {"changed": 1, "unchanged": 1}
@@ -0,0 +1,76 @@
+"""
+Tests for the backend's article repository.
+"""
+
+import importlib
+import json
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+BACKEND_SRC = Path(__file__).resolve().parent.parent / "backend" / "src"
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """
+    Import a copy of the backend package under another name.
+
+    Both code bases are a package named ``src``; the copy also keeps the
+    backend's data directory, created on import, inside tmp_path.
+    """
+    shutil.copytree(
+        BACKEND_SRC,
+        tmp_path / "backend_src",
+        ignore=shutil.ignore_patterns("__pycache__", "logs"),
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("backend_src.services.article_repository")
+    for name in [name for name in sys.modules if name.startswith("backend_src")]:
+        del sys.modules[name]
+
+
+def test_empty_repository_imports_the_legacy_results_file(backend, tmp_path):
+    """Test the one-time import of results saved before the repository."""
+    legacy = tmp_path / "sentiment_results.json"
+    legacy.write_text(
+        json.dumps(
+            [
+                {
+                    "text": "Stocks rallied",
+                    "timestamp": "2024-01-01T09:00:00",
+                    "sentiment": {"label": "Positive", "score": 0.9},
+                },
+                {"text": "Oil fell", "sentiment": {"label": "Negative", "score": 0.8}},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    path = str(tmp_path / "articles.sqlite3")
+    repository = backend.ArticleRepository(path, str(legacy))
+    assert repository.count() == 2
+    assert repository.count("2024-01-01", "2024-01-01") == 1
+
+    # Only while empty: a reopened repository does not import it again
+    legacy.write_text("[]", encoding="utf-8")
+    assert backend.ArticleRepository(path, str(legacy)).count() == 2
+
+
+def test_upsert_normalizes_timestamps_and_reports_errors(backend, tmp_path):
+    """Test datetime timestamps and a failing write."""
+    repository = backend.ArticleRepository(
+        str(tmp_path / "articles.sqlite3"), str(tmp_path / "missing.json")
+    )
+    written = repository.upsert(
+        [{"link": "http://a/1", "timestamp": datetime(2024, 3, 1, 12)}]
+    )
+    assert written == 1
+    assert repository.query("2024-03-01", "2024-03-01")[0]["timestamp"].startswith(
+        "2024-03-01"
+    )
+
+    repository._conn.close()  # pylint: disable=protected-access
+    assert repository.upsert([{"link": "http://a/2"}]) == 0
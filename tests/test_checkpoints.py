@@ -0,0 +1,125 @@
+"""
+Tests for checkpointed, resumable pipeline runs.
+"""
+
+import pytest
+
+from src.checkpoints import CheckpointStore
+from src.config import CHECKPOINTS
+from src.pipeline import SentimentAnalysisPipeline
+
+
+def _articles(count):
+    """Fetched articles long enough to survive preprocessing."""
+    return [
+        {
+            "title": f"Article {i}",
+            "summary": f"<p>{'Stocks rallied today. ' * 4}</p>",
+            "link": f"http://example.com/{i}",
+            "source": "Test Source",
+        }
+        for i in range(count)
+    ]
+
+
+class FakeAnalyzer:
+    """Analyzer labelling everything positive, optionally failing once."""
+
+    def __init__(self, fail_on_call=None):
+        self.fail_on_call = fail_on_call
+        self.scored = 0
+        self.calls = 0
+
+    def analyze_articles(self, articles):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("scoring crashed")
+        for article in articles:
+            article["sentiment"] = {"label": "Positive", "score": 0.9}
+        self.scored += len(articles)
+        return articles
+
+
+class FakeReportGenerator:
+    """Report generator that fails until told otherwise."""
+
+    def __init__(self):
+        self.fail = True
+        self.reported = None
+
+    def generate_report(self, articles):
+        if self.fail:
+            raise RuntimeError("pdflatex failed")
+        self.reported = articles
+        return "report.pdf"
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Pipeline with fake scoring and reporting, writing under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    pipeline = SentimentAnalysisPipeline(workers=1, incremental=False)
+    pipeline.near_duplicates = None
+    pipeline.analyzer = FakeAnalyzer()
+    pipeline.report_generator = FakeReportGenerator()
+    return pipeline
+
+
+def test_checkpoint_store_round_trip_ignores_torn_batch(tmp_path):
+    """Test that stages and batches reload, minus a half-written batch."""
+    store = CheckpointStore(str(tmp_path / "checkpoints"))
+    assert store.completed_stages() == []
+    store.save_stage("fetch", [{"title": "a"}])
+    store.save_stage("persist")
+    store.append_batch("score", {"inputs": 1})
+    with open(tmp_path / "checkpoints" / "score.batches.jsonl", "a") as f:
+        f.write('{"inputs": ')
+    assert store.completed_stages() == ["fetch", "persist"]
+    assert store.load_stage("fetch") == [{"title": "a"}]
+    assert store.load_batches("score") == [{"inputs": 1}]
+    store.clear()
+    assert store.completed_stages() == []
+
+
+def test_resume_after_report_failure_skips_finished_stages(pipeline):
+    """Test that a resumed run only redoes the failed report."""
+    assert pipeline.run(save_csv=False, fetch=lambda: _articles(3)) == []
+    assert pipeline.checkpoints.completed_stages() == [
+        "fetch",
+        "preprocess",
+        "persist",
+    ]
+
+    pipeline.report_generator.fail = False
+
+    def fetch():
+        raise AssertionError("a resumed run must not fetch again")
+
+    results = pipeline.run(save_csv=False, fetch=fetch, resume=True)
+    assert len(results) == 3
+    assert pipeline.analyzer.scored == 3
+    assert len(pipeline.report_generator.reported) == 3
+    assert pipeline.checkpoints.completed_stages() == []
+
+
+def test_resume_scores_only_unfinished_batches(pipeline, monkeypatch):
+    """Test that scoring batches checkpointed before a crash are reused."""
+    monkeypatch.setitem(CHECKPOINTS, "score_batch_size", 2)
+    pipeline.analyzer = FakeAnalyzer(fail_on_call=2)
+    assert pipeline.run(save_csv=False, fetch=lambda: _articles(5)) == []
+    assert pipeline.analyzer.scored == 2
+
+    results = pipeline.run(
+        save_csv=False, generate_report=False, fetch=None, resume=True
+    )
+    assert [r["link"] for r in results] == [a["link"] for a in _articles(5)]
+    assert pipeline.analyzer.scored == 5
+
+
+def test_run_without_resume_discards_checkpoints(pipeline):
+    """Test that a fresh run starts over instead of reusing checkpoints."""
+    pipeline.run(save_csv=False, fetch=lambda: _articles(2))
+    pipeline.report_generator.fail = False
+    results = pipeline.run(save_csv=False, fetch=lambda: _articles(4))
+    assert len(results) == 4
+    assert pipeline.analyzer.scored == 6
@@ -0,0 +1,95 @@
+"""
+Tests for the columnar article store.
+"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+# pylint: disable=wrong-import-position
+from src.columnar_store import ColumnarStore, to_table
+from src.config import COLUMNAR_STORE
+from src.storage import DataStorage
+
+
+def _records(date, count, label="Positive", source="Reuters"):
+    """Scored articles ingested on a date, scored 0.0, 0.1, ..."""
+    return [
+        {
+            "link": f"http://example.com/{date}/{source}/{i}",
+            "title": f"Title {i}",
+            "summary": "Not kept in the columnar store",
+            "source": source,
+            "timestamp": f"{date}T12:00:00.{i:06d}",
+            "sentiment": {"label": label, "score": i / 10},
+        }
+        for i in range(count)
+    ]
+
+
+def test_records_are_flattened_with_compact_types():
+    """Test the schema: categorical source and label, float32 score."""
+    table = to_table(_records("2024-01-01", 3))
+    assert table.num_rows == 3
+    assert pa.types.is_dictionary(table.schema.field("source").type)
+    assert pa.types.is_dictionary(table.schema.field("label").type)
+    assert table.schema.field("score").type == pa.float32()
+    assert "summary" not in table.column_names
+    assert table.column("label").to_pylist() == ["Positive"] * 3
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_scan_projects_columns_and_pushes_filters(tmp_path, file_format):
+    """Test that scans prune dates and filter on label, source and score."""
+    store = ColumnarStore(str(tmp_path), file_format=file_format)
+    store.append(_records("2024-01-01", 5) + _records("2024-01-02", 4, "Negative"))
+    store.append(_records("2024-01-02", 3, source="FT"))
+
+    day = store.scan(["link", "score"], "2024-01-02", "2024-01-02")
+    assert day.column_names == ["link", "score"]
+    assert day.num_rows == 7
+    positive = store.scan(["date", "score"], label="Positive", min_score=0.25)
+    assert positive.column("date").to_pylist() == ["2024-01-01"] * 2
+    assert store.scan(source="FT").num_rows == 3
+    # Uncompacted segments with their own dictionaries aggregate together
+    assert store.daily_sentiment("2024-01-02").column("count").to_pylist() == [4, 3]
+    assert store.scan(["link"], start="2024-02-01").num_rows == 0
+    record = store.read("2024-01-01", "2024-01-01")[0]
+    assert record["sentiment"] == {"label": "Positive", "score": 0.0}
+    assert record["date"] == "2024-01-01"
+
+
+def test_compaction_and_daily_sentiment(tmp_path):
+    """Test that merged segments keep their rows and analytics aggregate them."""
+    store = ColumnarStore(str(tmp_path), compact_min_segments=2)
+    store.append(_records("2024-01-01", 2))
+    store.append(_records("2024-01-01", 4, "Negative", source="FT"))
+    assert store.compact() == 1
+    assert len(store.segments("2024-01-01")) == 1
+
+    daily = store.daily_sentiment().to_pylist()
+    assert [(row["label"], row["count"]) for row in daily] == [
+        ("Negative", 4),
+        ("Positive", 2),
+    ]
+    assert daily[0]["mean_score"] == pytest.approx(0.15)
+
+    exported = tmp_path / "export.arrow"
+    assert store.export(str(exported), columns=["source", "score"]) == 6
+    with pa.memory_map(str(exported)) as source:
+        assert pa.ipc.open_file(source).read_all().num_rows == 6
+
+
+def test_data_storage_copies_runs_only_when_enabled(tmp_path, monkeypatch):
+    """Test that the columnar copy is opt-in next to the primary store."""
+    monkeypatch.chdir(tmp_path)
+    storage = DataStorage()
+    assert storage.columnar_store is None
+    storage.close()
+
+    monkeypatch.setitem(COLUMNAR_STORE, "enabled", True)
+    storage = DataStorage()
+    assert storage.save_results(_records("2024-01-01", 3))
+    assert storage.columnar_store.scan(["link"]).num_rows == 3
+    assert storage.repository.count() == 3
+    storage.close()
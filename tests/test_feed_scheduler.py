@@ -0,0 +1,158 @@
+"""
+Tests for the adaptive feed scheduler.
+"""
+
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.feed_scheduler import FeedSchedule, FeedScheduler
+from src.feed_state import FeedStateStore
+from src.news_ingestion import NewsFetcher
+
+SETTINGS = {
+    "initial_interval": 300,
+    "min_interval": 60,
+    "max_interval": 3600,
+    "smoothing": 0.5,
+    "backoff": 2.0,
+}
+
+
+def make_item(ident, published):
+    """Build a raw article published at a Unix timestamp."""
+    stamp = format_datetime(datetime.fromtimestamp(published, timezone.utc))
+    return {"link": f"http://example.com/{ident}", "published": stamp}
+
+
+def test_interval_follows_publish_rate_and_backs_off():
+    """Test that the interval learns the gap between items and backs off."""
+    schedule = FeedSchedule("feed", "http://feed", SETTINGS)
+    items = [make_item(i, 10_000 + 600 * i) for i in range(4)]
+
+    assert len(schedule.observe(items, now=12_000)) == 4
+    assert schedule.interarrival == 600
+    assert schedule.interval == 600
+
+    assert schedule.observe(items, now=12_600) == []
+    assert schedule.interval == 1200
+    schedule.observe(items, now=13_800)
+    schedule.observe(items, now=16_200)
+    assert schedule.interval == 3600  # Bounded by max_interval
+
+    new = schedule.observe(items + [make_item(9, 16_000)], now=16_300)
+    assert len(new) == 1
+    assert schedule.consecutive_wasted == 0
+    stats = schedule.get_stats()
+    assert stats["wasted_polls"] == 3
+    assert stats["mean_latency"] == 300
+    assert stats["interarrival"] == 0.5 * 4_200 + 0.5 * 600
+
+
+class FakeFetcher:
+    """Fetcher returning canned feeds per URL."""
+
+    feed_state = None
+
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    def fetch_feed(self, url):
+        """Return the canned feed for a URL."""
+        return self.feeds.get(url)
+
+
+class FakeFeed:
+    """Minimal stand-in for a parsed feed."""
+
+    def __init__(self, entries):
+        self.entries = entries
+
+
+def test_scheduler_polls_due_feeds_and_exports_stats(tmp_path):
+    """Test that polls hand new articles on and export statistics."""
+    now = [1_000_000.0]
+    received = []
+    fetcher = FakeFetcher(
+        {"http://fast": FakeFeed([make_item(1, 999_000)]), "http://slow": None}
+    )
+    scheduler = FeedScheduler(
+        feeds={"fast": "http://fast", "slow": "http://slow"},
+        fetcher=fetcher,
+        on_articles=received.extend,
+        stats_path=str(tmp_path / "stats.json"),
+        clock=lambda: now[0],
+    )
+    scheduler.run(max_polls=2)
+
+    assert [article["source"] for article in received] == ["fast"]
+    stats = scheduler.get_stats()
+    assert stats["slow"]["wasted_polls"] == 1
+    assert (tmp_path / "stats.json").exists()
+
+    resumed = FeedScheduler(
+        feeds={"fast": "http://fast"},
+        fetcher=fetcher,
+        stats_path=str(tmp_path / "stats.json"),
+        clock=lambda: now[0],
+    )
+    assert resumed.schedules["fast"].last_published == 999_000
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    """Serve a one-item feed with an ETag, recording request validators."""
+
+    seen = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer with the feed or 304."""
+        etag = self.headers.get("If-None-Match")
+        self.seen.append(etag)
+        if etag == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = (
+            '<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+            "<item><title>Stocks rise</title><link>http://example.com/1</link>"
+            "</item></channel></rss>"
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_second_poll_sends_the_committed_validators(monkeypatch, tmp_path):
+    """Test that a handled poll commits its ETag for the next poll."""
+    monkeypatch.setattr("src.news_ingestion.random.uniform", lambda a, b: 0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EtagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+    state = FeedStateStore(str(tmp_path / "state.json"))
+    fetcher = NewsFetcher(feed_state=state)
+    fetcher.rate_limiter.interval = 0
+    received = []
+    scheduler = FeedScheduler(
+        feeds={"feed": url},
+        fetcher=fetcher,
+        on_articles=received.extend,
+        stats_path=None,
+    )
+
+    try:
+        scheduler.poll("feed")
+        scheduler.poll("feed")
+    finally:
+        server.shutdown()
+
+    assert EtagHandler.seen == [None, '"v1"']
+    assert len(received) == 1
+    assert FeedStateStore(state.path).conditional_headers(url) == {
+        "If-None-Match": '"v1"'
+    }
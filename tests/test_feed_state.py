@@ -0,0 +1,135 @@
+"""
+Tests for conditional GET feed state.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.feed_state import FeedStateStore, content_hash
+from src.news_ingestion import NewsFetcher, fetch_all_feeds
+from src.pipeline import SentimentAnalysisPipeline
+
+FEED = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>'
+    "<item><title>Stocks rise</title><link>http://example.com/1</link>"
+    f"<description>{'Stocks rallied today. ' * 4}</description></item>"
+    "</channel></rss>"
+).encode("utf-8")
+ETAG = '"v1"'
+
+
+class EtagHandler(BaseHTTPRequestHandler):
+    """Serve the fixture feed and answer 304 to a matching If-None-Match."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer with the feed or 304."""
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+def test_validators_persist_and_merge(tmp_path):
+    """Test that validators survive a reload and instances do not clobber."""
+    path = str(tmp_path / "state.json")
+    first = FeedStateStore(path)
+    second = FeedStateStore(path)
+    first.stage("http://a/rss", '"a"', None, "hash-a")
+    second.stage("http://b/rss", None, "Mon, 01 Jan 2024 00:00:00 GMT", "hash-b")
+    assert FeedStateStore(path).conditional_headers("http://a/rss") == {}
+    first.commit()
+    second.commit()
+
+    reloaded = FeedStateStore(path)
+    assert reloaded.conditional_headers("http://a/rss") == {"If-None-Match": '"a"'}
+    assert reloaded.conditional_headers("http://b/rss") == {
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+    assert reloaded.is_unchanged("http://a/rss", "hash-a")
+    assert not reloaded.is_unchanged("http://a/rss", "hash-new")
+    assert reloaded.conditional_headers("http://c/rss") == {}
+
+
+def test_fetcher_skips_not_modified_feed(monkeypatch, tmp_path):
+    """Test that a 304 response skips parsing and the delay on the second poll."""
+    delays = []
+    monkeypatch.setattr(
+        "src.news_ingestion.random.uniform", lambda a, b: delays.append(a) or 0
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EtagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+    state = FeedStateStore(str(tmp_path / "state.json"))
+    fetcher = NewsFetcher(feed_state=state)
+    fetcher.rate_limiter.interval = 0
+
+    try:
+        first = fetcher.fetch_feed(url)
+        state.commit()
+        second = fetcher.fetch_feed(url)
+    finally:
+        server.shutdown()
+
+    assert len(first.entries) == 1
+    assert second is None
+    assert len(delays) == 1
+    assert state.get_stats()[url] == {"changed": 1, "not_modified": 1}
+    assert state.is_unchanged(url, content_hash(FEED))
+
+
+class FlakyAnalyzer:
+    """Analyzer that crashes on its first call, then labels all positive."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def analyze_articles(self, articles):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("scoring crashed")
+        for article in articles:
+            article["sentiment"] = {"label": "Positive", "score": 0.9}
+        return articles
+
+
+def test_failed_run_keeps_validators_until_articles_are_saved(monkeypatch, tmp_path):
+    """Test that a feed is fetched in full again after a failed run."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("src.news_ingestion.random.uniform", lambda a, b: 0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EtagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/rss"
+    monkeypatch.setattr("src.news_ingestion.RSS_FEEDS", {"Test": url})
+    pipeline = SentimentAnalysisPipeline(workers=1, incremental=False)
+    pipeline.near_duplicates = None
+    pipeline.analyzer = FlakyAnalyzer()
+
+    def fetch():
+        # Sequential fetching over the pipeline's feed state
+        return fetch_all_feeds(concurrent=False, feed_state=pipeline.feed_state)
+
+    try:
+        failed = pipeline.run(save_csv=False, generate_report=False, fetch=fetch)
+        saved_state = FeedStateStore(pipeline.feed_state.path)
+        assert saved_state.conditional_headers(url) == {}
+        retried = pipeline.run(save_csv=False, generate_report=False, fetch=fetch)
+        repeated = pipeline.run(save_csv=False, generate_report=False, fetch=fetch)
+    finally:
+        server.shutdown()
+        pipeline.close()
+
+    assert failed == []
+    assert [r["link"] for r in retried] == ["http://example.com/1"]
+    assert repeated == []
+    assert pipeline.feed_state.get_stats()[url] == {"changed": 2, "not_modified": 1}
+    assert FeedStateStore(pipeline.feed_state.path).conditional_headers(url) == {
+        "If-None-Match": ETAG
+    }
@@ -0,0 +1,148 @@
+"""
+Tests for the inference backends, on a tiny stub model.
+"""
+
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import torch
+from transformers.modeling_outputs import SequenceClassifierOutput
+
+from src import inference_backends
+from src.inference_backends import BACKENDS, load_backend
+
+LABELS = {0: "positive", 1: "negative", 2: "neutral"}
+FEATURES = [
+    {"input_ids": [1, 5, 9], "attention_mask": [1, 1, 1]},
+    {"input_ids": [1, 7], "attention_mask": [1, 1]},
+]
+
+
+class StubTokenizer:
+    """Tokenizer padding with zeros, and encoding one id per word."""
+
+    def __call__(self, texts, return_tensors=None):
+        ids = [[1] + [len(word) for word in text.split()] for text in texts]
+        return {
+            "input_ids": torch.tensor(ids),
+            "attention_mask": torch.ones(len(ids), len(ids[0]), dtype=torch.long),
+        }
+
+    @staticmethod
+    def pad(features, return_tensors="pt"):
+        """Pad a batch to its longest input."""
+        width = max(len(f["input_ids"]) for f in features)
+        padded = {
+            key: np.array([f[key] + [0] * (width - len(f[key])) for f in features])
+            for key in ("input_ids", "attention_mask")
+        }
+        if return_tensors == "np":
+            return padded
+        return Encoded({key: torch.tensor(value) for key, value in padded.items()})
+
+
+class Encoded(dict):
+    """Padded tensors, movable to a device like a BatchEncoding."""
+
+    def to(self, device):
+        """Move every tensor to ``device``."""
+        return Encoded({key: value.to(device) for key, value in self.items()})
+
+
+class StubModel(torch.nn.Module):
+    """Masked mean of token embeddings through one linear layer."""
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embeddings = torch.nn.Embedding(16, 8)
+        self.classifier = torch.nn.Linear(8, 3)
+        self.config = SimpleNamespace(id2label=LABELS, _commit_hash="abc123")
+
+    def forward(self, input_ids, attention_mask):  # pylint: disable=arguments-differ
+        """Compute the logits of a padded batch."""
+        mask = attention_mask.unsqueeze(-1).float()
+        pooled = (self.embeddings(input_ids) * mask).sum(1) / mask.sum(1)
+        return SequenceClassifierOutput(logits=self.classifier(pooled))
+
+
+@pytest.fixture
+def stub_hub(monkeypatch, tmp_path):
+    """Serve the stub tokenizer and model instead of downloading FinBERT."""
+    loads = []
+
+    def tokenizer(model_name, revision):
+        loads.append((model_name, revision))
+        return StubTokenizer()
+
+    monkeypatch.setattr(
+        inference_backends.AutoTokenizer, "from_pretrained", staticmethod(tokenizer)
+    )
+    monkeypatch.setattr(
+        inference_backends.AutoModelForSequenceClassification,
+        "from_pretrained",
+        staticmethod(lambda model_name, revision: StubModel()),
+    )
+    monkeypatch.setattr(inference_backends, "ONNX_DIR", str(tmp_path / "onnx"))
+    return loads
+
+
+def test_load_backend_dispatches_by_name(monkeypatch):
+    """Test that each backend name maps to its class and gets the revision."""
+    assert {name: backend.__name__ for name, backend in BACKENDS.items()} == {
+        "pytorch": "TorchBackend",
+        "pytorch-int8": "QuantizedTorchBackend",
+        "onnx": "OnnxBackend",
+    }
+    monkeypatch.setitem(BACKENDS, "pytorch", lambda *args: args)
+    assert load_backend("pytorch", "finbert", "v2") == ("finbert", "v2")
+
+    with pytest.raises(ValueError, match="expected one of"):
+        load_backend("tensorrt", "finbert")
+
+
+def test_torch_backends_score_padded_batches(stub_hub):
+    """Test probabilities, the resolved revision and int8 quantization."""
+    backend = load_backend("pytorch", "finbert", "main")
+    quantized = load_backend("pytorch-int8", "finbert", "main")
+
+    assert stub_hub == [("finbert", "main")] * 2
+    assert backend.revision == "abc123"
+    assert backend.id2label == LABELS
+    probabilities = backend.predict_proba(FEATURES)
+    assert probabilities.shape == (2, 3)
+    assert np.allclose(probabilities.sum(axis=1), 1)
+    # Padding the shorter input must not change its scores
+    assert np.allclose(probabilities[1], backend.predict_proba(FEATURES[1:])[0])
+
+    assert quantized.device == "cpu"
+    assert not isinstance(quantized.model.classifier, torch.nn.Linear)
+    assert np.allclose(quantized.predict_proba(FEATURES), probabilities, atol=0.05)
+
+
+def test_onnx_backend_exports_once_and_matches_torch(monkeypatch, stub_hub, tmp_path):
+    """Test that the exported model is reused and scores like PyTorch."""
+    pytest.importorskip("onnxruntime")
+    expected = load_backend("pytorch", "finbert").predict_proba(FEATURES)
+
+    backend = load_backend("onnx", "finbert", "main")
+    assert backend.revision == "abc123"
+    assert np.allclose(backend.predict_proba(FEATURES), expected, atol=1e-5)
+    assert (tmp_path / "onnx" / "finbert_abc123" / "model.onnx").exists()
+
+    def export(*args):
+        raise AssertionError("the exported model must be reused")
+
+    monkeypatch.setattr(inference_backends.OnnxBackend, "_export", export)
+    reloaded = load_backend("onnx", "finbert", "main")
+    assert np.allclose(reloaded.predict_proba(FEATURES), expected, atol=1e-5)
+
+
+def test_onnx_backend_without_onnxruntime_fails_clearly(monkeypatch, stub_hub):
+    """Test that a missing onnxruntime is reported before any model load."""
+    monkeypatch.setitem(sys.modules, "onnxruntime", None)
+    with pytest.raises(ImportError, match="pip install onnxruntime"):
+        load_backend("onnx", "finbert")
+    assert stub_hub == []
@@ -0,0 +1,91 @@
+"""
+Tests for the pipeline instrumentation spans.
+"""
+
+import json
+import time
+from collections import deque
+
+import pytest
+
+from src.instrumentation import Profiler, load_profiles, profiler
+from src.text_processor import process_articles
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    """Test that spans are no-ops and no profile is written when disabled."""
+    profiler = Profiler(enabled=False, profile_dir=str(tmp_path))
+    profiler.begin_run()
+    with profiler.span("fetch") as span:
+        span.items = 3
+    assert profiler.finish_run() is None
+    assert profiler.recent_profiles() == []
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("memory", ["rss", "tracemalloc", None])
+def test_profiler_aggregates_spans_into_run_profile(tmp_path, memory):
+    """Test that spans are summed per stage and the profile is exported."""
+    profiler = Profiler(enabled=True, memory=memory, profile_dir=str(tmp_path))
+    profiler.begin_run("batch")
+    for _ in range(2):
+        with profiler.span("preprocess", 5):
+            data = [0] * 10_000
+            time.sleep(0.01)
+    with profiler.span("score") as span:
+        span.items = 4
+    profile = profiler.finish_run()
+    del data
+
+    stage = profile["stages"]["preprocess"]
+    assert stage["calls"] == 2
+    assert stage["items"] == 10
+    assert stage["wall_seconds"] >= 0.02
+    assert stage["items_per_second"] > 0
+    assert profile["stages"]["score"]["items"] == 4
+    if memory is None:
+        assert stage["memory_delta_bytes"] is None
+    else:
+        assert isinstance(stage["memory_delta_bytes"], int)
+    assert profile["label"] == "batch"
+    assert profiler.recent_profiles() == [profile]
+    assert load_profiles(str(tmp_path)) == [json.loads(json.dumps(profile))]
+
+
+def test_traced_decorator_times_each_call():
+    """Test that decorated functions are timed only while enabled."""
+    profiler = Profiler(enabled=False, profile_dir=None)
+
+    @profiler.traced("parse")
+    def parse(value):
+        return value * 2
+
+    assert parse(2) == 4
+    profiler.enabled = True
+    profiler.begin_run()
+    assert parse(3) == 6
+    assert parse(4) == 8
+    profile = profiler.finish_run()
+    assert profile["stages"]["parse"]["calls"] == 2
+
+
+def test_html_cleaning_is_timed_as_clean_stage(monkeypatch):
+    """Test that every summary cleaned in-process adds a clean span."""
+    monkeypatch.setattr(profiler, "enabled", True)
+    monkeypatch.setattr(profiler, "profile_dir", None)
+    monkeypatch.setattr(profiler, "history", deque(maxlen=1))
+    articles = [
+        {
+            "title": f"Company {i} reports quarterly earnings",
+            "summary": "<p>Revenue rose <b>strongly</b> as demand for the "
+            "company's products increased across all regions.</p>",
+            "link": f"https://example.com/{i}",
+            "source": "Example",
+        }
+        for i in range(3)
+    ]
+    profiler.begin_run()
+    processed = process_articles(articles, workers=1)
+    profile = profiler.finish_run()
+    assert len(processed) == 3
+    assert profile["stages"]["clean"]["calls"] == 3
@@ -0,0 +1,38 @@
+"""
+Tests for the lexicon sentiment scorer.
+"""
+
+from src.lexicon_scorer import LexiconScorer
+
+
+def test_lexicon_polarity():
+    """Test clear positive and negative texts get polar labels."""
+    results = LexiconScorer().score_texts(
+        [
+            "shares surge to record high as profits beat estimates",
+            "stocks plunge as recession fears deepen and losses mount",
+        ]
+    )
+    assert results[0]["label"] == "Positive"
+    assert results[1]["label"] == "Negative"
+    assert results[0]["score"] > 0.5
+
+
+def test_lexicon_negation_and_conflict():
+    """Test negations flip polarity and mixed signals have low confidence."""
+    scorer = LexiconScorer()
+    negated, conflicted = scorer.score_texts(
+        ["the company did not beat expectations", "gains offset by losses"]
+    )
+    assert negated["label"] == "Negative"
+    assert conflicted["score"] == 0.0
+
+
+def test_lexicon_neutral_confidence():
+    """Test market-wrap wording yields confident neutral labels."""
+    empty, wrap = LexiconScorer().score_texts(
+        ["", "nasdaq and dow jones end flat, mixed ahead of fed decision"]
+    )
+    assert empty == {"label": "Neutral", "score": 0.0}
+    assert wrap["label"] == "Neutral"
+    assert wrap["score"] > 0.7
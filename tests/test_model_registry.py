@@ -0,0 +1,56 @@
+"""
+Tests for the shared model registry.
+"""
+
+from src.model_registry import ModelRegistry, get_backend
+
+
+def test_registry_loads_once():
+    """Test a model is loaded lazily and shared between callers."""
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    registry.register("finbert", "pytorch", loader)
+    assert not registry.is_loaded("finbert", "pytorch")
+    assert calls == []
+
+    first = registry.get("finbert", "pytorch")
+    second = registry.get("finbert", "pytorch", loader)
+    assert first is second
+    assert calls == [1]
+
+
+def test_registry_warmup_and_stats():
+    """Test warmup loads every registered model and records load stats."""
+    registry = ModelRegistry()
+    registry.register("finbert", "pytorch", dict)
+    registry.register("finbert", "onnx", list)
+    assert all(entry["loaded_at"] is None for entry in registry.get_stats())
+
+    registry.warmup()
+    stats = registry.get_stats()
+    assert {(entry["model"], entry["backend"]) for entry in stats} == {
+        ("finbert", "pytorch"),
+        ("finbert", "onnx"),
+    }
+    assert all(entry["load_seconds"] >= 0 for entry in stats)
+
+
+def test_backends_are_shared_per_revision(monkeypatch):
+    """Test that analyzers pinned to different revisions get their own model."""
+    loaded = []
+
+    def load_backend(backend, model_name, revision):
+        loaded.append(revision)
+        return (backend, model_name, revision)
+
+    monkeypatch.setattr("src.inference_backends.load_backend", load_backend)
+    monkeypatch.setattr("src.model_registry.registry", ModelRegistry())
+    first = get_backend("finbert", "pytorch", "v1")
+    assert get_backend("finbert", "pytorch", "v1") is first
+    assert get_backend("finbert", "pytorch", "v2") == ("pytorch", "finbert", "v2")
+    assert loaded == ["v1", "v2"]
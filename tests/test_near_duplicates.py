@@ -0,0 +1,91 @@
+"""
+Tests for near-duplicate detection.
+"""
+
+from src.near_duplicates import NearDuplicateIndex, minhash_signature, similarity
+from src.pipeline import SentimentAnalysisPipeline
+
+STORY = (
+    "stocks rallied on wednesday after the federal reserve signaled it would "
+    "pause rate hikes, with the nasdaq closing at a record high as technology "
+    "shares led broad gains across the market and treasury yields fell"
+)
+
+
+def make_article(text, link):
+    """Build a processed article."""
+    return {"processed_text": text, "link": link}
+
+
+def test_signature_similarity_tracks_overlap():
+    """Test that small edits keep signatures similar and other stories apart."""
+    edited = STORY.replace("wednesday", "thursday") + " reuters"
+    unrelated = "oil prices plunged as opec members disagreed on output cuts"
+    signature = minhash_signature(STORY)
+    assert similarity(signature, minhash_signature(STORY.upper())) == 1.0
+    assert similarity(signature, minhash_signature(edited)) >= 0.7
+    assert similarity(signature, minhash_signature(unrelated)) < 0.2
+
+
+def test_assign_clusters_within_and_across_runs(tmp_path):
+    """Test clustering in one batch and reuse of sentiment in a later run."""
+    path = str(tmp_path / "fingerprints.sqlite3")
+    index = NearDuplicateIndex(path)
+    first = [
+        make_article(STORY, "http://a/1"),
+        make_article(STORY + " reuters", "http://b/1"),
+        make_article("oil prices plunged as opec members disagreed", "http://a/2"),
+    ]
+    canonical, duplicates = index.assign_clusters(first)
+    assert [a["link"] for a in canonical] == ["http://a/1", "http://a/2"]
+    assert duplicates[0]["duplicate_of"] == "http://a/1"
+    assert duplicates[0]["cluster_id"] == canonical[0]["cluster_id"]
+
+    for article in canonical:
+        article["sentiment"] = {"label": "Positive", "score": 0.9}
+    index.record_sentiment(canonical)
+    assert index.copy_sentiment(duplicates) == []
+    assert duplicates[0]["sentiment"] == {"label": "Positive", "score": 0.9}
+    index.close()
+
+    index = NearDuplicateIndex(path)
+    canonical, duplicates = index.assign_clusters([make_article(STORY, "http://c/1")])
+    assert canonical == []
+    assert index.copy_sentiment(duplicates) == []
+    assert len(index) == 2
+
+
+class CountingAnalyzer:
+    """Analyzer labelling everything positive and counting what it scores."""
+
+    def __init__(self):
+        self.scored = 0
+
+    def analyze_articles(self, articles):
+        for article in articles:
+            article["sentiment"] = {"label": "Positive", "score": 0.9}
+        self.scored += len(articles)
+        return articles
+
+
+def test_rerunning_a_batch_keeps_its_articles_canonical(tmp_path, monkeypatch):
+    """Test that articles already fingerprinted are not their own duplicates."""
+    monkeypatch.chdir(tmp_path)
+    pipeline = SentimentAnalysisPipeline(workers=1, incremental=False)
+    pipeline.near_duplicates = NearDuplicateIndex(str(tmp_path / "fp.sqlite3"))
+    pipeline.analyzer = CountingAnalyzer()
+
+    def batch():
+        return [
+            make_article(STORY, "http://a/1"),
+            make_article(STORY + " reuters", "http://b/1"),
+        ]
+
+    # pylint: disable=protected-access
+    for _ in range(2):
+        results, report_articles = pipeline._analyze(batch())
+        assert [a["link"] for a in report_articles] == ["http://a/1"]
+        assert [a["duplicate_of"] for a in results] == [None, "http://a/1"]
+    assert pipeline.analyzer.scored == 2
+    assert len(pipeline.near_duplicates) == 1
+    pipeline.close()
@@ -0,0 +1,94 @@
+"""
+Tests for sharded sentiment scoring, with the pool run in-process.
+"""
+
+import numpy as np
+
+from src import parallel_scoring
+from src.parallel_scoring import ShardedSentimentScorer
+from src.sentiment_analyzer import SentimentAnalyzer
+
+TEXTS = [
+    "Profits surged and revenue beat estimates on strong growth",
+    "The meeting is on Tuesday",
+    "Shares fell after the company missed forecasts and cut guidance",
+    "word alpha beta gamma delta epsilon",
+    "Quarterly filing published",
+    "Analysts expect the board to vote next week on the plan",
+    "Strong growth lifted profits",
+]
+
+
+class StubTokenizer:
+    """Word-level tokenizer: one id per word, plus a start token."""
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        ids = [[101] + [sum(map(ord, word)) % 997 for word in t.split()] for t in texts]
+        return {"input_ids": ids, "attention_mask": [[1] * len(i) for i in ids]}
+
+
+class StubBackend:
+    """Backend scoring each input from the sum and count of its token ids."""
+
+    id2label = {0: "positive", 1: "negative", 2: "neutral"}
+    revision = "stub"
+    tokenizer = StubTokenizer()
+
+    @staticmethod
+    def predict_proba(features):
+        """Score a batch without padding, one row per input."""
+        logits = np.array(
+            [
+                [sum(f["input_ids"]) % 7, sum(f["input_ids"]) % 5, len(f["input_ids"])]
+                for f in features
+            ]
+        )
+        exp = np.exp(logits / 2.0)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+class InProcessPool:
+    """Pool running the initializer once and every task in this process."""
+
+    def __init__(self, processes, initializer, initargs):
+        self.processes = processes
+        initializer(*initargs)
+
+    imap = staticmethod(map)
+
+    def close(self):
+        """Nothing to shut down."""
+
+    def join(self):
+        """Nothing to wait for."""
+
+
+def test_sharded_scoring_matches_in_process_scoring(monkeypatch):
+    """Test input order, results and the metrics summed over the shards."""
+    monkeypatch.setattr(
+        "src.sentiment_analyzer.get_backend", lambda *args: StubBackend()
+    )
+    monkeypatch.setattr(parallel_scoring, "set_num_threads", lambda threads: None)
+    monkeypatch.setattr(
+        parallel_scoring.multiprocessing,
+        "get_context",
+        lambda method: type("Context", (), {"Pool": InProcessPool}),
+    )
+    options = {"use_cache": False, "cascade_threshold": 0.5}
+    analyzer = SentimentAnalyzer(**options)
+    expected = analyzer.analyze_batch(TEXTS)
+
+    with ShardedSentimentScorer(2, 1, shard_size=3, **options) as scorer:
+        assert scorer.analyze_batch(TEXTS) == expected
+        cascade = scorer.get_cascade_stats()
+        metrics = scorer.get_batch_metrics()
+
+    reference = analyzer.get_cascade_stats()
+    assert cascade["texts"] == reference["texts"] == len(TEXTS)
+    assert cascade["escalated"] == reference["escalated"] == 4
+    assert cascade["escalation_rate"] == reference["escalation_rate"]
+    # The last shard is settled by the lexicon, the other two reach the
+    # model and together score what the analyzer scored in one call
+    assert metrics["batches"] == 2
+    for key in ("texts", "real_tokens"):
+        assert metrics[key] == analyzer.get_batch_metrics()[key]
@@ -0,0 +1,87 @@
+"""
+Tests for the pipeline daemon.
+"""
+
+import threading
+import time
+
+from src.pipeline_daemon import PipelineDaemon
+
+
+class FakeFetcher:
+    """Fetcher returning one article per call."""
+
+    def __init__(self):
+        self.closed = False
+
+    def fetch_all(self):
+        return [{"title": "Stocks rise"}]
+
+    def close(self):
+        self.closed = True
+
+
+class FakePipeline:
+    """Pipeline whose runs take a fixed time and never overlap."""
+
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.analyzer = object()
+        self.stage_seconds = {}
+        self.running = 0
+        self.max_running = 0
+        self.finished = 0
+
+    def run(self, save_csv=True, generate_report=True, fetch=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        articles = fetch()
+        time.sleep(self.duration)
+        self.stage_seconds = {"fetch": 0.0, "score": self.duration}
+        self.running -= 1
+        self.finished += 1
+        return articles
+
+
+def test_daemon_runs_cycles_and_records_metrics(tmp_path):
+    """Test that cycles run on schedule and metrics are exported."""
+    metrics_path = tmp_path / "metrics.json"
+    daemon = PipelineDaemon(
+        FakePipeline(), FakeFetcher(), interval=0.02, metrics_path=str(metrics_path)
+    )
+    daemon.run(max_cycles=3)
+    metrics = daemon.get_metrics()
+    assert metrics["cycles"] == 3
+    assert metrics["idle_seconds"] > 0
+    assert metrics["last_cycle"]["articles"] == 1
+    assert set(metrics["last_cycle"]["stages"]) == {"fetch", "score"}
+    assert metrics_path.exists()
+
+
+def test_daemon_coalesces_ticks_missed_by_long_cycles():
+    """Test that ticks due during a long cycle become one follow-up cycle."""
+    pipeline = FakePipeline(duration=0.1)
+    daemon = PipelineDaemon(pipeline, FakeFetcher(), interval=0.02, metrics_path=None)
+    daemon.run(max_cycles=2)
+    assert pipeline.max_running == 1
+    assert daemon.get_metrics()["coalesced_ticks"] >= 3
+    # The second cycle started right after the first, without idling
+    assert daemon.get_metrics()["last_cycle"]["idle_before"] < 0.05
+
+
+def test_daemon_trigger_and_graceful_stop():
+    """Test that trigger runs a cycle early and stop drains the running one."""
+    pipeline = FakePipeline(duration=0.1)
+    fetcher = FakeFetcher()
+    daemon = PipelineDaemon(pipeline, fetcher, interval=60, metrics_path=None)
+    thread = threading.Thread(target=daemon.run)
+    thread.start()
+    time.sleep(0.15)  # First cycle done, next one due in a minute
+    daemon.trigger()
+    time.sleep(0.05)  # Second cycle in flight
+    daemon.stop()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert pipeline.finished == 2
+    daemon.close()
+    assert fetcher.closed
@@ -0,0 +1,77 @@
+"""
+Tests for the persistent seen-article index.
+"""
+
+from src.feed_state import FeedStateStore
+from src.pipeline import SentimentAnalysisPipeline
+from src.seen_index import SeenIndex
+
+
+def make_article(title, link="", guid=""):
+    """Build a raw article as returned by the fetcher."""
+    return {"title": title, "summary": f"{title} summary", "link": link, "guid": guid}
+
+
+def test_filter_unseen_across_runs(tmp_path):
+    """Test that marked articles are filtered on the next run."""
+    path = str(tmp_path / "seen.sqlite3")
+    first_run = [make_article("A", "http://a"), make_article("B", "http://b")]
+    index = SeenIndex(path)
+    assert index.filter_unseen(first_run) == first_run
+    index.mark_seen(first_run)
+    index.close()
+
+    index = SeenIndex(path)
+    second_run = [make_article("A", "http://a"), make_article("C", "http://c")]
+    assert [a["title"] for a in index.filter_unseen(second_run)] == ["C"]
+
+
+def test_matches_on_guid_link_or_content(tmp_path):
+    """Test that any shared identity marks an article as seen."""
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"))
+    index.mark_seen([make_article("A", "http://a", guid="g1")])
+
+    candidates = [
+        make_article("Retitled", "http://other", guid="g1"),
+        make_article("Retitled again", "http://a"),
+        make_article("A", "http://moved"),
+        make_article("Fresh", "http://fresh", guid="g2"),
+        make_article("Fresh", "http://fresh", guid="g2"),
+    ]
+    assert [a["title"] for a in index.filter_unseen(candidates)] == ["Fresh"]
+
+
+def test_compaction_drops_expired_keys(tmp_path):
+    """Test that keys older than the TTL are removed."""
+    index = SeenIndex(str(tmp_path / "seen.sqlite3"), ttl_days=1)
+    index.mark_seen([make_article("A", "http://a")])
+    assert len(index) == 2
+
+    index.ttl_seconds = -1  # Everything is now past its TTL
+    assert index.compact() == 2
+    assert len(index) == 0
+    assert index.filter_unseen([make_article("A", "http://a")])
+
+
+def test_articles_dropped_by_preprocessing_are_marked_seen(monkeypatch, tmp_path):
+    """Test that a run left with nothing to score still records its work."""
+    monkeypatch.chdir(tmp_path)
+    pipeline = SentimentAnalysisPipeline(workers=1)
+    pipeline.near_duplicates = None
+    pipeline.checkpoints = None
+    pipeline.feed_state = FeedStateStore(str(tmp_path / "state.json"))
+    # Too short to survive preprocessing
+    articles = [dict(make_article("A", "http://a"), source="Test")]
+
+    def fetch():
+        pipeline.feed_state.stage("http://feed/rss", '"v1"', None, "hash")
+        return [dict(article) for article in articles]
+
+    try:
+        assert pipeline.run(save_csv=False, generate_report=False, fetch=fetch) == []
+        assert pipeline.seen_index.filter_unseen(articles) == []
+    finally:
+        pipeline.close()
+    assert FeedStateStore(str(tmp_path / "state.json")).conditional_headers(
+        "http://feed/rss"
+    ) == {"If-None-Match": '"v1"'}
@@ -0,0 +1,121 @@
+"""
+Tests for the sentiment analyzer module.
+"""
+
+import numpy as np
+
+from src.sentiment_analyzer import (
+    SentimentAnalyzer,
+    aggregate_windows,
+    plan_token_batches,
+)
+
+
+def test_plan_token_batches_fixed():
+    """Test fixed-size batches keep input order without a token budget."""
+    batches = plan_token_batches([5, 50, 7, 9, 60], 2, None)
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_plan_token_batches_budget():
+    """Test length bucketing respects the padded token budget."""
+    lengths = [100, 10, 12, 90, 11, 400]
+    batches = plan_token_batches(lengths, 8, 200)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(lengths)))
+    for batch in batches:
+        if len(batch) > 1:
+            assert len(batch) * max(lengths[i] for i in batch) <= 200
+    assert [1, 4, 2] in batches
+    assert [5] in batches
+
+
+def test_plan_token_batches_max_size():
+    """Test the batch size cap applies alongside the token budget."""
+    batches = plan_token_batches([10] * 5, 2, 10_000)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+WINDOWS = np.array([[0.7, 0.2, 0.1], [0.1, 0.3, 0.6]])
+
+
+def test_aggregate_windows_mean_and_length_weighted():
+    """Test mean and length-weighted aggregation of window probabilities."""
+    assert np.allclose(
+        aggregate_windows(WINDOWS, [512, 128], "mean"), [0.4, 0.25, 0.35]
+    )
+    weighted = aggregate_windows(WINDOWS, [300, 100], "length_weighted")
+    assert np.allclose(weighted, [0.55, 0.225, 0.225])
+
+
+def test_aggregate_windows_max_negative():
+    """Test that the most negative window decides, falling back to the mean."""
+    assert np.allclose(
+        aggregate_windows(WINDOWS, [1, 1], "max_negative", 2), WINDOWS[1]
+    )
+    assert np.allclose(
+        aggregate_windows(WINDOWS, [1, 1], "max_negative"), WINDOWS.mean(axis=0)
+    )
+
+
+class StubTokenizer:
+    """Word-level tokenizer: one id per word, plus a start token."""
+
+    def __call__(self, texts, truncation=True, max_length=512):
+        ids = [
+            ([101] + [sum(map(ord, word)) % 997 for word in text.split()])[:max_length]
+            for text in texts
+        ]
+        return {"input_ids": ids, "attention_mask": [[1] * len(i) for i in ids]}
+
+
+class StubBackend:
+    """Backend padding each batch and ignoring padding through the mask."""
+
+    id2label = {0: "positive", 1: "negative", 2: "neutral"}
+    revision = "stub"
+
+    def __init__(self):
+        self.tokenizer = StubTokenizer()
+        self.batches = []
+
+    def predict_proba(self, features):
+        """Score a padded batch from the masked token ids."""
+        self.batches.append(len(features))
+        width = max(len(f["input_ids"]) for f in features)
+        ids = np.array(
+            [f["input_ids"] + [0] * (width - len(f["input_ids"])) for f in features]
+        )
+        mask = np.array(
+            [
+                f["attention_mask"] + [0] * (width - len(f["attention_mask"]))
+                for f in features
+            ]
+        )
+        total = (ids * mask).sum(axis=1)
+        length = mask.sum(axis=1)
+        logits = np.stack([total % 7, total % 5, length % 4], axis=1) / 2.0
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+def test_batched_results_match_per_text_scoring(monkeypatch):
+    """Test that bucketed batches give per-text labels and scores in order."""
+    backend = StubBackend()
+    monkeypatch.setattr("src.sentiment_analyzer.get_backend", lambda *args: backend)
+    analyzer = SentimentAnalyzer(
+        batch_size=3, max_batch_tokens=40, use_cache=False, cascade_threshold=None
+    )
+    texts = [
+        " ".join(f"word{i}x{j}" for j in range(length))
+        for i, length in enumerate([30, 2, 15, 4, 28, 1, 9, 3, 22, 6])
+    ]
+    lengths = [len(ids) for ids in backend.tokenizer(texts)["input_ids"]]
+    batches = plan_token_batches(lengths, 3, 40)
+    # Buckets reorder the texts, so order is restored by the analyzer
+    assert len(batches) > 1
+    assert [i for batch in batches for i in batch] != list(range(len(texts)))
+
+    batched = analyzer.analyze_batch(texts)
+    assert analyzer.batch_metrics["batches"] == len(batches)
+    assert batched == [analyzer.analyze_text(text) for text in texts]
+    assert len({result["label"] for result in batched}) > 1
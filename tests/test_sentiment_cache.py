@@ -0,0 +1,53 @@
+"""
+Tests for the sentiment result cache.
+"""
+
+from src.sentiment_cache import SentimentCache
+
+
+def test_cache_hit_and_miss(tmp_path):
+    """Test lookups count memory hits and misses."""
+    cache = SentimentCache("model@rev", path=str(tmp_path / "cache.sqlite3"))
+    assert cache.get("stocks rally on earnings") is None
+    cache.put("stocks rally on earnings", {"label": "Positive", "score": 0.97})
+    assert cache.get("stocks  rally on earnings ") == {
+        "label": "Positive",
+        "score": 0.97,
+    }
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_cache_persists_per_model(tmp_path):
+    """Test results survive a restart and are scoped to the model namespace."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SentimentCache("model@rev", path=path)
+    cache.put_many(["oil prices plunge"], [{"label": "Negative", "score": 0.9}])
+    cache.close()
+
+    reopened = SentimentCache("model@rev", path=path)
+    assert reopened.get("oil prices plunge")["label"] == "Negative"
+    assert reopened.get_stats()["disk_hits"] == 1
+
+    other_model = SentimentCache("model@other", path=path)
+    assert other_model.get("oil prices plunge") is None
+
+
+def test_cache_is_size_bounded(tmp_path):
+    """Test both cache levels evict once they exceed their capacity."""
+    cache = SentimentCache(
+        "model@rev",
+        path=str(tmp_path / "cache.sqlite3"),
+        memory_entries=5,
+        disk_entries=20,
+    )
+    texts = [f"headline number {i}" for i in range(50)]
+    for text in texts:
+        cache.put(text, {"label": "Neutral", "score": 0.5})
+    stats = cache.get_stats()
+    assert stats["memory_size"] == 5
+    assert stats["disk_size"] <= 20
+    assert stats["evictions"] > 0
+    assert cache.get(texts[-1]) is not None
+    assert cache.get(texts[0]) is None
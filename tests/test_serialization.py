@@ -0,0 +1,76 @@
+"""
+Tests for the JSON serialization layer.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src import serialization
+from src.storage import DataStorage
+
+RECORDS = [
+    {"link": f"http://example.com/{i}", "title": "Café " * i, "score": i / 7}
+    for i in range(200)
+] + [123456789, "text", [], None]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with orjson, if installed, and with the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_output_is_compact_unless_pretty(backend):
+    """Test that nothing but the data is written by default."""
+    assert serialization.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'
+    assert serialization.dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+    assert serialization.loads(serialization.dumps_bytes(RECORDS)) == RECORDS
+
+
+def test_non_finite_floats_are_written_as_null(backend):
+    """Test that NaN and infinities give the same valid JSON on both paths."""
+    data = {"score": math.nan, "scores": [math.inf, -math.inf, 0.5]}
+    data["array"] = np.array([math.nan, 1.0])
+    assert serialization.dumps(data) == (
+        '{"score":null,"scores":[null,null,0.5],"array":[null,1.0]}'
+    )
+    assert serialization.loads(serialization.dumps(data, pretty=True)) == {
+        "score": None,
+        "scores": [None, None, 0.5],
+        "array": [None, 1.0],
+    }
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_iter_records_streams_arrays_and_json_lines(tmp_path, backend, pretty):
+    """Test that records split across any chunk boundary are parsed whole."""
+    array = tmp_path / "results.json"
+    serialization.dump(RECORDS, str(array), pretty)
+    lines = tmp_path / "results.jsonl"
+    lines.write_bytes(b"".join(serialization.dumps_line(r) for r in RECORDS))
+
+    for path in (array, lines):
+        for chunk_size in (5, 64, 1 << 16):
+            assert list(serialization.iter_records(str(path), chunk_size)) == RECORDS
+
+    array.write_text('[{"a": 1}, {"a"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(serialization.iter_records(str(array), 4))
+
+
+def test_data_storage_streams_the_results_file(tmp_path, monkeypatch):
+    """Test that results saved before the store existed can be streamed."""
+    monkeypatch.chdir(tmp_path)
+    storage = DataStorage(primary="articles")
+    records = [{"link": str(i), "timestamp": "2024-01-01T00:00:00"} for i in range(3)]
+    storage.save_to_json(records)
+    assert list(storage.iter_results()) == records
+
+    storage.save_results(records)
+    assert [r["link"] for r in storage.iter_results("2024-01-01")] == ["0", "1", "2"]
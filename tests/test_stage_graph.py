@@ -0,0 +1,77 @@
+"""
+Tests for the streaming stage graph.
+"""
+
+import threading
+import time
+
+from src.stage_graph import Stage, StageGraph
+
+
+def test_stage_graph_expands_filters_and_collects():
+    """Test that items are expanded, mapped, filtered and all collected."""
+    collected = []
+    lock = threading.Lock()
+
+    def collect(batch):
+        with lock:
+            collected.extend(batch)
+        return batch
+
+    graph = StageGraph(
+        [
+            Stage("expand", lambda batch: [range(n) for n in batch], 2, expand=True),
+            Stage("double", lambda batch: [2 * x for x in batch], 3, 4, 0.01),
+            Stage("odd", lambda batch: [x if x % 4 else None for x in batch], 1, 8),
+            Stage("collect", collect, 1, 16, 0.01),
+        ],
+        queue_size=4,
+    )
+    stats = graph.run([3, 5, 0, 4])
+    expected = [2 * x for n in (3, 5, 0, 4) for x in range(n) if (2 * x) % 4]
+    assert sorted(collected) == sorted(expected)
+    assert stats["completed"] == len(expected)
+    assert stats["stages"]["expand"]["out"] == 12
+    assert stats["stages"]["odd"]["in"] == 12
+    assert stats["latency"]["p95"] is not None
+
+
+def test_stage_graph_backpressure_bounds_in_flight_items():
+    """Test that a slow stage limits how far the source runs ahead."""
+    produced = []
+    consumed = []
+    in_flight = []
+
+    def source():
+        for i in range(200):
+            produced.append(i)
+            in_flight.append(len(produced) - len(consumed))
+            yield i
+
+    def slow(batch):
+        time.sleep(0.001)
+        consumed.extend(batch)
+        return batch
+
+    graph = StageGraph(
+        [Stage("pass", lambda batch: batch, 1, 2), Stage("slow", slow, 1, 2)],
+        queue_size=5,
+    )
+    graph.run(source())
+    assert len(consumed) == 200
+    # Two queues of five plus one batch held by each stage and the source
+    assert max(in_flight) <= 2 * 5 + 2 * 2 + 1
+
+
+def test_stage_graph_failed_batch_is_dropped():
+    """Test that a failing batch is counted and the stream carries on."""
+
+    def flaky(batch):
+        if 3 in batch:
+            raise ValueError("bad item")
+        return batch
+
+    graph = StageGraph([Stage("flaky", flaky, 1, 1)])
+    stats = graph.run(range(6))
+    assert stats["completed"] == 5
+    assert stats["stages"]["flaky"]["failed"] == 1
@@ -0,0 +1,98 @@
+"""
+Tests for the date-partitioned article store.
+"""
+
+import json
+import os
+
+from src.storage import COMPACTION_LOG, DataStorage, PartitionedStore
+
+
+def _records(date, count, start=0):
+    """Scored articles ingested on a date."""
+    return [
+        {
+            "link": f"http://example.com/{date}/{i}",
+            "timestamp": f"{date}T12:00:00",
+            "sentiment": {"label": "Positive", "score": 0.9},
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_append_partitions_by_date_and_reads_ranges(tmp_path):
+    """Test that appends never rewrite history and reads stay in range."""
+    store = PartitionedStore(str(tmp_path))
+    store.append(_records("2024-01-01", 2) + _records("2024-01-02", 1))
+    store.append(_records("2024-01-02", 2, start=1))
+    store.append(_records("2024-01-03", 1))
+
+    assert store.partitions() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    assert len(store.segments("2024-01-02")) == 2
+    day = store.read("2024-01-02", "2024-01-02")
+    assert [r["link"][-1] for r in day] == ["0", "1", "2"]
+    assert len(store.read(start="2024-01-02")) == 4
+    assert len(store.read()) == 6
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_compaction_merges_small_segments_in_order(tmp_path):
+    """Test that small segments are merged once enough have accumulated."""
+    store = PartitionedStore(str(tmp_path), compact_min_segments=3)
+    for i in range(2):
+        store.append(_records("2024-01-01", 1, start=i))
+    assert store.compact() == 0
+    store.append(_records("2024-01-01", 1, start=2))
+    assert store.compact() == 2
+    assert len(store.segments("2024-01-01")) == 1
+    assert [r["link"][-1] for r in store.read()] == ["0", "1", "2"]
+
+
+def test_interrupted_compaction_is_invisible_and_recovered(tmp_path):
+    """Test that readers skip merged inputs and the next writer cleans up."""
+    store = PartitionedStore(str(tmp_path), compact_min_segments=2)
+    for i in range(2):
+        store.append(_records("2024-01-01", 1, start=i))
+    directory = tmp_path / "date=2024-01-01"
+    inputs = sorted(os.listdir(directory))
+    # Crash after the merged segment was renamed into place
+    output = "part-00000000000000000001-1-000000000.jsonl"
+    with open(directory / output, "w", encoding="utf-8") as f:
+        for name in inputs:
+            f.write((directory / name).read_text(encoding="utf-8"))
+    (directory / COMPACTION_LOG).write_text(
+        json.dumps({"output": output, "inputs": inputs}), encoding="utf-8"
+    )
+
+    assert len(store.read()) == 2
+    store.compact()
+    assert sorted(os.listdir(directory)) == [output]
+    assert len(store.read()) == 2
+
+
+def test_data_storage_falls_back_to_results_file(tmp_path, monkeypatch):
+    """Test that results saved before the store existed are still served."""
+    monkeypatch.chdir(tmp_path)
+    storage = DataStorage(primary="articles")
+    storage.save_to_json(_records("2024-01-01", 2))
+    assert len(storage.load_results("2024-01-01", "2024-01-01")) == 2
+
+    assert storage.save_results(_records("2024-01-05", 3))
+    assert len(storage.load_results("2024-01-05", "2024-01-05")) == 3
+    assert storage.load_results("2024-01-01", "2024-01-01") == []
+
+
+def test_repository_is_the_only_store_written_by_default(tmp_path, monkeypatch):
+    """Test that the article store history is indexed and not written again."""
+    monkeypatch.chdir(tmp_path)
+    PartitionedStore("data/articles").append(_records("2024-01-01", 2))
+    storage = DataStorage()
+    assert storage.article_store is None
+    assert storage.repository.count() == 2
+
+    assert storage.save_results(_records("2024-01-05", 3))
+    assert len(storage.load_results("2024-01-05", "2024-01-05")) == 3
+    assert [r["link"][-1] for r in storage.iter_results()] == ["0", "1", "0", "1", "2"]
+    assert os.listdir("data/articles") == ["date=2024-01-01"]
+    assert not os.path.exists("data/sentiment_results.json")
+    storage.close()
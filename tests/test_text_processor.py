@@ -3,9 +3,26 @@ Tests for the text processor module.
 """
 
 import pytest
-from src.text_processor import clean_html, preprocess_text, process_article
+from src import text_processor
+from src.html_extraction import BACKENDS, get_extractor, is_available
+from src.text_processor import (
+    clean_html,
+    normalize_financial_terms,
+    preprocess_text,
+    process_article,
+    process_articles,
+    remove_noise,
+)
 
-def test_clean_html():
+@pytest.fixture(params=sorted(BACKENDS) + ["auto"])
+def html_backend(request, monkeypatch):
+    """Run a test once per installed HTML extraction backend."""
+    if request.param != "auto" and not is_available(request.param):
+        pytest.skip(f"{request.param} is not installed")
+    monkeypatch.setattr(text_processor, "_extract_text", get_extractor(request.param))
+    return request.param
+
+def test_clean_html(html_backend):
     """Test HTML cleaning functionality."""
     html = """
     <div class="article">
@@ -31,7 +48,18 @@ def test_preprocess_text():
     assert "https://example.com" not in processed
     assert len(processed) > 0
 
-def test_process_article():
+def test_clean_html_backends_agree(html_backend):
+    """Test that every backend matches the BeautifulSoup reference output."""
+    samples = [
+        "<p>Shares &amp; bonds<!-- tracking --> rose <b>5%</b></p>tail",
+        "<div><nav>Menu</nav><p>Oil  fell\n sharply</p><footer>Footer</footer></div>",
+        "Plain text &lt;not a tag&gt; with entities",
+        "",
+    ]
+    for sample in samples:
+        assert clean_html(sample) == BACKENDS["bs4"](sample)
+
+def test_process_article(html_backend):
     """Test article processing functionality."""
     article = {
         'title': 'Test Article',
@@ -54,4 +82,61 @@ def test_process_article_invalid():
         'summary': ''
     }
     processed = process_article(invalid_article)
-    assert processed is None 
\ No newline at end of file
+    assert processed is None
+
+def test_normalize_financial_terms():
+    """Test single-pass financial term normalization on word boundaries."""
+    text = "the fed and ecb weigh on usd while s&p futures and fedex slip"
+    normalized = normalize_financial_terms(text)
+    assert "Federal Reserve" in normalized
+    assert "European Central Bank" in normalized
+    assert "USD" in normalized
+    assert "S&P" in normalized
+    assert "fedex" in normalized
+
+def test_remove_noise():
+    """Test removal of boilerplate phrases, including their punctuation."""
+    text = "Stocks rose. Follow us on Twitter. Disclaimer: not advice. Copyright © 2024"
+    cleaned = remove_noise(text)
+    assert "twitter" not in cleaned.lower()
+    assert "disclaimer" not in cleaned.lower()
+    assert "copyright" not in cleaned.lower()
+    assert "Stocks rose." in cleaned
+
+def test_preprocess_text_normalizes_terms_and_noise():
+    """Test that preprocessing applies noise removal and term normalization."""
+    text = "Nasdaq and the Fed rally as investors cheer. All rights reserved. Contact press@example.com"
+    processed = preprocess_text(text)
+    assert processed == "NASDAQ and the Federal Reserve rally as investors cheer. . contact"
+
+def _batch(count):
+    """Articles whose every third summary is too short to keep."""
+    return [
+        {
+            "title": f"Article {i}",
+            "summary": (
+                "Short" if i % 3 == 0 else f"<p>{'Stocks rallied today. ' * 4}</p>"
+            ),
+            "link": f"http://example.com/{i}",
+            "source": "Test Source",
+        }
+        for i in range(count)
+    ]
+
+def test_process_articles_in_process():
+    """Test that small batches keep input order and drop failed articles."""
+    processed = process_articles(_batch(9), workers=4)
+    assert [a["title"] for a in processed] == [
+        f"Article {i}" for i in range(9) if i % 3
+    ]
+    assert all("processed_text" in a for a in processed)
+
+def test_process_articles_pool_matches_in_process(monkeypatch):
+    """Test that the process pool returns the in-process results in order."""
+    monkeypatch.setitem(text_processor.PREPROCESSING, "min_parallel_batch", 0)
+    expected = process_articles(_batch(30), workers=1)
+    processed = process_articles(_batch(30), workers=2, chunksize=4)
+    assert [a["processed_text"] for a in processed] == [
+        a["processed_text"] for a in expected
+    ]
+    assert [a["link"] for a in processed] == [a["link"] for a in expected]